@@ -0,0 +1,273 @@
+"""
+Benchmark suite for the chromosome operations and end-to-end GA scaling.
+
+Runs offline with no extra dependencies (the numpy and mmap backends are included
+when numpy is installed). Results are written as JSON, and can be compared against a previous run:
+
+    poetry run python benchmarks/run_benchmarks.py --output baseline.json
+    poetry run python benchmarks/run_benchmarks.py --output new.json --baseline baseline.json
+"""
+
+import argparse
+import importlib.util
+import json
+import logging
+import platform
+import random
+import sys
+import time
+import timeit
+import tracemalloc
+from datetime import datetime, timezone
+
+from one_max_ga.algorithm import GeneticAlgorithm
+from one_max_ga.chromosome import OneMaxChromosome, PackedOneMaxChromosome
+from one_max_ga.population import Population
+
+CHROMOSOME_LENGTHS = [100, 10_000]
+POPULATION_SIZE = 1_000
+
+GRID_POP_SIZES = [100, 1_000]
+GRID_CHROMOSOME_LENGTHS = [100, 1_000]
+GRID_GENERATIONS = 10
+
+QUICK_GRID_POP_SIZES = [100]
+QUICK_GRID_CHROMOSOME_LENGTHS = [100]
+QUICK_GRID_GENERATIONS = 3
+
+
+def time_per_call(fn, setup=None, repeat: int = 5, min_time: float = 0.02) -> float:
+    """
+    Return the best time per call of `fn` in seconds, over `repeat` timed batches.
+
+    Each batch runs for roughly `min_time` seconds. `setup`, if given, is called before
+    each batch and its result is passed to `fn`, so operations that change their input
+    (e.g. mutation) start each batch from the same state.
+    """
+    if setup is None:
+        timer = timeit.Timer(fn)
+    else:
+        state = {}
+        timer = timeit.Timer(
+            lambda: fn(state["value"]), setup=lambda: state.update(value=setup())
+        )
+
+    # calibrate the batch size from a single call
+    once = timer.timeit(number=1)
+    number = max(1, int(min_time / max(once, 1e-9)))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def chromosome_benchmarks(lengths: list[int]) -> dict[str, float]:
+    """Micro-benchmark every chromosome operation for both representations."""
+    results = {}
+    for cls in [OneMaxChromosome, PackedOneMaxChromosome]:
+        for length in lengths:
+            prefix = f"{cls.__name__}[{length}]"
+            a = cls(length=length)
+            b = cls(length=length)
+
+            results[f"{prefix}.init"] = time_per_call(lambda: cls(length=length))
+            results[f"{prefix}.crossover"] = time_per_call(lambda: a.crossover(b))
+            results[f"{prefix}.direct"] = time_per_call(a.direct)
+            for method in ["dense", "sparse"]:
+                results[f"{prefix}.mutate[{method},0.001]"] = time_per_call(
+                    lambda c: c.mutate(0.001, method=method), setup=a.direct
+                )
+            results[f"{prefix}.fitness"] = time_per_call(lambda: _uncached_fitness(a))
+            results[f"{prefix}.fitness[cached]"] = time_per_call(a.fitness)
+            results[f"{prefix}.to_bytes"] = time_per_call(a.to_bytes)
+
+    return results
+
+
+def _uncached_fitness(chromosome) -> int:
+    # reassigning the genes clears the fitness cached by OneMaxChromosome
+    if isinstance(chromosome, OneMaxChromosome):
+        chromosome.genes = chromosome.genes
+    return chromosome.fitness()
+
+
+def population_benchmarks(size: int, lengths: list[int]) -> dict[str, float]:
+    """Micro-benchmark every population operation."""
+    results = {}
+    for length in lengths:
+        prefix = f"Population[{size}x{length}]"
+        population = Population(size, length)
+        population.fitness()
+        chromosomes = population.chromosomes
+
+        results[f"{prefix}.init"] = time_per_call(
+            lambda: Population(size, length), repeat=3
+        )
+        results[f"{prefix}.from_chromosomes"] = time_per_call(
+            lambda: Population.from_chromosomes(chromosomes)
+        )
+        results[f"{prefix}.slice"] = time_per_call(lambda: population[: size // 5])
+        results[f"{prefix}.fittest"] = time_per_call(
+            lambda: population.fittest(size // 5)
+        )
+        results[f"{prefix}.best"] = time_per_call(population.best)
+        results[f"{prefix}.sort_by_fitness"] = time_per_call(population.sort_by_fitness)
+        results[f"{prefix}.random[k=2]"] = time_per_call(lambda: population.random(k=2))
+
+    return results
+
+
+def ga_benchmarks(
+    backends: list[str], pop_sizes: list[int], lengths: list[int], generations: int
+) -> list[dict]:
+    """Measure `GeneticAlgorithm.run` throughput and peak memory across a grid."""
+    results = []
+    for backend in backends:
+        # warm up, so one-off costs such as importing numpy are not timed
+        GeneticAlgorithm(10, 10, 0.7, 0.001, max_generations=1, backend=backend).run()
+
+        for pop_size in pop_sizes:
+            for length in lengths:
+                kwargs = dict(
+                    pop_size=pop_size,
+                    chromosome_length=length,
+                    crossover_rate=0.7,
+                    mutation_rate=0.001,
+                    max_generations=generations,
+                    backend=backend,
+                )
+
+                random.seed(0)
+                started = time.perf_counter()
+                result = GeneticAlgorithm(**kwargs).run()
+                elapsed = time.perf_counter() - started
+
+                # tracing slows the run down, so memory is measured in a separate run
+                random.seed(0)
+                tracemalloc.start()
+                GeneticAlgorithm(**kwargs).run()
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                results.append(
+                    {
+                        "backend": backend,
+                        "pop_size": pop_size,
+                        "chromosome_length": length,
+                        "generations": result.generations,
+                        "seconds": elapsed,
+                        "generations_per_second": result.generations / elapsed,
+                        "evaluations_per_second": result.evaluations / elapsed,
+                        "peak_memory_bytes": peak,
+                    }
+                )
+                print(
+                    f"  run[{backend}, {pop_size}x{length}]: "
+                    f"{results[-1]['generations_per_second']:.2f} generations/s, "
+                    f"{peak / 2**20:.1f} MiB peak",
+                    file=sys.stderr,
+                )
+
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Compare timings against a baseline run.
+
+    Returns a line per benchmark present in both runs, flagging those more than
+    `threshold` (e.g. 0.1 for 10%) slower than the baseline.
+    """
+    lines = []
+
+    for name, seconds in results["operations"].items():
+        if name in baseline.get("operations", {}):
+            ratio = seconds / baseline["operations"][name]
+            flag = "  REGRESSION" if ratio > 1 + threshold else ""
+            lines.append(f"{name}: {ratio:.2f}x baseline time{flag}")
+
+    def key(run):
+        return run["backend"], run["pop_size"], run["chromosome_length"]
+
+    baseline_runs = {key(run): run for run in baseline.get("runs", [])}
+    for run in results["runs"]:
+        if key(run) in baseline_runs:
+            ratio = (
+                baseline_runs[key(run)]["generations_per_second"]
+                / run["generations_per_second"]
+            )
+            flag = "  REGRESSION" if ratio > 1 + threshold else ""
+            lines.append(f"run{list(key(run))}: {ratio:.2f}x baseline time{flag}")
+
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--output", default="bench_results.json", help="JSON results file to write."
+    )
+    parser.add_argument(
+        "--baseline", help="JSON results of a previous run to compare against."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative slowdown reported as a regression. Default is 0.1 (10%%).",
+    )
+    parser.add_argument("--quick", action="store_true", help="Run a reduced grid.")
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=None,
+        help="Population backends for the GA runs. Default is every available backend.",
+    )
+    args = parser.parse_args(argv)
+
+    # the GA logs every generation, which would dominate the timings
+    logging.disable(logging.INFO)
+
+    backends = args.backends or ["list", "packed"] + (
+        ["numpy", "mmap"] if importlib.util.find_spec("numpy") else []
+    )
+    lengths = CHROMOSOME_LENGTHS[:1] if args.quick else CHROMOSOME_LENGTHS
+
+    print("Benchmarking chromosome operations...", file=sys.stderr)
+    operations = chromosome_benchmarks(lengths)
+    print("Benchmarking population operations...", file=sys.stderr)
+    pop_size = POPULATION_SIZE // 10 if args.quick else POPULATION_SIZE
+    operations.update(population_benchmarks(pop_size, lengths))
+    print("Benchmarking GeneticAlgorithm.run...", file=sys.stderr)
+    runs = ga_benchmarks(
+        backends,
+        QUICK_GRID_POP_SIZES if args.quick else GRID_POP_SIZES,
+        QUICK_GRID_CHROMOSOME_LENGTHS if args.quick else GRID_CHROMOSOME_LENGTHS,
+        QUICK_GRID_GENERATIONS if args.quick else GRID_GENERATIONS,
+    )
+
+    results = {
+        "metadata": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version,
+            "platform": platform.platform(),
+            "quick": args.quick,
+        },
+        "operations": operations,
+        "runs": runs,
+    }
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        lines = compare(results, baseline, args.threshold)
+        print("\n".join(lines))
+        if any(line.endswith("REGRESSION") for line in lines):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,29 @@
+from one_max_ga.sweep import ParameterSweep, format_table, summarise
+import logging
+
+if __name__ == "__main__":
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    # the per-generation logs of every run would drown out the sweep's progress
+    logging.getLogger("GeneticAlgorithm").setLevel(logging.WARNING)
+
+    sweep = ParameterSweep(
+        grid={
+            "crossover_rate": [0.5, 0.7, 0.9],
+            "mutation_rate": [0.001, 0.01, 0.05],
+            "selection_rate": [0.1, 0.2],
+            "pop_size": [50, 100],
+        },
+        repeats=5,
+        # re-running the script skips the runs already saved here
+        results_path="sweep_results.jsonl",
+        chromosome_length=50,
+        max_generations=100,
+    )
+
+    results = sweep.run()
+    print(format_table(summarise(results)))
@@ -1 +1,22 @@
-from .algorithm import GeneticAlgorithm
+import importlib
+
+# the module of each public name, imported on first use so that importing the
+# package, e.g. to start the command-line interface, stays fast
+_EXPORTS = {
+    "GeneticAlgorithm": "algorithm",
+    "OneMaxChromosome": "chromosome",
+    "PackedOneMaxChromosome": "chromosome",
+    "IslandModel": "islands",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+
+
+def __dir__():
+    return sorted([*globals(), *_EXPORTS])
@@ -0,0 +1,5 @@
+import sys
+
+from one_max_ga.cli import main
+
+sys.exit(main())
@@ -1,7 +1,45 @@
+import bisect
+import inspect
 import logging
+import os
 import random
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Literal
+from one_max_ga.checkpoint import load_checkpoint, save_checkpoint
+from one_max_ga.chromosome import OneMaxChromosome, PackedOneMaxChromosome
+from one_max_ga.evaluation import (
+    AsyncEvaluator,
+    AsyncFunctionEvaluator,
+    CachedEvaluator,
+    Evaluator,
+    FunctionEvaluator,
+)
+from one_max_ga.history import HistoryRecorder
+from one_max_ga.instrumentation import (
+    PROFILE_MODES,
+    GenerationMetrics,
+    Hook,
+    Profiler,
+)
 from one_max_ga.population import Population
-from one_max_ga.terminators import Terminator, MaxGenerationsTerminator
+from one_max_ga.rng import make_rng, numpy_rng
+from one_max_ga.selection import Selector, TruncationSelector
+from one_max_ga.stats import GenerationStats, RunResult
+from one_max_ga.terminators import (
+    Terminator,
+    MaxGenerationsTerminator,
+    check_terminator,
+)
+
+# chromosome representation used by each population backend
+# the "numpy" backend stores the whole population as a single matrix instead
+BACKENDS = {
+    "list": OneMaxChromosome,
+    "packed": PackedOneMaxChromosome,
+    "numpy": None,
+    "mmap": None,
+}
 
 
 class GeneticAlgorithm:
@@ -15,6 +53,24 @@ class GeneticAlgorithm:
         selection_rate: float = 0.2,
         max_generations: int = 100,
         terminator: Terminator = None,
+        backend: Literal["list", "packed", "numpy", "mmap"] = "list",
+        crossover_method: Literal["uniform", "single", "two"] = "uniform",
+        fitness: Callable[[object], float] | Evaluator | AsyncEvaluator | None = None,
+        checkpoint_path: str | os.PathLike | None = None,
+        checkpoint_interval: int = 10,
+        hooks: list[Hook] | None = None,
+        profile: Literal["cprofile", "tracemalloc"] | None = None,
+        rng: int | random.Random | None = None,
+        double_buffer: bool = False,
+        log_interval: int = 1,
+        fitness_cache: int | None = None,
+        elitism: int = 0,
+        replacement: Literal["generational", "steady_state"] = "generational",
+        offspring: int = 2,
+        optimum: float | None = None,
+        selection: Selector | None = None,
+        recorder: HistoryRecorder | None = None,
+        storage_dir: str | os.PathLike | None = None,
     ):
 
         # validate rates
@@ -25,71 +81,825 @@ class GeneticAlgorithm:
         if not (0 <= selection_rate <= 1):
             raise ValueError(f"'selection_rate' must be between 0 and 1")
 
+        # validate backend
+        if backend not in BACKENDS:
+            raise ValueError(f"'backend' must be one of {list(BACKENDS)}")
+
+        if crossover_method not in ["uniform", "single", "two"]:
+            raise ValueError(
+                "'crossover_method' must be one of ['uniform', 'single', 'two']"
+            )
+
+        if not isinstance(checkpoint_interval, int) or checkpoint_interval <= 0:
+            raise ValueError("'checkpoint_interval' must be a positive integer.")
+
+        if not isinstance(log_interval, int) or log_interval <= 0:
+            raise ValueError("'log_interval' must be a positive integer.")
+
+        if profile is not None and profile not in PROFILE_MODES:
+            raise ValueError(f"'profile' must be one of {PROFILE_MODES}")
+
+        if not isinstance(elitism, int) or not (0 <= elitism < pop_size):
+            raise ValueError("'elitism' must be an integer in [0, pop_size).")
+
+        if replacement not in ["generational", "steady_state"]:
+            raise ValueError(
+                "'replacement' must be one of ['generational', 'steady_state']"
+            )
+        if replacement == "steady_state":
+            if backend in ["numpy", "mmap"]:
+                raise ValueError(
+                    "'steady_state' replacement requires the 'list' or 'packed' backend."
+                )
+            if elitism:
+                raise ValueError("'elitism' only applies to generational replacement.")
+            if not isinstance(offspring, int) or not (1 <= offspring <= pop_size):
+                raise ValueError("'offspring' must be an integer in [1, pop_size].")
+
+        if fitness_cache is not None:
+            if not isinstance(fitness_cache, int) or fitness_cache <= 0:
+                raise ValueError("'fitness_cache' must be a positive integer.")
+            if (
+                fitness is None
+                or isinstance(fitness, AsyncEvaluator)
+                or inspect.iscoroutinefunction(fitness)
+            ):
+                raise ValueError(
+                    "'fitness_cache' requires a custom, synchronous 'fitness'."
+                )
+
         self.pop_size = pop_size
         self.chromosome_length = chromosome_length
         self.crossover_rate = crossover_rate
         self.mutation_rate = mutation_rate
         self.selection_rate = selection_rate
+        # picks the parents of each generation, by default uniformly from the top
+        # selection_rate of the population
+        self.selection = selection or TruncationSelector(selection_rate)
         self.max_generations = max_generations
         # default to terminating at max_generations
         self.terminator = terminator or MaxGenerationsTerminator(max_generations)
+        self.backend = backend
+        # 'single' and 'two' point crossover copy whole segments, so they cost one
+        # random draw per cut point rather than one random bit per gene
+        self.crossover_method = crossover_method
+        # custom fitness to maximise instead of the number of '1's, either a function
+        # taking a chromosome or an Evaluator (e.g. BatchEvaluator, PoolEvaluator)
+        # async functions and AsyncEvaluators require arun()
+        # None keeps the built-in One-Max fitness and its fast paths
+        if fitness is None or isinstance(fitness, (Evaluator, AsyncEvaluator)):
+            self.evaluator = fitness
+        elif inspect.iscoroutinefunction(fitness):
+            self.evaluator = AsyncFunctionEvaluator(fitness)
+        else:
+            self.evaluator = FunctionEvaluator(fitness)
+        # reuse the scores of the last fitness_cache distinct genomes, see
+        # CachedEvaluator, for expensive fitness on converging populations
+        if fitness_cache is not None:
+            self.evaluator = CachedEvaluator(self.evaluator, maxsize=fitness_cache)
+        # snapshot the run every checkpoint_interval generations, see resume()
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        # callables receiving the GenerationMetrics of every generation
+        # per-phase timing is skipped entirely when there are none
+        self.hooks = list(hooks or [])
+        # capture a whole run with cProfile or tracemalloc, see RunResult.profile
+        self.profile = profile
+        self._profiler = None
+        self.profile_result = None
+        # every random draw of the run comes from this generator, see one_max_ga.rng
+        # an int seeds a new independent stream, None keeps the shared random module
+        # so random.seed() still controls the run
+        self.rng = random if rng is None else make_rng(rng)
+        # write each generation into the storage of the one before last instead of
+        # allocating new chromosomes, so a population is overwritten two generations
+        # after it was current
+        self.double_buffer = double_buffer
+        self._spare = None
+        # log progress every log_interval generations
+        self.log_interval = log_interval
+        # copy the fittest members unchanged into each new generation
+        self.elitism = elitism
+        # 'steady_state' breeds only `offspring` children per step, which replace the
+        # least fit members, instead of a whole new generation
+        # each step still counts as one generation
+        self.replacement = replacement
+        self.offspring = offspring
+        # the population's fitness in ascending order, parallel to its chromosomes,
+        # kept up to date by steady-state replacement instead of re-sorting
+        self._ranked = None
+        # the fitness of an optimal chromosome, for RunResult.evaluations_to_optimum
+        # the built-in One-Max optimum is all '1's
+        if optimum is None and fitness is None:
+            optimum = chromosome_length
+        self.optimum = optimum
+        # streams every generation's genomes and fitness to disk, see load_history()
+        self.recorder = recorder
+        # where the 'mmap' backend keeps its genome files, see MappedPopulation
+        self.storage_dir = storage_dir
 
         self.generation = 0
+        self.population = None
+        # fitness evaluations and best-of-run for the current run
+        self.evaluations = 0
+        self.evaluations_to_optimum = None
+        self.best = None
+        self.best_fitness = None
 
         # attatch logger
         self.logger = logging.getLogger(self.__class__.__name__)
 
-    def run(self):
-        """"""
+    def run(self, population=None) -> RunResult:
+        """
+        Run the algorithm until it terminates.
+
+        Parameters
+        ----------
+        population : Population or ArrayPopulation, optional
+            The initial population, matching the configured backend. Default is a new
+            random population.
+
+        Returns
+        -------
+        RunResult
+            The best chromosome of the run and summary statistics. The final population
+            is kept in `self.population`.
+        """
+        return self._result(list(self.iter_generations(population)))
+
+    def iter_generations(self, population=None) -> Iterator[GenerationStats]:
+        """
+        Run the algorithm lazily, yielding a record for each generation.
+
+        The first record describes the initial population (generation 0). Stopping
+        iteration early simply stops the run, leaving the latest population in
+        `self.population`.
+
+        Parameters
+        ----------
+        population : Population or ArrayPopulation, optional
+            The initial population, see `run()`.
+
+        Yields
+        ------
+        GenerationStats
+            The fitness summary and timing of each generation.
+        """
         self.generation = 0
+        self._start_run()
 
         # generate initial population
-        population = Population(self.pop_size, self.chromosome_length)
+        if population is None:
+            population = self._create_population()
 
-        # either terminate at max_generations or when the given Terminator dictates so.
-        while (self.generation < self.max_generations) and (
-            not self.terminator.terminate(
-                population=population, generation=self.generation
-            )
-        ):
-            self.logger.info(f"Running generation {self.generation + 1}")
+        yield from self._evolve(population)
+
+    def step(self) -> GenerationStats:
+        """
+        Breed and evaluate a single generation from `self.population`.
+
+        A random initial population is created and evaluated first if there is none.
+
+        Returns
+        -------
+        GenerationStats
+            The record of the new generation.
+        """
+        self._check_sync()
+        if self.population is None:
+            self.generation = 0
+            self._start_run()
+            started = time.perf_counter()
+            metrics = GenerationMetrics(0) if self.hooks else None
+            return self._evaluate(self._create_population(), started, metrics)
+
+        started = time.perf_counter()
+        metrics = GenerationMetrics(self.generation + 1) if self.hooks else None
+        population = self._breed_next(metrics)
+        tick = time.perf_counter()
+        if self.evaluator is not None:
+            population.evaluate(self.evaluator)
+        return self._commit(population, started, metrics, tick)
+
+    async def arun(self, population=None) -> RunResult:
+        """
+        Run the algorithm until it terminates, awaiting an async fitness evaluator.
+
+        Control returns to the event loop between generations and while the fitness of
+        a generation is awaited, so other tasks keep running. Synchronous evaluators
+        and the built-in fitness are also supported.
+
+        Parameters
+        ----------
+        population : Population or ArrayPopulation, optional
+            The initial population, see `run()`.
+
+        Returns
+        -------
+        RunResult
+            The best chromosome of the run and summary statistics.
+        """
+        history = [stats async for stats in self.aiter_generations(population)]
+        return self._result(history)
+
+    async def aiter_generations(
+        self, population=None
+    ) -> AsyncIterator[GenerationStats]:
+        """
+        Run the algorithm as an async generator, yielding a record for each generation.
+
+        See `iter_generations()`. Cancelling the consuming task stops the run. A
+        generation only becomes current once all of its fitness has been awaited, so
+        `self.population` and `self.generation` always describe the latest complete
+        generation.
+
+        Parameters
+        ----------
+        population : Population or ArrayPopulation, optional
+            The initial population, see `run()`.
+
+        Yields
+        ------
+        GenerationStats
+            The fitness summary and timing of each generation.
+        """
+        self.generation = 0
+        self._start_run()
+
+        # generate initial population
+        if population is None:
+            population = self._create_population()
+
+        async for stats in self._aevolve(population):
+            yield stats
+
+    async def astep(self) -> GenerationStats:
+        """
+        Breed a single generation from `self.population` and await its fitness.
 
-            population.sort_by_fitness()
+        See `step()`. If cancelled while the fitness is awaited, the new generation is
+        discarded and the algorithm is left at the previous one.
+
+        Returns
+        -------
+        GenerationStats
+            The record of the new generation.
+        """
+        if self.population is None:
+            self.generation = 0
+            self._start_run()
+            started = time.perf_counter()
+            metrics = GenerationMetrics(0) if self.hooks else None
+            return await self._aevaluate(self._create_population(), started, metrics)
+
+        started = time.perf_counter()
+        metrics = GenerationMetrics(self.generation + 1) if self.hooks else None
+        population = self._breed_next(metrics)
+        tick = time.perf_counter()
+        await self._ascore(population)
+        return self._commit(population, started, metrics, tick)
+
+    def _commit(
+        self,
+        bred,
+        started: float,
+        metrics: GenerationMetrics | None,
+        tick: float,
+    ) -> GenerationStats:
+        """Make scored, newly bred chromosomes the next generation."""
+        if self.replacement == "steady_state":
+            population = self._replace_worst(bred)
+        else:
+            population = bred
+        self._advance(population)
+        return self._record(population, started, metrics, tick, evaluated=len(bred))
+
+    def _breed_next(self, metrics: GenerationMetrics | None):
+        """
+        Select parents from `self.population` and breed the next generation.
+
+        In steady-state replacement only the `offspring` children are returned.
+        """
+        # the best member is only found, and its summary formatted, when it is logged
+        logged = (self.generation + 1) % self.log_interval == 0
+        if logged and self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Running generation %d", self.generation + 1)
 
             # log best member of the population
-            self.logger.info(f"Best member: {population.best()}")
+            self.logger.info("Best member: %r", self.population.best())
+
+        size = self.offspring if self.replacement == "steady_state" else self.pop_size
+        # copied from the current population before its storage can be reused
+        elites = self.population.fittest(self.elitism) if self.elitism else None
+        # storage for the children, reused from the previous generation's parents
+        out = self._take_spare(size)
 
-            # use selection_rate to determine top N% of chromosomes that will be used to breed the next generation
-            # ensure the rounded int is in the range [2, pop_size]
-            top_n_chromosomes = max(
-                2, min(self.pop_size, round(self.pop_size * self.selection_rate))
+        # the array backends breed the whole generation in vectorised passes
+        if self.backend in ["numpy", "mmap"]:
+            tick = time.perf_counter()
+            rng = self.population.rng
+            parents = self.selection.select_array(
+                self.population.fitness(), 2 * size, rng
             )
+            if metrics is not None:
+                metrics.add_time("select", time.perf_counter() - tick)
 
-            parent_pool = population[:top_n_chromosomes]
-
-            # breed new population
-            new_population = []
-            while len(new_population) < self.pop_size:
-                # decide on crossover or direct reproduction
-                # crossover
-                if random.random() < self.crossover_rate:
-                    parent_1, parent_2 = parent_pool.random(k=2)
-                    child = parent_1.crossover(parent_2)
-                # direct
-                else:
-                    parent = parent_pool.random()[0]
-                    child = parent.direct()
+            return self.population.breed(
+                size,
+                self.crossover_rate,
+                self.mutation_rate,
+                metrics=metrics,
+                crossover_method=self.crossover_method,
+                out=out,
+                parents=(parents[0::2], parents[1::2]),
+                elites=elites,
+            )
+
+        n_bred = size - self.elitism
+        tick = time.perf_counter()
+        positions = self._select_parents(2 * n_bred)
+        if metrics is not None:
+            metrics.add_time("select", time.perf_counter() - tick)
+
+        tick = time.perf_counter()
+        chromosomes = self.population.chromosomes
+        parents = [chromosomes[i] for i in positions]
+        if metrics is not None:
+            metrics.add_time("sample_parents", time.perf_counter() - tick)
+
+        return self._breed(parents, size, out=out, elites=elites, metrics=metrics)
+
+    def _select_parents(self, n: int) -> list[int]:
+        """Draw the positions of `n` parents in `self.population`, in pairing order."""
+        if self.replacement == "steady_state":
+            self._rank()
+            if isinstance(self.selection, TruncationSelector):
+                # the ranked population's fittest are its last members
+                size = len(self.population)
+                top = self.selection.pool_size(size)
+                return self.selection.draw(range(size - top, size), n, self.rng)
+            return self.selection.select(self._ranked, n, self.rng)
+
+        return self.selection.select(self.population.fitness(), n, self.rng)
+
+    def _rank(self):
+        """Sort the population into ascending order of fitness, once per population."""
+        if self._ranked is None:
+            self.population.sort_by_fitness(reverse=False)
+            self._ranked = list(self.population.fitness())
+
+    def _replace_worst(self, offspring: Population) -> Population:
+        """
+        Insert scored `offspring` into the ranked population and drop the least fit.
+
+        Each child is placed by binary search and the same number of members are
+        removed from the bottom, so the fittest are never lost and the population is
+        never re-sorted. A child tied with existing members ranks above them.
+        """
+        population = self.population
+        chromosomes = population.chromosomes
+        ranked = self._ranked
+        scores = population.scores
+
+        for child, fitness in zip(offspring.chromosomes, offspring.fitness()):
+            i = bisect.bisect_right(ranked, fitness)
+            ranked.insert(i, fitness)
+            chromosomes.insert(i, child)
+            if scores is not None:
+                scores.insert(i, fitness)
+
+        k = len(offspring)
+        removed = chromosomes[:k]
+        del ranked[:k], chromosomes[:k]
+        if scores is not None:
+            del scores[:k]
+
+        if self.double_buffer:
+            # the removed members are no longer referenced by the population
+            self._spare = Population.from_chromosomes(removed)
+        return population
+
+    def _advance(self, population):
+        """Count a newly bred generation, checkpointing it if due."""
+        if self.double_buffer and self.replacement == "generational":
+            # the parents are no longer needed once their children are bred
+            self._spare = self.population
+
+        self.generation += 1
+
+        if self.checkpoint_path and self.generation % self.checkpoint_interval == 0:
+            self._checkpoint(population)
+
+    def resume(
+        self, path: str | os.PathLike, restore_terminator: bool = True
+    ) -> RunResult:
+        """
+        Continue a run from a snapshot written with `checkpoint_path`.
+
+        The population, generation counter, random state and terminator are restored
+        from the snapshot, then the run continues until it terminates.
+
+        Parameters
+        ----------
+        path : str or PathLike
+            The snapshot to resume from.
+        restore_terminator : bool, optional
+            Whether to replace `self.terminator` with the one saved in the snapshot.
+            Disable it to extend a finished run with new termination conditions.
+            Default is True.
+
+        Returns
+        -------
+        RunResult
+            The best chromosome and summary statistics of the resumed part of the run.
 
-                child.mutate(chance=self.mutation_rate)
-                new_population.append(child)
+        Raises
+        ------
+        ValueError
+            If the snapshot does not match this algorithm's population shape.
+        """
+        with load_checkpoint(path) as checkpoint:
+            if (checkpoint.size, checkpoint.chromosome_length) != (
+                self.pop_size,
+                self.chromosome_length,
+            ):
+                raise ValueError(
+                    f"Checkpoint population ({checkpoint.size} x {checkpoint.chromosome_length}) "
+                    f"does not match ({self.pop_size} x {self.chromosome_length})."
+                )
 
-            population = Population.from_chromosomes(new_population)
-            self.generation += 1
+            population = self._population_from_bytes(checkpoint.genomes)
+            if checkpoint.numpy_state is not None and hasattr(
+                population.rng, "bit_generator"
+            ):
+                population.rng.bit_generator.state = checkpoint.numpy_state
+            # restored last, as building the population may draw random numbers
+            self.rng.setstate(checkpoint.random_state)
+            if restore_terminator and checkpoint.terminator is not None:
+                self.terminator = checkpoint.terminator
+            self.generation = checkpoint.generation
+
+        self.logger.info("Resuming from generation %d", self.generation)
+        self._start_run()
+        return self._result(list(self._evolve(population)))
+
+    def _start_run(self):
+        self.population = None
+        self._spare = None
+        self.evaluations = 0
+        self.evaluations_to_optimum = None
+        self.best = None
+        self.best_fitness = None
+        self._ranked = None
+        self.profile_result = None
+        self._run_started = time.perf_counter()
+
+    def _evolve(self, population) -> Iterator[GenerationStats]:
+        """Evaluate `population`, then run generations until the algorithm terminates."""
+        self._start_profiler()
+        try:
+            stats = self._evaluate(
+                population,
+                time.perf_counter(),
+                GenerationMetrics(self.generation) if self.hooks else None,
+            )
+            yield from self._paused(stats)
+
+            while not self._terminated(stats):
+                stats = self.step()
+                yield from self._paused(stats)
+        finally:
+            self._stop_profiler()
+
+        self._finish_run()
+
+    async def _aevolve(self, population) -> AsyncIterator[GenerationStats]:
+        """Async `_evolve`, returning to the event loop between generations."""
+        # deferred, as only the async API needs asyncio
+        import asyncio
+
+        self._start_profiler()
+        try:
+            stats = await self._aevaluate(
+                population,
+                time.perf_counter(),
+                GenerationMetrics(self.generation) if self.hooks else None,
+            )
+            for stats in self._paused(stats):
+                yield stats
+
+            while not self._terminated(stats):
+                # let other tasks run, and cancellation land, between generations
+                await asyncio.sleep(0)
+                stats = await self.astep()
+                for stats in self._paused(stats):
+                    yield stats
+        finally:
+            self._stop_profiler()
+
+        self._finish_run()
+
+    def _terminated(self, stats: GenerationStats) -> bool:
+        # either terminate at max_generations or when the given Terminator dictates so.
+        return self.generation >= self.max_generations or check_terminator(
+            self.terminator, self.population, self.generation, stats
+        )
+
+    def _start_profiler(self):
+        if self.profile is not None:
+            self._profiler = Profiler(self.profile)
+            self._profiler.start()
+
+    def _stop_profiler(self):
+        if self._profiler is not None:
+            self.profile_result = self._profiler.stop()
+            self._profiler = None
+
+    def _finish_run(self):
+        # the final generation may fall between intervals
+        if self.checkpoint_path and self.generation % self.checkpoint_interval:
+            self._checkpoint(self.population)
+
+        if isinstance(self.evaluator, CachedEvaluator):
+            self.logger.info(
+                "Fitness cache hit rate: %.1f%%", 100 * self.evaluator.hit_rate
+            )
 
         # log termination reason
         if self.generation >= self.max_generations:
             self.logger.info("Terminating due to reaching max generations.")
         else:
             self.logger.info(
-                f"Terminating due to custom terminator condition: {self.terminator.reason}"
+                "Terminating due to custom terminator condition: %s",
+                self.terminator.reason,
             )
+
+    def _paused(self, stats: GenerationStats) -> Iterator[GenerationStats]:
+        """Yield `stats` with profiling paused, so the caller's work is not captured."""
+        if self._profiler is None:
+            yield stats
+            return
+
+        self._profiler.pause()
+        yield stats
+        self._profiler.resume()
+
+    def _evaluate(
+        self, population, started: float, metrics: GenerationMetrics | None = None
+    ) -> GenerationStats:
+        """Make `population` the current one, evaluate it and record its statistics."""
+        self._check_sync()
+        tick = time.perf_counter()
+        if self.evaluator is not None:
+            population.evaluate(self.evaluator)
+        return self._record(population, started, metrics, tick)
+
+    def _check_sync(self):
+        if isinstance(self.evaluator, AsyncEvaluator):
+            raise TypeError("Async fitness evaluators require arun() or astep().")
+
+    async def _aevaluate(
+        self, population, started: float, metrics: GenerationMetrics | None = None
+    ) -> GenerationStats:
+        """Async `_evaluate`, awaiting the fitness from an async evaluator."""
+        tick = time.perf_counter()
+        await self._ascore(population)
+        return self._record(population, started, metrics, tick)
+
+    async def _ascore(self, population):
+        """Score `population` with the evaluator, awaiting it if it is async."""
+        if isinstance(self.evaluator, AsyncEvaluator):
+            await population.aevaluate(self.evaluator)
+        elif self.evaluator is not None:
+            population.evaluate(self.evaluator)
+
+    def _record(
+        self,
+        population,
+        started: float,
+        metrics: GenerationMetrics | None,
+        tick: float,
+        evaluated: int | None = None,
+    ) -> GenerationStats:
+        """
+        Make the scored `population` the current one and record its statistics.
+
+        `evaluated` is the number of new fitness evaluations, default the whole
+        population.
+        """
+        if population is not self.population:
+            self._ranked = None
+        # a ranked population's fitness is already at hand
+        fitness = population.fitness() if self._ranked is None else self._ranked
+        self.population = population
+        evaluated = len(fitness) if evaluated is None else evaluated
+        self.evaluations += evaluated
+
+        stats = GenerationStats.from_fitness(
+            fitness,
+            generation=self.generation,
+            evaluations=self.evaluations,
+            elapsed=time.perf_counter() - started,
+        )
+
+        # keep a copy of the best-of-run, later generations may reuse the original
+        if self.best_fitness is None or stats.best_fitness > self.best_fitness:
+            self.best_fitness = stats.best_fitness
+            self.best = population.best().direct()
+
+        if (
+            self.evaluations_to_optimum is None
+            and self.optimum is not None
+            and stats.best_fitness >= self.optimum
+        ):
+            self.evaluations_to_optimum = self.evaluations
+
+        if metrics is not None:
+            metrics.add_time("evaluate", time.perf_counter() - tick)
+            metrics.count("evaluations", evaluated)
+
+        if self.recorder is not None:
+            tick = time.perf_counter()
+            self.recorder.record(self.generation, population, fitness)
+            if metrics is not None:
+                metrics.add_time("record", time.perf_counter() - tick)
+
+        if metrics is not None:
+            if self._profiler is not None:
+                metrics.peak_memory = self._profiler.peak_memory()
+            for hook in self.hooks:
+                hook(metrics)
+
+        return stats
+
+    def _termination_reason(self) -> str:
+        if self.generation >= self.max_generations:
+            return "Max generations reached."
+        return self.terminator.reason
+
+    def _result(self, history: list[GenerationStats]) -> RunResult:
+        """Summarise the run from its generation records."""
+        return RunResult(
+            best=self.best,
+            best_fitness=self.best_fitness,
+            generations=self.generation,
+            evaluations=self.evaluations,
+            evaluations_to_optimum=self.evaluations_to_optimum,
+            elapsed=time.perf_counter() - self._run_started,
+            reason=self._termination_reason(),
+            history=history,
+            profile=self.profile_result,
+        )
+
+    def _checkpoint(self, population):
+        save_checkpoint(
+            self.checkpoint_path,
+            population,
+            self.generation,
+            terminator=self.terminator,
+            rng=self.rng,
+        )
+        self.logger.info("Saved checkpoint at generation %d", self.generation)
+
+    def _create_population(self):
+        """Generate a random initial population using the configured backend."""
+        if self.backend == "numpy":
+            # deferred so numpy is only required when the backend is selected
+            from one_max_ga.array_population import ArrayPopulation
+
+            return ArrayPopulation(
+                self.pop_size, self.chromosome_length, rng=numpy_rng(self.rng)
+            )
+        if self.backend == "mmap":
+            from one_max_ga.mapped_population import MappedPopulation
+
+            return MappedPopulation(
+                self.pop_size,
+                self.chromosome_length,
+                rng=numpy_rng(self.rng),
+                directory=self.storage_dir,
+            )
+
+        return Population(
+            self.pop_size,
+            self.chromosome_length,
+            chromosome_cls=BACKENDS[self.backend],
+            rng=self.rng,
+        )
+
+    def _population_from_bytes(self, data: bytes):
+        """Unpack a population produced by `to_bytes()` into the configured backend."""
+        if self.backend == "numpy":
+            from one_max_ga.array_population import ArrayPopulation
+
+            return ArrayPopulation.from_bytes(
+                data, self.chromosome_length, rng=numpy_rng(self.rng)
+            )
+        if self.backend == "mmap":
+            from one_max_ga.mapped_population import MappedPopulation
+
+            return MappedPopulation.from_bytes(
+                data,
+                self.chromosome_length,
+                rng=numpy_rng(self.rng),
+                directory=self.storage_dir,
+            )
+
+        return Population.from_bytes(
+            data,
+            self.chromosome_length,
+            chromosome_cls=BACKENDS[self.backend],
+            rng=self.rng,
+        )
+
+    def _take_spare(self, size: int):
+        """Return a population of `size` whose storage the children can overwrite, if any."""
+        spare, self._spare = self._spare, None
+        if spare is None or len(spare) != size:
+            return None
+        return spare
+
+    def _breed(
+        self,
+        parents: list,
+        size: int,
+        out: Population = None,
+        elites: Population = None,
+        metrics: GenerationMetrics | None = None,
+    ) -> Population:
+        """
+        Breed a new population of `size` chromosomes one child at a time.
+
+        Child `i` is bred from `parents[2 * i]` and, by crossover, `parents[2 * i + 1]`.
+        With `out`, each child is written into the matching chromosome of `out`, and
+        `out` is returned, rather than allocating new chromosomes. With `elites`, the
+        last members are copies of the elites instead of bred children. With
+        `metrics`, each phase is timed and the operations counted into it. The same
+        random numbers are drawn either way, so hooks do not change a seeded run.
+        """
+        rng = self.rng
+        timed = metrics is not None
+        clock = time.perf_counter
+        crossover_time = direct_time = mutate_time = 0.0
+        crossovers = flipped = 0
+
+        children = [None] * size if out is None else out.chromosomes
+        n_bred = size - (0 if elites is None else len(elites))
+        for i in range(n_bred):
+            # decide on crossover or direct reproduction
+            crossover = rng.random() < self.crossover_rate
+            if timed:
+                tick = clock()
+            # crossover
+            if crossover:
+                child = parents[2 * i].crossover(
+                    parents[2 * i + 1], self.crossover_method, rng=rng, out=children[i]
+                )
+            # direct
+            else:
+                child = parents[2 * i].direct(out=children[i])
+            if timed:
+                tock = clock()
+                if crossover:
+                    crossover_time += tock - tick
+                    crossovers += 1
+                else:
+                    direct_time += tock - tick
+                tick = tock
+
+            n_flipped = child.mutate(chance=self.mutation_rate, rng=rng)
+            if timed:
+                mutate_time += clock() - tick
+                flipped += n_flipped
+            children[i] = child
+
+        if not timed:
+            return self._rebuild(children, out, elites)
+
+        tick = clock()
+        population = self._rebuild(children, out, elites)
+        metrics.add_time("rebuild", clock() - tick)
+
+        metrics.add_time("crossover", crossover_time)
+        metrics.add_time("direct", direct_time)
+        metrics.add_time("mutate", mutate_time)
+        metrics.count("children", n_bred)
+        metrics.count("crossovers", crossovers)
+        metrics.count("genes_flipped", flipped)
+        return population
+
+    def _rebuild(
+        self, children: list, out: Population | None, elites: Population = None
+    ) -> Population:
+        """Wrap bred children in a population, reusing `out` if they were written into it."""
+        if elites is not None:
+            start = len(children) - len(elites)
+            for i, elite in enumerate(elites.chromosomes, start):
+                children[i] = elite.direct(out=children[i])
+
+        if out is None:
+            return Population.from_chromosomes(children, rng=self.rng)
+
+        out.rng = self.rng
+        out.scores = None
+        return out
@@ -0,0 +1,369 @@
+import time
+from collections.abc import Sequence
+from typing import Literal, Self
+
+import numpy as np
+
+from one_max_ga.chromosome import OneMaxChromosome, SPARSE_MUTATION_THRESHOLD
+from one_max_ga.instrumentation import GenerationMetrics
+
+
+class ArrayPopulation:
+    """
+    A population stored as a single 2-D uint8 matrix, one row per chromosome.
+
+    Every operation works on the whole matrix at once, so a full generation is bred
+    with a handful of vectorised calls instead of one Python call per child.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        chromosome_length: int,
+        rng: np.random.Generator | None = None,
+    ):
+
+        if not isinstance(size, int):
+            raise ValueError("'size' must be an integer.")
+        if not isinstance(chromosome_length, int) or chromosome_length <= 0:
+            raise ValueError("'chromosome_length' must be a positive integer.")
+
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.size = size
+        self.genes = self.rng.integers(
+            0, 2, size=(size, chromosome_length), dtype=np.uint8
+        )
+        # fitness from a custom evaluator, see evaluate()
+        self.scores = None
+
+    @classmethod
+    def from_array(
+        cls, genes: np.ndarray, rng: np.random.Generator | None = None
+    ) -> Self:
+        """
+        Create a population from an existing (size, chromosome_length) gene matrix.
+
+        The matrix is used as-is, it is not copied, so slices of a population are
+        views that share its genes.
+        """
+        if genes.ndim != 2:
+            raise ValueError("'genes' must be a 2-D array.")
+
+        pop = cls.__new__(cls)
+        pop.rng = rng if rng is not None else np.random.default_rng()
+        pop.size = genes.shape[0]
+        pop.genes = genes
+        pop.scores = None
+        return pop
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        chromosome_length: int,
+        rng: np.random.Generator | None = None,
+    ) -> Self:
+        """Create a population from bytes produced by `to_bytes()`."""
+        row_bytes = (chromosome_length + 7) // 8
+        if len(data) % row_bytes:
+            raise ValueError("'data' is not a whole number of packed chromosomes.")
+
+        packed = np.frombuffer(data, dtype=np.uint8).reshape(-1, row_bytes)
+        genes = np.unpackbits(packed, axis=1, count=chromosome_length, bitorder="little")
+        return cls.from_array(genes, rng=rng)
+
+    def to_bytes(self) -> bytes:
+        """
+        Pack the population into bytes, one fixed-size packed row per chromosome.
+
+        The layout matches `Population.to_bytes`.
+        """
+        return np.packbits(self.genes, axis=1, bitorder="little").tobytes()
+
+    @property
+    def chromosome_length(self) -> int:
+        return self.genes.shape[1]
+
+    @property
+    def chromosomes(self) -> list[OneMaxChromosome]:
+        """The rows of the gene matrix as `OneMaxChromosome` objects."""
+        return [OneMaxChromosome._from_trusted_genes(row) for row in self.genes.tolist()]
+
+    def __getitem__(self, indices) -> Self:
+
+        # keep a single row 2-D so the result is still a population
+        if isinstance(indices, int):
+            indices = slice(indices, indices + 1 or None)
+
+        return self._select(indices)
+
+    def __len__(self):
+        return self.genes.shape[0]
+
+    def _select(self, indices) -> Self:
+        """Return the rows at `indices`, with their scores, as a new population."""
+        pop = ArrayPopulation.from_array(self.genes[indices], rng=self.rng)
+        if self.scores is not None:
+            pop.scores = self.scores[indices]
+        return pop
+
+    def evaluate(self, evaluator) -> np.ndarray:
+        """
+        Score every chromosome with a custom fitness evaluator.
+
+        The scores replace the built-in One-Max fitness, see `Population.evaluate`.
+        """
+        return self._set_scores(evaluator.evaluate(self))
+
+    async def aevaluate(self, evaluator) -> np.ndarray:
+        """Score every chromosome with an `AsyncEvaluator`, see `evaluate()`."""
+        return self._set_scores(await evaluator.evaluate(self))
+
+    def _set_scores(self, scores) -> np.ndarray:
+        scores = np.asarray(scores, dtype=np.float64)
+        if scores.shape != (len(self),):
+            raise ValueError(
+                f"Evaluator returned {scores.size} scores for {len(self)} chromosomes."
+            )
+
+        self.scores = scores
+        return scores
+
+    def fitness(self) -> np.ndarray:
+        """Return the fitness (number of '1's) of every chromosome as a 1-D array."""
+        if self.scores is not None:
+            return self.scores
+        return self.genes.sum(axis=1, dtype=np.int64)
+
+    def sort_by_fitness(self, reverse: bool = True) -> np.ndarray:
+
+        order = np.argsort(self.fitness(), kind="stable")
+        if reverse:
+            order = order[::-1]
+
+        self.genes = self.genes[order]
+        if self.scores is not None:
+            self.scores = self.scores[order]
+        return self.genes
+
+    def fittest(self, n: int) -> Self:
+        """
+        Return the `n` fittest chromosomes, in no particular order.
+
+        Uses a partial sort so the cost is linear in the population size.
+        """
+        if n > len(self):
+            raise ValueError("'n' cannot be greater than the population size.")
+
+        if n == len(self):
+            return self._select(slice(None))
+
+        top = np.argpartition(self.fitness(), len(self) - n)[len(self) - n :]
+        return self._select(top)
+
+    def random(self, k=1) -> list[OneMaxChromosome]:
+        if k > len(self):
+            raise ValueError("'k' cannot be greater than the population size.")
+
+        rows = self.rng.choice(len(self), size=k, replace=False)
+        return [
+            OneMaxChromosome._from_trusted_genes(row)
+            for row in self.genes[rows].tolist()
+        ]
+
+    def replace_least_fit(self, migrants: Self, scores: Sequence[float] | None = None):
+        """
+        Overwrite the least fit rows with the rows of `migrants`, in place.
+
+        See `Population.replace_least_fit`.
+        """
+        n = len(migrants)
+        if n > len(self):
+            raise ValueError("'migrants' cannot be larger than the population.")
+        if self.scores is not None and (scores is None or len(scores) != n):
+            raise ValueError("'scores' must hold a score for every migrant.")
+        if n == 0:
+            return
+
+        rows = np.argpartition(self.fitness(), n - 1)[:n]
+        self.genes[rows] = migrants.genes
+        if self.scores is not None:
+            self.scores[rows] = scores
+
+    def best(self) -> OneMaxChromosome:
+        return OneMaxChromosome._from_trusted_genes(
+            self.genes[np.argmax(self.fitness())].tolist()
+        )
+
+    def breed(
+        self,
+        size: int,
+        crossover_rate: float,
+        mutation_rate: float,
+        metrics: GenerationMetrics | None = None,
+        crossover_method: Literal["uniform", "single", "two"] = "uniform",
+        out: Self | None = None,
+        parents: tuple[np.ndarray, np.ndarray] | None = None,
+        elites: Self | None = None,
+    ) -> Self:
+        """
+        Breed a new population of `size` children, treating this population as the parent pool.
+
+        Each child is, with probability `crossover_rate`, a crossover of two distinct
+        parents, otherwise a direct copy of one parent. Every gene of every
+        child then flips with probability `mutation_rate`.
+
+        Parameters
+        ----------
+        size : int
+            The number of children to breed.
+        crossover_rate : float
+            The probability of a child being produced by crossover.
+        mutation_rate : float
+            The probability of each gene mutating.
+        metrics : GenerationMetrics, optional
+            Where to record the time spent in each phase and the operation counts.
+        crossover_method : {'uniform', 'single', 'two'}, optional
+            The crossover method, see `OneMaxChromosome.crossover`. Default is
+            'uniform'.
+        out : ArrayPopulation, optional
+            An existing population of `size` rows to write the children into, reusing
+            its gene matrix. It must not share genes with this population.
+        parents : tuple of numpy.ndarray, optional
+            The rows of each child's first and second parent, e.g. drawn by a
+            `one_max_ga.selection.Selector`. Default is a uniformly random pair of
+            distinct rows per child.
+        elites : ArrayPopulation, optional
+            Chromosomes copied unchanged into the last children, in place of the
+            children bred from the last parents.
+
+        Returns
+        -------
+        Self
+            The new population, `out` if given.
+        """
+        if metrics is not None:
+            clock = time.perf_counter
+            tick = clock()
+
+        n_parents = len(self)
+        if n_parents < 2:
+            raise ValueError("At least 2 parents are required to breed.")
+        if crossover_method not in ["uniform", "single", "two"]:
+            raise ValueError(f"method '{crossover_method}' is not a valid option.")
+        if out is not None and out.genes.shape != (size, self.chromosome_length):
+            raise ValueError(
+                f"'out' must have shape {(size, self.chromosome_length)}, "
+                f"not {out.genes.shape}."
+            )
+
+        if parents is not None:
+            first, second = parents
+            if first.shape != (size,) or second.shape != (size,):
+                raise ValueError(f"'parents' must be two arrays of {size} rows.")
+        else:
+            # first parent of every child, and a distinct second parent for crossover
+            first = self.rng.integers(0, n_parents, size=size)
+            second = (first + self.rng.integers(1, n_parents, size=size)) % n_parents
+
+        if out is None:
+            children = self.genes[first]
+        else:
+            children = np.take(self.genes, first, axis=0, out=out.genes)
+
+        if metrics is not None:
+            metrics.add_time("sample_parents", clock() - tick)
+            tick = clock()
+
+        # the children bred from parents, the rest are copies of the elites
+        n_bred = size - (0 if elites is None else len(elites))
+
+        # crossover: take genes from the second parent where the mask is set, only for
+        # the children chosen to be made by crossover
+        crossover = self.rng.random(size) < crossover_rate
+        crossover[n_bred:] = False
+        if crossover.any():
+            shape = (int(crossover.sum()), self.chromosome_length)
+            if crossover_method == "uniform":
+                mask = _random_bool_matrix(self.rng, shape)
+            else:
+                mask = _segment_mask(self.rng, shape, crossover_method)
+            blended = children[crossover]
+            np.copyto(blended, self.genes[second[crossover]], where=mask)
+            children[crossover] = blended
+
+        if metrics is not None:
+            metrics.add_time("crossover", clock() - tick)
+            tick = clock()
+
+        # mutation: XOR with a Bernoulli mask, over the bred children only
+        n_flips = 0
+        bred = children[:n_bred]
+        if n_bred and 0 < mutation_rate < SPARSE_MUTATION_THRESHOLD:
+            # a binomial number of distinct positions has the same per-gene
+            # distribution as the full mask, but only the flips are drawn
+            flat = bred.reshape(-1)
+            n_flips = self.rng.binomial(flat.size, mutation_rate)
+            flat[self.rng.choice(flat.size, size=n_flips, replace=False)] ^= 1
+        elif n_bred and mutation_rate > 0:
+            flips = self.rng.random(bred.shape, dtype=np.float32) < mutation_rate
+            bred ^= flips.view(np.uint8)
+            if metrics is not None:
+                n_flips = np.count_nonzero(flips)
+
+        if elites is not None:
+            children[size - len(elites) :] = elites.genes
+
+        if metrics is not None:
+            metrics.add_time("mutate", clock() - tick)
+            tick = clock()
+
+        if out is None:
+            population = ArrayPopulation.from_array(children, rng=self.rng)
+        else:
+            population = out
+            population.rng = self.rng
+            population.scores = None
+
+        if metrics is None:
+            return population
+
+        metrics.add_time("rebuild", clock() - tick)
+
+        metrics.count("children", n_bred)
+        metrics.count("crossovers", int(crossover.sum()))
+        metrics.count("genes_flipped", int(n_flips))
+        return population
+
+
+def _segment_mask(
+    rng: np.random.Generator, shape: tuple[int, int], method: str
+) -> np.ndarray:
+    """
+    Return the mask of genes each row takes from its second parent in a point crossover.
+
+    'single' takes everything from a random cut point onwards, 'two' the segment
+    between two distinct cut points. Cut points lie in [1, cols - 1], as in
+    `OneMaxChromosome.crossover`.
+    """
+    rows, cols = shape
+    positions = np.arange(cols)
+    if cols < 2:
+        return np.zeros(shape, dtype=bool)
+
+    start = rng.integers(1, cols, size=(rows, 1))
+    if method == "single" or cols < 3:
+        return positions >= start
+
+    # a distinct second cut, drawn from the remaining points
+    end = rng.integers(1, cols - 1, size=(rows, 1))
+    end += end >= start
+    start, end = np.minimum(start, end), np.maximum(start, end)
+    return (positions >= start) & (positions < end)
+
+
+def _random_bool_matrix(rng: np.random.Generator, shape: tuple[int, int]) -> np.ndarray:
+    """Return a matrix of fair random booleans, drawing 8 per random byte."""
+    rows, cols = shape
+    packed = rng.integers(0, 256, size=(rows, (cols + 7) // 8), dtype=np.uint8)
+    return np.unpackbits(packed, axis=1, count=cols).view(bool)
@@ -0,0 +1,147 @@
+import mmap
+import os
+import pickle
+import random
+import struct
+
+# file layout:
+#   MAGIC
+#   HEADER: version, size, chromosome_length, generation, state length, genomes offset
+#   pickled state: RNG state, numpy generator state and the terminator
+#   zero padding up to the next ALIGNMENT boundary
+#   genomes: `size` packed rows, see `OneMaxChromosome.to_bytes`
+MAGIC = b"OMGACKPT"
+VERSION = 1
+HEADER = struct.Struct("<IQQQQQ")
+ALIGNMENT = 64
+
+
+class Checkpoint:
+    """
+    A snapshot loaded by `load_checkpoint()`.
+
+    The packed genomes are memory-mapped rather than read, so they are only paged in
+    as the population is rebuilt. Close the checkpoint, or use it as a context
+    manager, to release the mapping.
+    """
+
+    def __init__(self, path, file, mapping: mmap.mmap):
+        self.path = path
+        self._file = file
+        self._mmap = mapping
+
+        version, size, length, generation, state_len, offset = HEADER.unpack_from(
+            mapping, len(MAGIC)
+        )
+        if version != VERSION:
+            raise ValueError(f"Unsupported checkpoint version {version}.")
+
+        self.size = size
+        self.chromosome_length = length
+        self.generation = generation
+
+        state_start = len(MAGIC) + HEADER.size
+        state = pickle.loads(mapping[state_start : state_start + state_len])
+        self.random_state = state["random_state"]
+        self.numpy_state = state["numpy_state"]
+        self.terminator = state["terminator"]
+
+        row_bytes = (length + 7) // 8
+        self.genomes = memoryview(mapping)[offset : offset + size * row_bytes]
+
+    def close(self):
+        self.genomes.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def save_checkpoint(path, population, generation: int, terminator=None, rng=None):
+    """
+    Write a snapshot of a run to `path`.
+
+    The genomes are written as one block of packed bits, so the cost is roughly a
+    single copy of the genome matrix. The file is written next to `path` and then
+    moved into place, so an interrupted write never corrupts the previous snapshot.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        The file to write.
+    population : Population, ArrayPopulation or MappedPopulation
+        The current population.
+    generation : int
+        The current generation counter.
+    terminator : Terminator, optional
+        The terminator, saved with its state. Must be picklable.
+    rng : random.Random, optional
+        The run's random number generator. Default is the `random` module.
+    """
+    # the array backend draws from its own numpy generator
+    numpy_rng = getattr(population, "rng", None)
+    state = pickle.dumps(
+        {
+            "random_state": (random if rng is None else rng).getstate(),
+            "numpy_state": (
+                numpy_rng.bit_generator.state
+                if hasattr(numpy_rng, "bit_generator")
+                else None
+            ),
+            "terminator": terminator,
+        }
+    )
+
+    state_start = len(MAGIC) + HEADER.size
+    offset = -(-(state_start + len(state)) // ALIGNMENT) * ALIGNMENT
+    header = HEADER.pack(
+        VERSION,
+        len(population),
+        population.chromosome_length,
+        generation,
+        len(state),
+        offset,
+    )
+
+    tmp_path = f"{os.fspath(path)}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(header)
+        f.write(state)
+        f.write(bytes(offset - state_start - len(state)))
+        # out-of-core populations are streamed rather than packed in memory
+        if hasattr(population, "write_bytes"):
+            population.write_bytes(f)
+        else:
+            f.write(population.to_bytes())
+
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path) -> Checkpoint:
+    """
+    Memory-map a snapshot written by `save_checkpoint()`.
+
+    Raises
+    ------
+    ValueError
+        If `path` is not a checkpoint file.
+    """
+    f = open(path, "rb")
+    try:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        # empty files cannot be mapped
+        f.close()
+        raise ValueError(f"'{path}' is not a checkpoint file.")
+
+    if mapping[: len(MAGIC)] != MAGIC:
+        mapping.close()
+        f.close()
+        raise ValueError(f"'{path}' is not a checkpoint file.")
+
+    return Checkpoint(path, f, mapping)
@@ -1,11 +1,150 @@
+import itertools
+import math
+import operator
 import random
+from collections.abc import Sequence
 from typing import Literal, Self
 
+# below this mutation chance only the positions that flip are sampled, rather than
+# drawing a random number for every gene
+SPARSE_MUTATION_THRESHOLD = 0.05
+
+# above this many flips, a sparse packed mutation builds its flip mask in a bytearray
+# rather than XOR-ing each flip into the genome, which copies the whole genome per flip
+SPARSE_MASK_FLIPS = 8
+
+# number of random words combined when building a Bernoulli bit mask, i.e. the
+# mutation chance is honoured to within 2**-MASK_PRECISION
+MASK_PRECISION = 32
+
+# genes shown at each end of a chromosome's repr, the middle of longer genomes is elided
+REPR_EDGE_GENES = 8
+
+
+def _bernoulli_mask(length: int, chance: float, rng=random) -> int:
+    """
+    Build a `length` bit int in which each bit is set independently with probability `chance`.
+
+    The chance is expanded into binary and one random word is drawn per digit, so the
+    cost is `MASK_PRECISION` bitwise operations over the whole word rather than one
+    random draw per bit.
+    """
+    if chance <= 0.0:
+        return 0
+    if chance >= 1.0:
+        return (1 << length) - 1
+
+    digits = int(chance * (1 << MASK_PRECISION))
+    mask = 0
+    # consume the binary expansion from the least significant digit upwards
+    for i in range(MASK_PRECISION):
+        word = rng.getrandbits(length)
+        if (digits >> i) & 1:
+            mask |= word
+        else:
+            mask &= word
+
+    return mask
+
+
+def _flip_positions(length: int, chance: float, rng=random):
+    """
+    Yield, in increasing order, the positions of a `length` gene genome that mutate.
+
+    Each gene is selected independently with probability `chance`, but only the
+    selected positions are drawn: the gap to the next one is geometrically distributed,
+    so the cost scales with the number of flips rather than the genome length.
+    """
+    if chance <= 0.0:
+        return
+    if chance >= 1.0:
+        yield from range(length)
+        return
+
+    log_miss = math.log1p(-chance)
+    position = -1
+    while True:
+        # number of genes skipped before the next flip, 1 - random() lies in (0, 1]
+        position += int(math.log(1.0 - rng.random()) / log_miss) + 1
+        if position >= length:
+            return
+        yield position
+
+
+def _pack_genes(genes: list) -> int:
+    """Pack a list of 0/1 genes into an int, gene `i` being bit `i`."""
+    return int("".join("1" if g else "0" for g in reversed(genes)) or "0", 2)
+
+
+# the 8 genes packed in each byte value, least significant bit first
+_BYTE_GENES = [tuple((byte >> i) & 1 for i in range(8)) for byte in range(256)]
+
+
+def _unpack_bits(bits: int, length: int) -> list[int]:
+    """Unpack an int into a list of `length` 0/1 genes, gene `i` being bit `i`."""
+    data = bits.to_bytes((length + 7) // 8, "little")
+    genes = list(itertools.chain.from_iterable(map(_BYTE_GENES.__getitem__, data)))
+    del genes[length:]
+    return genes
+
+
+def _crossover_points(length: int, method: str, rng) -> list[int]:
+    """
+    Draw the sorted cut points of a 'single' (one cut) or 'two' (two cuts) crossover.
+
+    Cuts lie in [1, length - 1] so every segment holds at least one gene. Genomes too
+    short for the requested cuts get as many as fit.
+    """
+    n_cuts = min(1 if method == "single" else 2, length - 1)
+    if n_cuts <= 0:
+        return []
+    if n_cuts == 1:
+        return [rng.randrange(1, length)]
+    return sorted(rng.sample(range(1, length), n_cuts))
+
+
+def _genes_repr(gene_at, length: int) -> str:
+    """Format genes as a list, eliding all but `REPR_EDGE_GENES` at each end."""
+    if length <= 2 * REPR_EDGE_GENES:
+        return repr([gene_at(i) for i in range(length)])
+
+    head = ", ".join(str(gene_at(i)) for i in range(REPR_EDGE_GENES))
+    tail = ", ".join(
+        str(gene_at(i)) for i in range(length - REPR_EDGE_GENES, length)
+    )
+    return f"[{head}, ..., {tail}]"
+
+
+def _check_out(chromosome, out):
+    """Validate a chromosome given to be overwritten with a child of `chromosome`."""
+    if out is not None and len(out) != len(chromosome):
+        raise ValueError(
+            f"'out' must have the same length. ({len(out)} != {len(chromosome)})"
+        )
+
+
+def _use_sparse_mutation(chance: float, method: str) -> bool:
+    """Resolve a mutation method to whether the sparse path should be used."""
+    if method not in ["auto", "dense", "sparse"]:
+        raise ValueError(f"method '{method}' is not a valid option.")
+
+    if method == "auto":
+        return chance < SPARSE_MUTATION_THRESHOLD
+    return method == "sparse"
+
 
 class OneMaxChromosome:
-    """Represents a chromosome for the One Max Problem."""
+    """
+    Represents a chromosome for the One Max Problem.
+
+    Operations that draw random numbers take an optional `rng` with the interface of
+    `random.Random`, see `one_max_ga.rng`. By default they use the `random` module.
+    """
 
-    def __init__(self, length=None, genes: list = None):
+    # no per-instance __dict__, populations hold many chromosomes
+    __slots__ = ("_genes", "_fitness", "length")
+
+    def __init__(self, length=None, genes: list = None, rng: random.Random = None):
 
         # ensure either args are given, but not both
         if (genes is None and length is None) or (
@@ -26,13 +165,44 @@ class OneMaxChromosome:
             if not isinstance(length, int) or length <= 0:
                 raise ValueError("Length must be a positive integer.")
             self.length = length
-            self.genes = [random.randint(0, 1) for _ in range(length)]
+            # one draw for the whole genome
+            rng = random if rng is None else rng
+            self.genes = _unpack_bits(rng.getrandbits(length), length)
+
+    @classmethod
+    def _from_trusted_genes(cls, genes: list, fitness: int | None = None) -> Self:
+        """
+        Create a chromosome from genes that are known to be valid, skipping validation.
+
+        Used for children produced internally, whose genes are built from valid
+        parents. The given list is used as-is, it is not copied.
+        """
+        chromosome = cls.__new__(cls)
+        chromosome._genes = genes
+        chromosome._fitness = fitness
+        chromosome.length = len(genes)
+        return chromosome
+
+    @property
+    def genes(self) -> list:
+        return self._genes
+
+    @genes.setter
+    def genes(self, genes: list):
+        # replacing the genes invalidates the cached fitness
+        self._genes = genes
+        self._fitness = None
 
     def __repr__(self):
-        return f"OneMaxChromosome(length={self.length}, genes={self.genes}, fitness={self.fitness()})"
+        genes = _genes_repr(self._genes.__getitem__, self.length)
+        return f"OneMaxChromosome(length={self.length}, genes={genes}, fitness={self.fitness()})"
 
     def crossover(
-        self, other: Self, method: Literal["uniform", "single", "two"] = "uniform"
+        self,
+        other: Self,
+        method: Literal["uniform", "single", "two"] = "uniform",
+        rng: random.Random = None,
+        out: Self | None = None,
     ) -> Self:
         """
         Perform crossover with another chromosome to produce an offspring.
@@ -45,13 +215,24 @@ class OneMaxChromosome:
             The crossover method to use. Default is 'uniform'.
 
             - 'uniform': Randomly selects each gene from either parent.
-            - 'single': Splits at a single random point and swaps segments.
-            - 'two': Splits at two random points and swaps the middle segment.
+            - 'single': Splits at a single random point, taking the genes before it
+              from this chromosome and the rest from `other`.
+            - 'two': Splits at two random points, taking the middle segment from
+              `other` and the rest from this chromosome.
+
+            The point methods draw one random number per cut point and copy whole
+            segments, so they are much cheaper than 'uniform' for long chromosomes.
+        rng : random.Random, optional
+            The random number generator. Default is the `random` module.
+        out : Self, optional
+            An existing chromosome of the same length to overwrite with the offspring,
+            reusing its storage instead of allocating a new chromosome. It must not
+            be one of the parents.
 
         Returns
         -------
         Self
-            The offspring chromosome.
+            The offspring chromosome, `out` if given.
 
         Raises
         ------
@@ -65,30 +246,75 @@ class OneMaxChromosome:
 
         if method not in ["uniform", "single", "two"]:
             raise ValueError(f"method '{method}' is not a valid option.")
+        _check_out(self, out)
 
-        if method != "uniform":
-            raise NotImplementedError(f"Method '{method}' has not been implemented.")
-
+        rng = random if rng is None else rng
         if method == "uniform":
-            # randomly select each gene from each parent
-            new_genes = [random.choice(genes) for genes in zip(self.genes, other.genes)]
+            # randomly select each gene from each parent, using one random bit per gene
+            # start from this chromosome's genes, written over `out` in place so no
+            # list is allocated, then take the genes whose bit is clear from `other`
+            if out is None:
+                new_genes = self._genes.copy()
+            else:
+                new_genes = out._genes
+                new_genes[:] = self._genes
+            data = rng.getrandbits(self.length).to_bytes((self.length + 7) // 8, "little")
+            mask = itertools.chain.from_iterable(map(_BYTE_GENES.__getitem__, data))
+            other_genes = other._genes
+            for i, m in zip(range(self.length), mask):
+                if not m:
+                    new_genes[i] = other_genes[i]
+        else:
+            # splice slices of the parents, alternating at each cut point
+            bounds = [0, *_crossover_points(self.length, method, rng), self.length]
+            parents = (self._genes, other._genes)
+            # slices are assigned in place when reusing `out`, so its list never resizes
+            new_genes = [] if out is None else out._genes
+            for i in range(len(bounds) - 1):
+                start, stop = bounds[i], bounds[i + 1]
+                new_genes[start:stop] = parents[i % 2][start:stop]
 
-        child = OneMaxChromosome(genes=new_genes)
-        return child
+        if out is None:
+            return OneMaxChromosome._from_trusted_genes(new_genes)
+
+        out._fitness = None
+        return out
 
-    def direct(self) -> Self:
+    def direct(self, out: Self | None = None) -> Self:
         """
         Create a direct copy of the chromosome.
 
+        Parameters
+        ----------
+        out : Self, optional
+            An existing chromosome of the same length to copy the genes into, reusing
+            its storage instead of allocating a new chromosome.
+
         Returns
         -------
         Self
-            A new OneMaxChromosome instance with the same length and genes as the original.
+            A new OneMaxChromosome instance with the same length and genes as the
+            original, or `out` if given.
         """
-        child = OneMaxChromosome(genes=self.genes)
+        _check_out(self, out)
+        # same genes, so the fitness is the same
+        if out is not None:
+            out._genes[:] = self._genes
+            out._fitness = self._fitness
+            return out
+
+        # copy the genes so in-place mutation of the child never reaches the parent
+        child = OneMaxChromosome._from_trusted_genes(
+            self._genes.copy(), fitness=self._fitness
+        )
         return child
 
-    def mutate(self, chance: float):
+    def mutate(
+        self,
+        chance: float,
+        method: Literal["auto", "dense", "sparse"] = "auto",
+        rng: random.Random = None,
+    ):
         """
         Randomly mutate the genes.
 
@@ -96,29 +322,71 @@ class OneMaxChromosome:
         ----------
         chance : float
             The probability of each gene mutating, between 0 and 1.
+        method : {'auto', 'dense', 'sparse'}, optional
+            How the mutated genes are chosen. Default is 'auto'.
+
+            - 'dense': Draws a random flip mask for the whole genome, see
+              `_bernoulli_mask`, and rebuilds the genes.
+            - 'sparse': Samples only the positions that flip and flips them in-place,
+              so the cost scales with the number of mutations.
+            - 'auto': 'sparse' when `chance` is below `SPARSE_MUTATION_THRESHOLD`,
+              otherwise 'dense'.
+
+            Both methods flip each gene independently with probability `chance`.
+        rng : random.Random, optional
+            The random number generator. Default is the `random` module.
 
         Returns
         -------
-        None
-            The mutation is applied in-place.
+        int
+            The number of genes flipped. The mutation is applied in-place.
 
         Raises
         ------
         ValueError
-            If `chance` is not between 0 and 1.
+            If `chance` is not between 0 and 1, or the method is invalid.
         """
         if not (0.0 <= chance <= 1.0):
             raise ValueError("Mutation chance must be between 0 and 1.")
 
-        mutated_genes = []
-        for gene in self.genes:
-            if random.random() < chance:
-                # flip gene i.e. 0 -> 1 and 1 -> 0
-                mutated_genes.append(1 - gene)
-            else:
-                mutated_genes.append(gene)
+        rng = random if rng is None else rng
+        if _use_sparse_mutation(chance, method):
+            delta = 0
+            flipped = 0
+            genes = self._genes
+            for i in _flip_positions(self.length, chance, rng):
+                delta += 1 - 2 * genes[i]
+                genes[i] ^= 1
+                flipped += 1
+
+            if self._fitness is not None:
+                self._fitness += delta
+            return flipped
+
+        mask = _bernoulli_mask(self.length, chance, rng)
+        flipped = mask.bit_count()
+        flips = _unpack_bits(mask, self.length)
+        if self._fitness is not None:
+            # change in the number of '1's, 0 -> 1 adds one and 1 -> 0 removes one
+            ones_flipped = sum(itertools.compress(self._genes, flips))
+            self._fitness += flipped - 2 * ones_flipped
+        # flip genes where the mask is set i.e. 0 -> 1 and 1 -> 0, keeping the list
+        self._genes[:] = map(operator.xor, self._genes, flips)
+        return flipped
+
+    def to_bytes(self) -> bytes:
+        """
+        Pack the genes into bytes, one bit per gene.
+
+        Gene `i` is bit `i % 8` of byte `i // 8`, matching `numpy.packbits(..., bitorder="little")`.
+        """
+        return _pack_genes(self._genes).to_bytes((self.length + 7) // 8, "little")
 
-        self.genes = mutated_genes
+    @classmethod
+    def from_bytes(cls, data: bytes, length: int) -> Self:
+        """Create a chromosome from bytes produced by `to_bytes()`."""
+        bits = int.from_bytes(data, "little")
+        return cls._from_trusted_genes(_unpack_bits(bits, length), fitness=bits.bit_count())
 
     def __len__(self):
         return self.length
@@ -127,9 +395,263 @@ class OneMaxChromosome:
         """
         Calculate the fitness of the chromosome.
 
+        The result is cached until the genes are replaced or mutated. Modifying the
+        `genes` list in place is not detected, assign a new list instead.
+
         Returns
         -------
         int
             The fitness score (sum of '1's).
         """
-        return sum(self.genes)
+        if self._fitness is None:
+            self._fitness = sum(self._genes)
+        return self._fitness
+
+
+class GeneView(Sequence):
+    """Read-only list-like view over the genes of a `PackedOneMaxChromosome`."""
+
+    __slots__ = ("_chromosome",)
+
+    def __init__(self, chromosome: "PackedOneMaxChromosome"):
+        self._chromosome = chromosome
+
+    def __len__(self):
+        return self._chromosome.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.tolist()[index]
+
+        length = self._chromosome.length
+        if index < 0:
+            index += length
+        if not (0 <= index < length):
+            raise IndexError("gene index out of range")
+
+        return (self._chromosome.bits >> index) & 1
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __eq__(self, other):
+        if isinstance(other, (GeneView, list)):
+            return self.tolist() == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(self.tolist())
+
+    def tolist(self) -> list[int]:
+        """Unpack the genes into a new list of ints."""
+        return _unpack_bits(self._chromosome.bits, self._chromosome.length)
+
+
+class PackedOneMaxChromosome:
+    """
+    Represents a bit-packed chromosome for the One Max Problem.
+
+    Genes are stored as the bits of a single int (gene `i` is bit `i`), so each gene
+    costs one bit and the genetic operators work on the whole genome at once.
+    """
+
+    __slots__ = ("length", "bits")
+
+    def __init__(self, length=None, genes: list = None, rng: random.Random = None):
+
+        # ensure either args are given, but not both
+        if (genes is None and length is None) or (
+            genes is not None and length is not None
+        ):
+            raise ValueError("Either 'length' or 'genes' must be given, but not both.")
+
+        # pack the given genes
+        if genes is not None:
+            # validate given gene value
+            if not isinstance(genes, list) or not all(g in [0, 1] for g in genes):
+                raise ValueError("Genes must be a list of values in [0, 1]")
+            self.length = len(genes)
+            self.bits = _pack_genes(genes)
+        # randomly generate genes
+        else:
+            # validate given length value
+            if not isinstance(length, int) or length <= 0:
+                raise ValueError("Length must be a positive integer.")
+            self.length = length
+            self.bits = (random if rng is None else rng).getrandbits(length)
+
+    @classmethod
+    def from_bits(cls, bits: int, length: int) -> Self:
+        """
+        Create a chromosome directly from a packed int, without unpacking it.
+
+        Parameters
+        ----------
+        bits : int
+            The packed genes, gene `i` being bit `i`.
+        length : int
+            The number of genes.
+
+        Returns
+        -------
+        Self
+            A new PackedOneMaxChromosome.
+        """
+        if bits < 0 or bits.bit_length() > length:
+            raise ValueError(f"'bits' does not fit in {length} genes.")
+
+        chromosome = cls.__new__(cls)
+        chromosome.length = length
+        chromosome.bits = bits
+        return chromosome
+
+    @property
+    def genes(self) -> GeneView:
+        """A read-only list-like view of the genes."""
+        return GeneView(self)
+
+    def __repr__(self):
+        bits = self.bits
+        genes = _genes_repr(lambda i: (bits >> i) & 1, self.length)
+        return f"PackedOneMaxChromosome(length={self.length}, genes={genes}, fitness={self.fitness()})"
+
+    def crossover(
+        self,
+        other: Self,
+        method: Literal["uniform", "single", "two"] = "uniform",
+        rng: random.Random = None,
+        out: Self | None = None,
+    ) -> Self:
+        """
+        Perform crossover with another chromosome to produce an offspring.
+
+        See `OneMaxChromosome.crossover`. The 'uniform' method draws a single random
+        mask for the whole genome and blends the parents bitwise, the point methods
+        build the mask from their cut points. The genes are an immutable int, so `out`
+        reuses only the chromosome object.
+        """
+        if len(self) != len(other):
+            raise ValueError(
+                f"Chromosome lengths must match. ({len(self)} != {len(other)})"
+            )
+
+        if method not in ["uniform", "single", "two"]:
+            raise ValueError(f"method '{method}' is not a valid option.")
+        _check_out(self, out)
+
+        rng = random if rng is None else rng
+        if method == "uniform":
+            mask = rng.getrandbits(self.length)
+        else:
+            # segments alternate between the parents, starting with self
+            full = (1 << self.length) - 1
+            mask = full
+            for cut in _crossover_points(self.length, method, rng):
+                # toggle every gene from the cut onwards
+                mask ^= full ^ ((1 << cut) - 1)
+
+        # take each gene from self where the mask is set, otherwise from other
+        new_bits = (self.bits & mask) | (other.bits & ~mask)
+
+        if out is not None:
+            out.bits = new_bits
+            return out
+        return PackedOneMaxChromosome.from_bits(new_bits, self.length)
+
+    def direct(self, out: Self | None = None) -> Self:
+        """
+        Create a direct copy of the chromosome.
+
+        Parameters
+        ----------
+        out : Self, optional
+            An existing chromosome of the same length to copy the genes into.
+
+        Returns
+        -------
+        Self
+            A new PackedOneMaxChromosome instance with the same length and genes as the
+            original, or `out` if given.
+        """
+        _check_out(self, out)
+        # ints are immutable so the genes can be shared
+        if out is not None:
+            out.bits = self.bits
+            return out
+        return PackedOneMaxChromosome.from_bits(self.bits, self.length)
+
+    def mutate(
+        self,
+        chance: float,
+        method: Literal["auto", "dense", "sparse"] = "auto",
+        rng: random.Random = None,
+    ):
+        """
+        Randomly mutate the genes by XOR-ing them with a random flip mask.
+
+        Parameters
+        ----------
+        chance : float
+            The probability of each gene mutating, between 0 and 1.
+        method : {'auto', 'dense', 'sparse'}, optional
+            How the flip mask is built, see `OneMaxChromosome.mutate`. 'dense' combines
+            whole random words, 'sparse' sets only the sampled flip positions.
+        rng : random.Random, optional
+            The random number generator. Default is the `random` module.
+
+        Returns
+        -------
+        int
+            The number of genes flipped. The mutation is applied in-place.
+
+        Raises
+        ------
+        ValueError
+            If `chance` is not between 0 and 1, or the method is invalid.
+        """
+        if not (0.0 <= chance <= 1.0):
+            raise ValueError("Mutation chance must be between 0 and 1.")
+
+        rng = random if rng is None else rng
+        if _use_sparse_mutation(chance, method):
+            positions = list(_flip_positions(self.length, chance, rng))
+            # a few flips are applied bit by bit, only many are worth a whole mask
+            if len(positions) <= SPARSE_MASK_FLIPS:
+                bits = self.bits
+                for i in positions:
+                    bits ^= 1 << i
+                self.bits = bits
+                return len(positions)
+
+            mask = bytearray((self.length + 7) // 8)
+            for i in positions:
+                mask[i >> 3] |= 1 << (i & 7)
+            flips = int.from_bytes(mask, "little")
+        else:
+            flips = _bernoulli_mask(self.length, chance, rng)
+
+        self.bits ^= flips
+        return flips.bit_count()
+
+    def to_bytes(self) -> bytes:
+        """Pack the genes into bytes, see `OneMaxChromosome.to_bytes`."""
+        return self.bits.to_bytes((self.length + 7) // 8, "little")
+
+    @classmethod
+    def from_bytes(cls, data: bytes, length: int) -> Self:
+        """Create a chromosome from bytes produced by `to_bytes()`."""
+        return cls.from_bits(int.from_bytes(data, "little"), length)
+
+    def __len__(self):
+        return self.length
+
+    def fitness(self) -> int:
+        """
+        Calculate the fitness of the chromosome.
+
+        Returns
+        -------
+        int
+            The fitness score (number of set bits).
+        """
+        return self.bits.bit_count()
@@ -0,0 +1,372 @@
+"""
+Run the genetic algorithm from the command line.
+
+    one-max-ga --pop-size 1000 --chromosome-length 10000 --backend packed --seed 1
+    one-max-ga --backend numpy --json metrics.json --profile
+    one-max-ga --fitness my_module:my_fitness --workers 8 --checkpoint run.ckpt
+
+Only argparse is imported to parse the arguments, the algorithm and any backend
+dependencies (e.g. numpy) are imported once they are needed.
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+
+SELECTIONS = ["truncation", "tournament", "roulette", "sus"]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="one-max-ga",
+        description="Run a genetic algorithm on the One-Max problem.",
+    )
+
+    ga = parser.add_argument_group("algorithm")
+    ga.add_argument("--pop-size", type=int, default=100)
+    ga.add_argument("--chromosome-length", type=int, default=50)
+    ga.add_argument("--crossover-rate", type=float, default=0.7)
+    ga.add_argument("--mutation-rate", type=float, default=0.01)
+    ga.add_argument(
+        "--selection-rate",
+        type=float,
+        default=0.2,
+        help="Fraction of the population bred from by truncation selection.",
+    )
+    ga.add_argument("--max-generations", type=int, default=100)
+    ga.add_argument(
+        "--backend", choices=["list", "packed", "numpy", "mmap"], default="list"
+    )
+    ga.add_argument(
+        "--crossover-method", choices=["uniform", "single", "two"], default="uniform"
+    )
+    ga.add_argument("--selection", choices=SELECTIONS, default="truncation")
+    ga.add_argument(
+        "--tournament-size",
+        type=int,
+        default=2,
+        help="Entrants per tournament with --selection tournament.",
+    )
+    ga.add_argument("--elitism", type=int, default=0)
+    ga.add_argument(
+        "--replacement",
+        choices=["generational", "steady_state"],
+        default="generational",
+    )
+    ga.add_argument(
+        "--offspring",
+        type=int,
+        default=2,
+        help="Children bred per step with --replacement steady_state.",
+    )
+    ga.add_argument("--double-buffer", action="store_true")
+    ga.add_argument(
+        "--storage-dir",
+        metavar="PATH",
+        help="Where the mmap backend keeps its genome files. Default is the "
+        "system's temporary directory.",
+    )
+    ga.add_argument("--seed", type=int, help="Seed for a reproducible run.")
+
+    termination = parser.add_argument_group(
+        "termination", "Stop early when any condition is met."
+    )
+    termination.add_argument("--target-fitness", type=float)
+    termination.add_argument(
+        "--patience", type=int, help="Generations allowed without improvement."
+    )
+    termination.add_argument("--time-limit", type=float, help="Seconds of wall time.")
+    termination.add_argument("--max-evaluations", type=int)
+
+    fitness = parser.add_argument_group("fitness")
+    fitness.add_argument(
+        "--fitness",
+        metavar="MODULE:FUNCTION",
+        help="A fitness function taking a chromosome. Default is One-Max.",
+    )
+    fitness.add_argument(
+        "--workers",
+        type=int,
+        help="Evaluate fitness in parallel across this many workers.",
+    )
+    fitness.add_argument(
+        "--executor", choices=["process", "thread"], default="process"
+    )
+    fitness.add_argument(
+        "--fitness-cache",
+        type=int,
+        metavar="SIZE",
+        help="Cache the fitness of this many distinct genomes.",
+    )
+    fitness.add_argument(
+        "--optimum",
+        type=float,
+        help="Fitness counted as optimal. Default is the chromosome length for "
+        "One-Max.",
+    )
+
+    output = parser.add_argument_group("output")
+    output.add_argument("--checkpoint", metavar="PATH", help="Snapshot the run here.")
+    output.add_argument("--checkpoint-interval", type=int, default=10)
+    output.add_argument(
+        "--resume", metavar="PATH", help="Continue a run from a checkpoint."
+    )
+    output.add_argument(
+        "--history",
+        metavar="PATH",
+        help="Stream every generation's genomes and fitness to this file.",
+    )
+    output.add_argument(
+        "--json",
+        metavar="PATH",
+        help="Write the run's metrics as JSON, '-' for stdout.",
+    )
+    output.add_argument(
+        "--phase-timings",
+        action="store_true",
+        help="Time each phase of every generation, included in the JSON metrics.",
+    )
+    output.add_argument(
+        "--profile",
+        nargs="?",
+        const="cprofile",
+        choices=["cprofile", "tracemalloc"],
+        help="Profile the run and print a summary to stderr. Default is cprofile.",
+    )
+    output.add_argument(
+        "--log-interval",
+        type=int,
+        default=1,
+        help="Log progress every N generations with --verbose.",
+    )
+    output.add_argument(
+        "-v", "--verbose", action="store_true", help="Log progress to stderr."
+    )
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+    try:
+        ga = _build_algorithm(args)
+    except (ValueError, TypeError, ImportError, AttributeError) as error:
+        parser.error(str(error))
+
+    from one_max_ga.evaluation import AsyncEvaluator
+
+    if isinstance(ga.evaluator, AsyncEvaluator):
+        if args.resume:
+            parser.error("'--resume' does not support async fitness functions.")
+        import asyncio
+
+        result = asyncio.run(_arun(ga))
+    else:
+        try:
+            result = ga.resume(args.resume) if args.resume else ga.run()
+        finally:
+            if ga.evaluator is not None:
+                ga.evaluator.close()
+            if ga.recorder is not None:
+                ga.recorder.close()
+
+    metrics = _metrics(args, result, ga.hooks[0] if ga.hooks else None)
+    if args.json:
+        text = json.dumps(metrics, indent=2)
+        if args.json == "-":
+            print(text)
+        else:
+            with open(args.json, "w") as f:
+                f.write(text + "\n")
+    if args.json != "-":
+        print(
+            f"best fitness {result.best_fitness} after {result.generations} "
+            f"generations, {result.evaluations} evaluations, {result.elapsed:.3f}s "
+            f"({result.reason})"
+        )
+
+    if result.profile is not None:
+        _print_profile(result.profile)
+
+    return 0
+
+
+def _build_algorithm(args):
+    """Create the `GeneticAlgorithm` described by the parsed arguments."""
+    from one_max_ga.algorithm import GeneticAlgorithm
+
+    terminators = []
+    if any(
+        value is not None
+        for value in [
+            args.target_fitness,
+            args.patience,
+            args.time_limit,
+            args.max_evaluations,
+        ]
+    ):
+        from one_max_ga import terminators as t
+
+        if args.target_fitness is not None:
+            terminators.append(t.TargetFitnessTerminator(args.target_fitness))
+        if args.patience is not None:
+            terminators.append(t.StagnationTerminator(args.patience))
+        if args.time_limit is not None:
+            terminators.append(t.WallClockTerminator(args.time_limit))
+        if args.max_evaluations is not None:
+            terminators.append(t.EvaluationBudgetTerminator(args.max_evaluations))
+
+    hooks = []
+    if args.phase_timings:
+        from one_max_ga.instrumentation import MetricsRecorder
+
+        hooks.append(MetricsRecorder())
+
+    optimum = args.optimum
+    if optimum is None and args.fitness is None:
+        # the built-in One-Max optimum, still known when evaluated by `--workers`
+        optimum = args.chromosome_length
+
+    ga = GeneticAlgorithm(
+        pop_size=args.pop_size,
+        chromosome_length=args.chromosome_length,
+        crossover_rate=args.crossover_rate,
+        mutation_rate=args.mutation_rate,
+        selection_rate=args.selection_rate,
+        max_generations=args.max_generations,
+        terminator=_any(terminators),
+        backend=args.backend,
+        crossover_method=args.crossover_method,
+        fitness=_fitness(args),
+        checkpoint_path=args.checkpoint,
+        checkpoint_interval=args.checkpoint_interval,
+        hooks=hooks,
+        profile=args.profile,
+        rng=args.seed,
+        double_buffer=args.double_buffer,
+        log_interval=args.log_interval,
+        fitness_cache=args.fitness_cache,
+        elitism=args.elitism,
+        replacement=args.replacement,
+        offspring=args.offspring,
+        optimum=optimum,
+        selection=_selection(args),
+        storage_dir=args.storage_dir,
+    )
+
+    # opened once the arguments are validated, so an error doesn't leak its writer
+    if args.history:
+        from one_max_ga.history import HistoryRecorder
+
+        ga.recorder = HistoryRecorder(args.history)
+    return ga
+
+
+def _any(terminators: list):
+    if not terminators:
+        return None
+    if len(terminators) == 1:
+        return terminators[0]
+
+    from one_max_ga.terminators import AnyTerminator
+
+    return AnyTerminator(*terminators)
+
+
+async def _arun(ga):
+    try:
+        return await ga.arun()
+    finally:
+        await ga.evaluator.aclose()
+        if ga.recorder is not None:
+            ga.recorder.close()
+
+
+def _fitness(args):
+    """Return the fitness function or evaluator selected by the arguments, if any."""
+    fn = None
+    if args.fitness:
+        import importlib
+
+        module, _, name = args.fitness.partition(":")
+        if not name:
+            raise ValueError("'--fitness' must be given as MODULE:FUNCTION.")
+        fn = getattr(importlib.import_module(module), name)
+
+    if args.workers is None:
+        return fn
+
+    from one_max_ga.evaluation import PoolEvaluator
+
+    if fn is None:
+        # the built-in One-Max fitness, evaluated by the workers
+        from operator import methodcaller
+
+        fn = methodcaller("fitness")
+    return PoolEvaluator(fn, workers=args.workers, executor=args.executor)
+
+
+def _selection(args):
+    if args.selection == "truncation":
+        return None
+
+    from one_max_ga import selection
+
+    if args.selection == "tournament":
+        return selection.TournamentSelector(args.tournament_size)
+    if args.selection == "roulette":
+        return selection.RouletteSelector()
+    return selection.StochasticUniversalSelector()
+
+
+def _metrics(args, result, recorder) -> dict:
+    """Summarise a run as JSON-serialisable metrics."""
+    from dataclasses import asdict
+
+    elapsed = max(result.elapsed, 1e-9)
+    metrics = {
+        "params": {
+            name: value
+            for name, value in vars(args).items()
+            if name not in ["json", "verbose"]
+        },
+        "best_fitness": result.best_fitness,
+        "generations": result.generations,
+        "evaluations": result.evaluations,
+        "evaluations_to_optimum": result.evaluations_to_optimum,
+        "elapsed": result.elapsed,
+        "generations_per_second": result.generations / elapsed,
+        "evaluations_per_second": result.evaluations / elapsed,
+        "reason": result.reason,
+        "timestamp": time.time(),
+        "history": [asdict(stats) for stats in result.history],
+    }
+    if recorder is not None:
+        metrics["phase_timings"] = recorder.total_timings()
+        metrics["counters"] = recorder.total_counters()
+    return metrics
+
+
+def _print_profile(profile):
+    """Print the top of a cProfile or tracemalloc capture to stderr."""
+    if hasattr(profile, "sort_stats"):
+        profile.stream = sys.stderr
+        profile.sort_stats("cumulative").print_stats(20)
+        return
+
+    for stat in profile.statistics("lineno")[:20]:
+        print(stat, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,376 @@
+import hashlib
+import math
+import os
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import Executor
+from typing import Literal
+
+from one_max_ga.chromosome import PackedOneMaxChromosome
+
+
+class Evaluator(ABC):
+    """Scores every chromosome of a population with a custom fitness function."""
+
+    @abstractmethod
+    def evaluate(self, population) -> Sequence[float]:
+        """Return the fitness of every chromosome in `population`, in population order."""
+        pass
+
+    def close(self):
+        """Release any resources held by the evaluator."""
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class FunctionEvaluator(Evaluator):
+    """Calls a fitness function on each chromosome in turn."""
+
+    def __init__(self, fn: Callable[[object], float]):
+        """
+        Parameters
+        ----------
+        fn : Callable
+            Takes a chromosome and returns its fitness.
+        """
+        self.fn = fn
+
+    def evaluate(self, population):
+        return [self.fn(c) for c in population.chromosomes]
+
+
+class BatchEvaluator(Evaluator):
+    """Calls a fitness function once with the whole population."""
+
+    def __init__(self, fn: Callable[[object], Sequence[float]]):
+        """
+        Parameters
+        ----------
+        fn : Callable
+            Takes a population and returns the fitness of every chromosome, in
+            population order.
+        """
+        self.fn = fn
+
+    def evaluate(self, population):
+        return self.fn(population)
+
+
+# bytes of the digest keying each genome in CachedEvaluator, collisions between
+# distinct genomes are negligible at 128 bits
+DIGEST_SIZE = 16
+
+
+class CachedEvaluator(Evaluator):
+    """
+    Memoises another evaluator's scores, keyed by a digest of each packed genome.
+
+    Converging runs breed many identical chromosomes, from `direct()` copies and
+    children that no mutation touched. Only the distinct genomes missing from the
+    cache are passed on, as one smaller population, so batch and pool evaluators see
+    a single call per generation. The least recently used scores are evicted once
+    the cache holds `maxsize` genomes. Each genome is keyed by its 16-byte BLAKE2b
+    digest, so the cache's size does not grow with the chromosome length.
+    """
+
+    def __init__(self, evaluator: Evaluator, maxsize: int | None = 65536):
+        """
+        Parameters
+        ----------
+        evaluator : Evaluator
+            The evaluator scoring genomes missing from the cache. Its fitness must
+            depend on the genes alone.
+        maxsize : int, optional
+            The most genomes to keep scores for. Default is 65536. None keeps every
+            score.
+        """
+        if maxsize is not None and (not isinstance(maxsize, int) or maxsize <= 0):
+            raise ValueError("'maxsize' must be a positive integer or None.")
+
+        self.evaluator = evaluator
+        self.maxsize = maxsize
+        # digest of the packed genome -> score, least recently used first
+        self._cache: OrderedDict[bytes, float] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._cache)
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of chromosomes scored from the cache so far."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def cache_clear(self):
+        """Empty the cache and reset the hit and miss counts."""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def evaluate(self, population):
+        n = len(population)
+        # rows are digested in place, a long genome is never copied or kept as a key
+        data = memoryview(population.to_bytes())
+        row_bytes = (population.chromosome_length + 7) // 8
+        cache = self._cache
+
+        scores = [None] * n
+        # genomes missing from the cache -> the positions they appear at
+        missing: dict[bytes, list[int]] = {}
+        for i in range(n):
+            row = data[i * row_bytes : (i + 1) * row_bytes]
+            key = hashlib.blake2b(row, digest_size=DIGEST_SIZE).digest()
+            score = cache.get(key)
+            if score is not None:
+                cache.move_to_end(key)
+                scores[i] = score
+            elif key in missing:
+                missing[key].append(i)
+            else:
+                missing[key] = [i]
+
+        if missing:
+            first = [positions[0] for positions in missing.values()]
+            new_scores = list(self.evaluator.evaluate(population[first]))
+            if len(new_scores) != len(first):
+                raise ValueError(
+                    f"Evaluator returned {len(new_scores)} scores for "
+                    f"{len(first)} chromosomes."
+                )
+
+            for (key, positions), score in zip(missing.items(), new_scores):
+                cache[key] = score
+                for i in positions:
+                    scores[i] = score
+
+            if self.maxsize is not None:
+                while len(cache) > self.maxsize:
+                    cache.popitem(last=False)
+
+        self.misses += len(missing)
+        self.hits += n - len(missing)
+        return scores
+
+    def close(self):
+        self.evaluator.close()
+
+
+class PoolEvaluator(Evaluator):
+    """
+    Fans a fitness function out over a pool of worker processes or threads.
+
+    The population is split into contiguous batches, one task per batch. With
+    processes, the packed genomes are written once into shared memory and each worker
+    rebuilds its batch as `PackedOneMaxChromosome`s from there, so no chromosome is
+    ever pickled. Threads call the function on the population's own chromosomes.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[object], float],
+        workers: int | None = None,
+        executor: Literal["process", "thread"] = "process",
+        batches_per_worker: int = 4,
+    ):
+        """
+        Parameters
+        ----------
+        fn : Callable
+            Takes a chromosome and returns its fitness. Must be picklable, i.e. defined
+            at module level, when using processes.
+        workers : int, optional
+            The number of workers. Default is one per CPU.
+        executor : {'process', 'thread'}, optional
+            The kind of worker pool. Default is 'process'.
+        batches_per_worker : int, optional
+            How many batches the population is split into per worker, to balance uneven
+            evaluation times. Default is 4.
+        """
+        if executor not in ["process", "thread"]:
+            raise ValueError(f"executor '{executor}' is not a valid option.")
+        if not isinstance(batches_per_worker, int) or batches_per_worker <= 0:
+            raise ValueError("'batches_per_worker' must be a positive integer.")
+
+        self.fn = fn
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = executor
+        self.batches_per_worker = batches_per_worker
+        self._pool: Executor | None = None
+
+    def _get_pool(self) -> Executor:
+        # the pool is started lazily and reused across generations
+        if self._pool is None:
+            # deferred, like multiprocessing below, so importing the package stays fast
+            from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+            if self.executor == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def _batches(self, size: int) -> list[tuple[int, int]]:
+        batch_size = max(1, math.ceil(size / (self.workers * self.batches_per_worker)))
+        return [(i, min(i + batch_size, size)) for i in range(0, size, batch_size)]
+
+    def evaluate(self, population):
+        if len(population) == 0:
+            return []
+
+        pool = self._get_pool()
+        batches = self._batches(len(population))
+
+        if self.executor == "thread":
+            chromosomes = population.chromosomes
+            futures = [
+                pool.submit(_evaluate_batch, self.fn, chromosomes[start:stop])
+                for start, stop in batches
+            ]
+            return [score for future in futures for score in future.result()]
+
+        from multiprocessing import shared_memory
+
+        data = population.to_bytes()
+        length = population.chromosome_length
+        shm = shared_memory.SharedMemory(create=True, size=len(data))
+        try:
+            shm.buf[: len(data)] = data
+            futures = [
+                pool.submit(_evaluate_shared, self.fn, shm.name, start, stop, length)
+                for start, stop in batches
+            ]
+            return [score for future in futures for score in future.result()]
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+class AsyncEvaluator(ABC):
+    """
+    Scores every chromosome of a population with an async fitness function.
+
+    Used with `GeneticAlgorithm.arun()`, for fitness that waits on I/O, e.g. a
+    simulation service or a remote model.
+    """
+
+    @abstractmethod
+    async def evaluate(self, population) -> Sequence[float]:
+        """Return the fitness of every chromosome in `population`, in population order."""
+        pass
+
+    async def aclose(self):
+        """Release any resources held by the evaluator."""
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+class AsyncFunctionEvaluator(AsyncEvaluator):
+    """Awaits a fitness function on every chromosome, with bounded concurrency."""
+
+    def __init__(
+        self,
+        fn: Callable[[object], Awaitable[float]],
+        concurrency: int | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        fn : Callable
+            An async function taking a chromosome and returning its fitness.
+        concurrency : int, optional
+            The most evaluations awaited at once. Default is the whole population.
+        """
+        if concurrency is not None and (
+            not isinstance(concurrency, int) or concurrency <= 0
+        ):
+            raise ValueError("'concurrency' must be a positive integer.")
+
+        self.fn = fn
+        self.concurrency = concurrency
+
+    async def evaluate(self, population):
+        import asyncio
+
+        chromosomes = population.chromosomes
+        scores = [0.0] * len(chromosomes)
+        # a fixed set of workers share the chromosomes, rather than a task per
+        # chromosome waiting on a semaphore
+        pending = iter(range(len(chromosomes)))
+
+        async def worker():
+            for i in pending:
+                scores[i] = await self.fn(chromosomes[i])
+
+        n_workers = min(self.concurrency or len(chromosomes), len(chromosomes))
+        tasks = [asyncio.ensure_future(worker()) for _ in range(n_workers)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # on an error or cancellation, stop the evaluations still in flight
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return scores
+
+
+class AsyncBatchEvaluator(AsyncEvaluator):
+    """Awaits a fitness function once with the whole population."""
+
+    def __init__(self, fn: Callable[[object], Awaitable[Sequence[float]]]):
+        """
+        Parameters
+        ----------
+        fn : Callable
+            An async function taking a population and returning the fitness of every
+            chromosome, in population order.
+        """
+        self.fn = fn
+
+    async def evaluate(self, population):
+        return await self.fn(population)
+
+
+def _evaluate_batch(fn: Callable[[object], float], chromosomes: list) -> list[float]:
+    return [fn(c) for c in chromosomes]
+
+
+def _evaluate_shared(
+    fn: Callable[[object], float], name: str, start: int, stop: int, length: int
+) -> list[float]:
+    """Evaluate rows `start` to `stop` of a packed population held in shared memory."""
+    from multiprocessing import shared_memory
+
+    row_bytes = (length + 7) // 8
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        buf = shm.buf
+        scores = [
+            fn(
+                PackedOneMaxChromosome.from_bytes(
+                    buf[i * row_bytes : (i + 1) * row_bytes], length
+                )
+            )
+            for i in range(start, stop)
+        ]
+        del buf
+        return scores
+    finally:
+        shm.close()
@@ -0,0 +1,305 @@
+import mmap
+import os
+import queue
+import struct
+import threading
+from array import array
+from dataclasses import dataclass
+
+from one_max_ga.chromosome import PackedOneMaxChromosome, _pack_genes
+from one_max_ga.population import Population
+
+# a history is two files:
+#   `path`: the generations' records, each starting on an ALIGNMENT boundary:
+#       fitness: `size` float64s
+#       genomes: `size` packed rows, see `OneMaxChromosome.to_bytes`
+#   `path` + INDEX_SUFFIX:
+#       MAGIC, INDEX_HEADER: version, chromosome_length
+#       one INDEX_ENTRY per record: generation, offset, size
+# the index is only appended to once a record's data is written, so the records it
+# lists are always complete
+MAGIC = b"OMGAHIST"
+VERSION = 1
+INDEX_SUFFIX = ".idx"
+INDEX_HEADER = struct.Struct("<IQ")
+INDEX_ENTRY = struct.Struct("<QQQ")
+ALIGNMENT = 64
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryRecord:
+    """One generation read back from a history file."""
+
+    generation: int
+    # float64 fitness of every chromosome, a read-only view of the file
+    fitness: memoryview
+    # packed genomes, one row per chromosome, a read-only view of the file
+    genomes: memoryview
+
+
+class HistoryRecorder:
+    """
+    Appends every generation's genomes and fitness to a memory-mapped file.
+
+    Pass it in `GeneticAlgorithm(recorder=...)`. Each generation is copied on the
+    calling thread, then packed and written to the file by a background thread, so
+    the algorithm only waits for disk when `queue_size` generations are already
+    pending. The list backends are copied as each chromosome's genes, which is much
+    cheaper than packing them, though under the GIL the packing still shares the
+    interpreter with the algorithm. The file is grown by doubling, and trimmed to its
+    contents when the recorder is closed. Close it, or use it as a context manager,
+    before reading the history with `load_history()`.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        queue_size: int = 4,
+        initial_size: int = 2**20,
+    ):
+        """
+        Parameters
+        ----------
+        path : str or PathLike
+            The file to write. Its index is written to `path` + '.idx'. Existing
+            files are overwritten.
+        queue_size : int, optional
+            The most generations waiting to be written. Default is 4.
+        initial_size : int, optional
+            The bytes preallocated for the file. Default is 1 MiB.
+        """
+        if not isinstance(queue_size, int) or queue_size <= 0:
+            raise ValueError("'queue_size' must be a positive integer.")
+        if not isinstance(initial_size, int) or initial_size <= 0:
+            raise ValueError("'initial_size' must be a positive integer.")
+
+        self.path = path
+        self.chromosome_length = None
+        self._data = open(path, "w+b")
+        self._data.truncate(initial_size)
+        self._mmap = mmap.mmap(self._data.fileno(), initial_size)
+        self._index = open(f"{os.fspath(path)}{INDEX_SUFFIX}", "wb")
+        self._index.write(MAGIC)
+        # the end of the last record
+        self._end = 0
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._error = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._thread.start()
+
+    def record(self, generation: int, population, fitness):
+        """
+        Queue a generation to be written.
+
+        Parameters
+        ----------
+        generation : int
+            The generation number.
+        population : Population or ArrayPopulation
+            The generation's chromosomes.
+        fitness : list of float or numpy.ndarray
+            The fitness of every chromosome, in population order.
+
+        Raises
+        ------
+        ValueError
+            If the chromosome length differs from previous generations.
+        """
+        self._raise_error()
+        if self._closed:
+            raise ValueError("Cannot record to a closed recorder.")
+
+        length = population.chromosome_length
+        if self.chromosome_length is None:
+            self.chromosome_length = length
+            self._index.write(INDEX_HEADER.pack(VERSION, length))
+        elif length != self.chromosome_length:
+            raise ValueError(
+                f"Chromosome length {length} does not match {self.chromosome_length}."
+            )
+
+        # snapshot now, later generations may reuse the population's storage
+        if hasattr(fitness, "astype"):
+            scores = fitness.astype("float64").tobytes()
+        else:
+            scores = array("d", fitness).tobytes()
+        self._queue.put((generation, len(population), scores, _snapshot(population)))
+
+    def close(self):
+        """Write any pending generations, then trim and close the files."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+        self._mmap.flush()
+        self._mmap.close()
+        self._data.truncate(self._end)
+        self._data.close()
+        self._index.close()
+        self._raise_error()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _write_loop(self):
+        while (item := self._queue.get()) is not None:
+            # after an error, keep draining so `record()` never blocks forever
+            if self._error is not None:
+                continue
+            generation, size, scores, genomes = item
+            try:
+                self._write(
+                    generation, size, scores, _pack(genomes, self.chromosome_length)
+                )
+            except Exception as error:
+                self._error = error
+
+    def _write(self, generation: int, size: int, scores: bytes, genomes: bytes):
+        offset = -(-self._end // ALIGNMENT) * ALIGNMENT
+        end = offset + len(scores) + len(genomes)
+        if end > len(self._mmap):
+            self._grow(end)
+
+        self._mmap[offset : offset + len(scores)] = scores
+        self._mmap[offset + len(scores) : end] = genomes
+        self._end = end
+        self._index.write(INDEX_ENTRY.pack(generation, offset, size))
+        self._index.flush()
+
+    def _grow(self, needed: int):
+        size = max(needed, 2 * len(self._mmap))
+        self._mmap.close()
+        self._data.truncate(size)
+        self._mmap = mmap.mmap(self._data.fileno(), size)
+
+
+def _snapshot(population) -> bytes | list:
+    """
+    Copy the genomes of `population` for the writer thread, see `_pack()`.
+
+    A list population is copied as each chromosome's gene list or packed int, the
+    array backends are packed already.
+    """
+    if isinstance(population, Population):
+        return [
+            c.bits if isinstance(c, PackedOneMaxChromosome) else c.genes.copy()
+            for c in population.chromosomes
+        ]
+    return population.to_bytes()
+
+
+def _pack(genomes: bytes | list, chromosome_length: int) -> bytes:
+    """Pack a `_snapshot()` into rows, see `OneMaxChromosome.to_bytes`."""
+    if isinstance(genomes, bytes):
+        return genomes
+
+    row_bytes = (chromosome_length + 7) // 8
+    rows = (row if isinstance(row, int) else _pack_genes(row) for row in genomes)
+    return b"".join(row.to_bytes(row_bytes, "little") for row in rows)
+
+
+class History:
+    """
+    A history file loaded by `load_history()`.
+
+    The records are memory-mapped rather than read, so a generation is only paged in
+    when it is accessed. Close the history, or use it as a context manager, once
+    every `HistoryRecord` taken from it is no longer used.
+    """
+
+    def __init__(self, path, file, mapping: mmap.mmap | None, index: bytes):
+        self.path = path
+        self._file = file
+        self._mmap = mapping
+
+        version, self.chromosome_length = INDEX_HEADER.unpack_from(index, len(MAGIC))
+        if version != VERSION:
+            raise ValueError(f"Unsupported history version {version}.")
+
+        start = len(MAGIC) + INDEX_HEADER.size
+        # an entry cut short by an interruption is ignored
+        n_entries = (len(index) - start) // INDEX_ENTRY.size
+        self._entries = [
+            INDEX_ENTRY.unpack_from(index, start + i * INDEX_ENTRY.size)
+            for i in range(n_entries)
+        ]
+        # the latest record of each generation, e.g. after a resumed run
+        self._positions = {entry[0]: i for i, entry in enumerate(self._entries)}
+
+    @property
+    def generations(self) -> list[int]:
+        """The generation number of every record, in the order they were written."""
+        return [generation for generation, _, _ in self._entries]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getitem__(self, position: int) -> HistoryRecord:
+        """Return the record at `position`, in the order they were written."""
+        generation, offset, size = self._entries[position]
+        view = memoryview(self._mmap)
+        fitness_end = offset + size * 8
+        row_bytes = (self.chromosome_length + 7) // 8
+        return HistoryRecord(
+            generation=generation,
+            fitness=view[offset:fitness_end].cast("d"),
+            genomes=view[fitness_end : fitness_end + size * row_bytes],
+        )
+
+    def read(self, generation: int) -> HistoryRecord:
+        """
+        Return the record of `generation`.
+
+        Raises
+        ------
+        KeyError
+            If the generation was not recorded.
+        """
+        return self[self._positions[generation]]
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load_history(path) -> History:
+    """
+    Memory-map a history written by `HistoryRecorder`.
+
+    Raises
+    ------
+    ValueError
+        If `path` is not a history file.
+    """
+    with open(f"{os.fspath(path)}{INDEX_SUFFIX}", "rb") as f:
+        index = f.read()
+    if index[: len(MAGIC)] != MAGIC:
+        raise ValueError(f"'{path}' is not a history file.")
+    if len(index) < len(MAGIC) + INDEX_HEADER.size:
+        raise ValueError(f"'{path}' has no recorded generations.")
+
+    f = open(path, "rb")
+    # empty files cannot be mapped
+    mapping = None
+    if os.fstat(f.fileno()).st_size:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return History(path, f, mapping, index)
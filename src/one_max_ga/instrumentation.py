@@ -0,0 +1,131 @@
+import cProfile
+import pstats
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+# phases timed within a generation, in the order they run
+PHASES = [
+    "select",
+    "sample_parents",
+    "crossover",
+    "direct",
+    "mutate",
+    "rebuild",
+    "evaluate",
+    "record",
+]
+
+PROFILE_MODES = ["cprofile", "tracemalloc"]
+
+
+@dataclass(slots=True)
+class GenerationMetrics:
+    """Per-phase timings and operation counters of a single generation."""
+
+    generation: int
+    # seconds spent in each phase, see `PHASES`
+    timings: dict[str, float] = field(default_factory=dict)
+    # e.g. children, crossovers, genes_flipped, evaluations
+    counters: dict[str, int] = field(default_factory=dict)
+    # peak traced memory in bytes during the generation, only set in "tracemalloc" mode
+    peak_memory: int | None = None
+
+    def add_time(self, phase: str, seconds: float):
+        """Add `seconds` to the time spent in `phase`."""
+        self.timings[phase] = self.timings.get(phase, 0.0) + seconds
+
+    def count(self, counter: str, n: int = 1):
+        """Add `n` to `counter`."""
+        self.counters[counter] = self.counters.get(counter, 0) + n
+
+
+class MetricsRecorder:
+    """
+    A hook that keeps the metrics of every generation.
+
+    Pass it in `GeneticAlgorithm(hooks=[...])`, then inspect `history` or the totals
+    after the run.
+    """
+
+    def __init__(self):
+        self.history: list[GenerationMetrics] = []
+
+    def __call__(self, metrics: GenerationMetrics):
+        self.history.append(metrics)
+
+    def total_timings(self) -> dict[str, float]:
+        """Return the seconds spent in each phase over all recorded generations."""
+        totals = {}
+        for metrics in self.history:
+            for phase, seconds in metrics.timings.items():
+                totals[phase] = totals.get(phase, 0.0) + seconds
+        return totals
+
+    def total_counters(self) -> dict[str, int]:
+        """Return every counter summed over all recorded generations."""
+        totals = {}
+        for metrics in self.history:
+            for counter, n in metrics.counters.items():
+                totals[counter] = totals.get(counter, 0) + n
+        return totals
+
+
+Hook = Callable[[GenerationMetrics], None]
+
+
+class Profiler:
+    """
+    Opt-in capture of a whole run with cProfile or tracemalloc.
+
+    cProfile is paused between generations, so only the algorithm's own work is
+    profiled, not the code consuming `iter_generations()`. tracemalloc cannot be
+    paused without discarding its traces, so allocations made by the consumer are
+    traced too. Only its peak is reset as each generation starts, so `peak_memory()`
+    covers a single generation.
+    """
+
+    def __init__(self, mode: str):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"'profile' must be one of {PROFILE_MODES}")
+
+        self.mode = mode
+        self._profile = cProfile.Profile() if mode == "cprofile" else None
+        # whether this profiler started tracemalloc, and so should stop it
+        self._owns_tracing = False
+
+    def start(self):
+        if self._profile is not None:
+            self._profile.enable()
+        elif not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+
+    def pause(self):
+        if self._profile is not None:
+            self._profile.disable()
+
+    def resume(self):
+        if self._profile is not None:
+            self._profile.enable()
+        else:
+            tracemalloc.reset_peak()
+
+    def peak_memory(self) -> int | None:
+        """Return the peak traced memory since the last `resume()`, in tracemalloc mode."""
+        if self._profile is not None:
+            return None
+        return tracemalloc.get_traced_memory()[1]
+
+    def stop(self) -> pstats.Stats | tracemalloc.Snapshot:
+        """Stop capturing and return the cProfile statistics or tracemalloc snapshot."""
+        if self._profile is not None:
+            self._profile.disable()
+            return pstats.Stats(self._profile)
+
+        snapshot = tracemalloc.take_snapshot()
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+        return snapshot
+
@@ -0,0 +1,342 @@
+import logging
+import math
+import multiprocessing
+import os
+from dataclasses import dataclass
+from typing import Literal
+
+from one_max_ga.algorithm import GeneticAlgorithm
+from one_max_ga.rng import make_rng, spawn
+
+
+class IslandModel:
+    """
+    Run several `GeneticAlgorithm` sub-populations ("islands") in worker processes.
+
+    Every `migration_interval` generations each island sends copies of its `migrants`
+    fittest chromosomes to its neighbours, where they replace the least fit members.
+    Each island's algorithm stays in one worker process for the whole run, so its
+    generation counter, terminator and fitness evaluator carry over between
+    migrations. Only the migrants travel between processes, as packed genomes (one
+    bit per gene) with their fitness, so they are never evaluated again.
+    """
+
+    def __init__(
+        self,
+        n_islands: int,
+        migration_interval: int,
+        migrants: int = 1,
+        topology: Literal["ring", "full"] = "ring",
+        workers: int | None = None,
+        seed: int | None = None,
+        **ga_kwargs,
+    ):
+        """
+        Parameters
+        ----------
+        n_islands : int
+            The number of sub-populations.
+        migration_interval : int
+            The number of generations each island runs between migrations.
+        migrants : int, optional
+            The number of chromosomes each island receives per migration. Default is 1.
+        topology : {'ring', 'full'}, optional
+            Which islands exchange migrants. Default is 'ring'.
+
+            - 'ring': Each island sends to the next island in a ring.
+            - 'full': Each island sends to every other island, and keeps the fittest
+              of everything it receives.
+        workers : int, optional
+            The number of worker processes, each running a share of the islands.
+            Default is one per CPU, and at most one per island.
+        seed : int, optional
+            Seed for reproducible runs.
+        **ga_kwargs
+            Arguments for each island's `GeneticAlgorithm`, e.g. `pop_size`,
+            `chromosome_length`, `crossover_rate`, `mutation_rate`. `max_generations`
+            is the total number of generations each island runs, and a `terminator`
+            stops the whole model once it is met on any island. They must be
+            picklable.
+        """
+        if not isinstance(n_islands, int) or n_islands < 2:
+            raise ValueError("'n_islands' must be an integer of at least 2.")
+        if not isinstance(migration_interval, int) or migration_interval <= 0:
+            raise ValueError("'migration_interval' must be a positive integer.")
+        if topology not in ["ring", "full"]:
+            raise ValueError(f"topology '{topology}' is not a valid option.")
+        if workers is not None and (not isinstance(workers, int) or workers <= 0):
+            raise ValueError("'workers' must be a positive integer.")
+
+        # validates the remaining arguments before any process is started
+        template = GeneticAlgorithm(**ga_kwargs)
+        if not (0 <= migrants < template.pop_size):
+            raise ValueError("'migrants' must be between 0 and the population size.")
+
+        self.n_islands = n_islands
+        self.migration_interval = migration_interval
+        self.migrants = migrants
+        self.topology = topology
+        self.workers = workers
+        self.seed = seed
+        self.ga_kwargs = ga_kwargs
+        self._template = template
+        self.max_generations = template.max_generations
+        self.chromosome_length = template.chromosome_length
+
+        self.generation = 0
+        self.evaluations = 0
+        self.best_fitness = None
+        self.best = None
+        self.reason = ""
+
+        # attatch logger
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def run(self):
+        """
+        Run every island until `max_generations`, migrating between them as configured.
+
+        If an island's terminator is met, that island stops and the model stops at the
+        end of the epoch. `self.generation` is then the furthest any island got.
+
+        Returns
+        -------
+        OneMaxChromosome or PackedOneMaxChromosome
+            The fittest chromosome seen on any island, also kept in `self.best`.
+        """
+        self.generation = 0
+        self.evaluations = 0
+        self.best_fitness = None
+        self.best = None
+        self.reason = ""
+
+        # an independent stream per island, seeding its island's algorithm
+        streams = spawn(make_rng(self.seed), self.n_islands)
+        seeds = [stream.getrandbits(64) for stream in streams]
+        # the islands are dealt out to the workers, each keeping its islands for the
+        # whole run
+        n_workers = min(self.workers or os.cpu_count() or 1, self.n_islands)
+        hosts = [range(w, self.n_islands, n_workers) for w in range(n_workers)]
+
+        context = multiprocessing.get_context()
+        connections = []
+        processes = []
+        try:
+            for hosted in hosts:
+                connection, child = context.Pipe()
+                process = context.Process(
+                    target=_island_worker,
+                    args=(
+                        child,
+                        self.ga_kwargs,
+                        self.migrants,
+                        {i: seeds[i] for i in hosted},
+                    ),
+                    daemon=True,
+                )
+                process.start()
+                child.close()
+                connections.append(connection)
+                processes.append(process)
+
+            self._run_epochs(connections, hosts)
+        finally:
+            for connection in connections:
+                try:
+                    connection.send(None)
+                except OSError:
+                    # the worker has already stopped
+                    pass
+                connection.close()
+            for process in processes:
+                process.join()
+
+        self.logger.info(f"Best fitness across islands: {self.best_fitness}")
+        return self.best
+
+    def _run_epochs(self, connections: list, hosts: list[range]):
+        """Evolve the islands epoch by epoch until they terminate."""
+        epochs = math.ceil(self.max_generations / self.migration_interval)
+        # migrants waiting to join each island, none before the first epoch
+        incoming = [None] * self.n_islands
+
+        for epoch in range(epochs):
+            generations = min(
+                self.migration_interval, self.max_generations - self.generation
+            )
+            self.logger.info(
+                f"Running epoch {epoch + 1} of {epochs} ({generations} generations)"
+            )
+
+            for connection, hosted in zip(connections, hosts):
+                connection.send((generations, {i: incoming[i] for i in hosted}))
+            reports = [None] * self.n_islands
+            for connection in connections:
+                reply = connection.recv()
+                if isinstance(reply, Exception):
+                    raise reply
+                for i, report in reply.items():
+                    reports[i] = report
+
+            self.generation = max(report.generation for report in reports)
+            self.evaluations = sum(report.evaluations for report in reports)
+            self._record_best(reports)
+
+            reasons = [report.reason for report in reports if report.reason]
+            if reasons:
+                self.reason = reasons[0]
+                self.logger.info(f"Terminating: {self.reason}")
+                return
+
+            incoming = self._migrate(reports)
+
+    def _record_best(self, reports: list["_Report"]):
+        """Update the best-of-run from each island's best-of-run."""
+        for report in reports:
+            if self.best_fitness is None or report.best_fitness > self.best_fitness:
+                self.best_fitness = report.best_fitness
+                self.best = self._template._population_from_bytes(report.best).best()
+
+    def _migrate(
+        self, reports: list["_Report"]
+    ) -> list[tuple[bytes, list[float]] | None]:
+        """
+        Choose the migrants joining each island, as packed rows and their fitness.
+
+        Each island reports its migrants fittest first.
+        """
+        if self.migrants == 0:
+            return [None] * len(reports)
+
+        row_bytes = (self.chromosome_length + 7) // 8
+
+        incoming = []
+        for i in range(len(reports)):
+            if self.topology == "ring":
+                # receive from the previous island in the ring
+                source = reports[i - 1]
+                incoming.append((source.migrants, source.scores))
+                continue
+
+            # pool every other island's migrants and keep the fittest
+            candidates = []
+            for j, source in enumerate(reports):
+                if j == i:
+                    continue
+                for m, score in enumerate(source.scores):
+                    row = source.migrants[m * row_bytes : (m + 1) * row_bytes]
+                    candidates.append((score, row))
+            candidates.sort(key=lambda c: c[0], reverse=True)
+            kept = candidates[: self.migrants]
+            incoming.append(
+                (b"".join(row for _, row in kept), [score for score, _ in kept])
+            )
+
+        return incoming
+
+
+@dataclass(frozen=True, slots=True)
+class _Report:
+    """What an island sends back to the model after each epoch."""
+
+    # the island's fittest packed rows, fittest first, and their fitness
+    migrants: bytes
+    scores: list[float]
+    # the island's best-of-run, packed, and its fitness
+    best: bytes
+    best_fitness: float
+    generation: int
+    evaluations: int
+    # why the island's terminator stopped it, empty while it is running
+    reason: str
+
+
+class _Island:
+    """An island's `GeneticAlgorithm`, kept in a worker process between epochs."""
+
+    def __init__(self, ga_kwargs: dict, seed: int | None, migrants: int):
+        self.ga = GeneticAlgorithm(**{**ga_kwargs, "rng": seed})
+        self.migrants = migrants
+        self.terminated = False
+
+    def evolve(
+        self, generations: int, incoming: tuple[bytes, list[float]] | None = None
+    ) -> _Report:
+        """Take in `incoming` migrants, then run up to `generations` generations."""
+        ga = self.ga
+        if ga.population is None:
+            # the first epoch creates and evaluates the initial population
+            self._step()
+        elif incoming is not None and not self.terminated:
+            genomes, scores = incoming
+            migrants = ga._population_from_bytes(genomes)
+            # custom fitness is carried with the migrants, One-Max is recounted
+            ga.population.replace_least_fit(
+                migrants, scores if ga.evaluator is not None else None
+            )
+            # steady-state replacement ranks the population again
+            ga._ranked = None
+
+        for _ in range(generations):
+            if self.terminated:
+                break
+            self._step()
+
+        return self._report()
+
+    def _step(self):
+        stats = self.ga.step()
+        self.terminated = self.ga._terminated(stats)
+
+    def _report(self) -> _Report:
+        ga = self.ga
+        genomes, scores = b"", []
+        if self.migrants:
+            fittest = ga.population.fittest(self.migrants)
+            # fittest() of the array backends is in no particular order
+            fittest.sort_by_fitness()
+            genomes, scores = fittest.to_bytes(), fittest.fitness()
+            # plain Python numbers, keeping a custom fitness's fractional scores
+            if hasattr(scores, "tolist"):
+                scores = scores.tolist()
+
+        return _Report(
+            migrants=genomes,
+            scores=list(scores),
+            best=ga.best.to_bytes(),
+            best_fitness=ga.best_fitness,
+            generation=ga.generation,
+            evaluations=ga.evaluations,
+            reason=ga._termination_reason() if self.terminated else "",
+        )
+
+
+def _island_worker(
+    connection, ga_kwargs: dict, migrants: int, seeds: dict[int, int]
+):
+    """
+    Host islands in a worker process until the model sends None.
+
+    Each command is the number of generations to run and the migrants joining each
+    hosted island. The reply maps each island to its `_Report`, or is the exception
+    raised by the epoch.
+    """
+    islands = {}
+    try:
+        for generations, incoming in iter(connection.recv, None):
+            if not islands:
+                islands = {
+                    i: _Island(ga_kwargs, seed, migrants) for i, seed in seeds.items()
+                }
+            reports = {
+                i: island.evolve(generations, incoming[i])
+                for i, island in islands.items()
+            }
+            connection.send(reports)
+    except Exception as error:
+        connection.send(error)
+    finally:
+        for island in islands.values():
+            if island.ga.evaluator is not None:
+                island.ga.evaluator.close()
+        connection.close()
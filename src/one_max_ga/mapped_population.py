@@ -0,0 +1,551 @@
+import mmap
+import os
+import tempfile
+import time
+from collections.abc import Sequence
+from typing import Literal, Self
+
+import numpy as np
+
+from one_max_ga.chromosome import SPARSE_MUTATION_THRESHOLD, PackedOneMaxChromosome
+from one_max_ga.instrumentation import GenerationMetrics
+
+# bytes of the genome matrix processed at once, the working memory of every
+# operation is a small multiple of this regardless of the population's size
+CHUNK_SIZE = 2**18
+
+# the number of '1's in every byte value
+_POPCOUNT = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
+
+class MappedPopulation:
+    """
+    A population whose packed genomes live in a memory-mapped file.
+
+    Each chromosome is a row of packed bits, see `OneMaxChromosome.to_bytes`, in a
+    temporary file that is deleted once the population is garbage collected. Every
+    operation streams the file in tiles of about `chunk_size` bytes, so resident
+    memory stays bounded however long the chromosomes are, and pages of the file are
+    left to the operating system to cache and write back.
+
+    The One-Max fitness of every chromosome is kept in memory and maintained as the
+    population is bred: a copied child inherits its parent's count, adjusted for each
+    gene its mutation flips, and a crossover child is counted tile by tile as it is
+    written. Evaluating a generation never re-reads the file.
+
+    `chromosomes`, `best()` and `random()` build a `PackedOneMaxChromosome` per
+    chromosome accessed, and `to_bytes()` packs the whole population into memory, so
+    custom fitness functions, history recording and process pools are not out of
+    core.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        chromosome_length: int,
+        rng: np.random.Generator | None = None,
+        directory: str | os.PathLike | None = None,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        """
+        Parameters
+        ----------
+        size : int
+            The number of chromosomes.
+        chromosome_length : int
+            The number of genes in each chromosome.
+        rng : numpy.random.Generator, optional
+            The random number generator. Default is a new, unseeded generator.
+        directory : str or PathLike, optional
+            Where the genome file is created. Default is the system's temporary
+            directory, which should be on disk rather than in memory (e.g. tmpfs).
+        chunk_size : int, optional
+            The bytes of genomes processed at once. Default is 256 KiB.
+        """
+        self._allocate(size, chromosome_length, rng, directory, chunk_size)
+
+        tail = self._tail_mask()
+        for rows, columns in self._tiles():
+            shape = (rows.stop - rows.start, columns.stop - columns.start)
+            block = self.rng.integers(0, 256, size=shape, dtype=np.uint8)
+            if columns.stop == self.row_bytes:
+                block[:, -1] &= tail
+            self.genes[rows, columns] = block
+            self.counts[rows] += _popcount(block)
+
+    @classmethod
+    def _empty(cls, size: int, chromosome_length: int, *args) -> Self:
+        """Create a population of zeroed chromosomes, without drawing any genes."""
+        pop = cls.__new__(cls)
+        pop._allocate(size, chromosome_length, *args)
+        return pop
+
+    def _allocate(
+        self,
+        size: int,
+        chromosome_length: int,
+        rng: np.random.Generator | None = None,
+        directory: str | os.PathLike | None = None,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        """Map a zero-filled genome file, see `__init__` for the parameters."""
+        if not isinstance(size, int):
+            raise ValueError("'size' must be an integer.")
+        if not isinstance(chromosome_length, int) or chromosome_length <= 0:
+            raise ValueError("'chromosome_length' must be a positive integer.")
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError("'chunk_size' must be a positive integer.")
+
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.size = size
+        self.chromosome_length = chromosome_length
+        self.row_bytes = (chromosome_length + 7) // 8
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.genes = _map_file((size, self.row_bytes), directory)
+        # the One-Max fitness of every row, maintained as the genes are written
+        self.counts = np.zeros(size, dtype=np.int64)
+        # fitness from a custom evaluator, see evaluate()
+        self.scores = None
+
+    def _like(self, size: int) -> Self:
+        """Create an empty population of `size` stored and chunked like this one."""
+        return self._empty(
+            size, self.chromosome_length, self.rng, self.directory, self.chunk_size
+        )
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        chromosome_length: int,
+        rng: np.random.Generator | None = None,
+        directory: str | os.PathLike | None = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> Self:
+        """
+        Create a population from bytes produced by `to_bytes()`.
+
+        `data` may be any buffer, e.g. a memory-mapped checkpoint, and is copied into
+        the population's file chunk by chunk.
+        """
+        row_bytes = (chromosome_length + 7) // 8
+        if len(data) % row_bytes:
+            raise ValueError("'data' is not a whole number of packed chromosomes.")
+
+        packed = np.frombuffer(data, dtype=np.uint8).reshape(-1, row_bytes)
+        pop = cls._empty(packed.shape[0], chromosome_length, rng, directory, chunk_size)
+        for rows, columns in pop._tiles():
+            block = packed[rows, columns]
+            pop.genes[rows, columns] = block
+            pop.counts[rows] += _popcount(block)
+        return pop
+
+    def to_bytes(self) -> bytes:
+        """
+        Pack the population into bytes, one fixed-size packed row per chromosome.
+
+        The layout matches `Population.to_bytes`. The whole population is copied into
+        memory, use `write_bytes()` to stream it to a file instead.
+        """
+        return self.genes.tobytes()
+
+    def write_bytes(self, file):
+        """Write `to_bytes()` to a binary file, `chunk_size` bytes at a time."""
+        flat = self.genes.reshape(-1)
+        for start in range(0, flat.size, self.chunk_size):
+            file.write(flat[start : start + self.chunk_size])
+
+    @property
+    def chromosomes(self) -> "MappedChromosomes":
+        """The rows as `PackedOneMaxChromosome`s, read from the file when accessed."""
+        return MappedChromosomes(self)
+
+    def __getitem__(self, indices) -> Self:
+
+        # keep a single row 2-D so the result is still a population
+        if isinstance(indices, int):
+            indices = slice(indices, indices + 1 or None)
+
+        return self._select(indices)
+
+    def __len__(self):
+        return self.genes.shape[0]
+
+    def _select(self, indices) -> Self:
+        """Copy the rows at `indices`, with their fitness, into a new population."""
+        rows = np.arange(len(self))[indices]
+        pop = self._like(len(rows))
+        for tile_rows, columns in pop._tiles():
+            pop.genes[tile_rows, columns] = self.genes[rows[tile_rows], columns]
+        pop.counts[:] = self.counts[rows]
+        if self.scores is not None:
+            pop.scores = self.scores[rows]
+        return pop
+
+    def _chromosome(self, row: int) -> PackedOneMaxChromosome:
+        return PackedOneMaxChromosome.from_bytes(
+            self.genes[row].tobytes(), self.chromosome_length
+        )
+
+    def evaluate(self, evaluator) -> np.ndarray:
+        """
+        Score every chromosome with a custom fitness evaluator.
+
+        The scores replace the built-in One-Max fitness, see `Population.evaluate`.
+        """
+        return self._set_scores(evaluator.evaluate(self))
+
+    async def aevaluate(self, evaluator) -> np.ndarray:
+        """Score every chromosome with an `AsyncEvaluator`, see `evaluate()`."""
+        return self._set_scores(await evaluator.evaluate(self))
+
+    def _set_scores(self, scores) -> np.ndarray:
+        scores = np.asarray(scores, dtype=np.float64)
+        if scores.shape != (len(self),):
+            raise ValueError(
+                f"Evaluator returned {scores.size} scores for {len(self)} chromosomes."
+            )
+
+        self.scores = scores
+        return scores
+
+    def fitness(self) -> np.ndarray:
+        """Return the fitness (number of '1's) of every chromosome as a 1-D array."""
+        if self.scores is not None:
+            return self.scores
+        return self.counts
+
+    def sort_by_fitness(self, reverse: bool = True) -> np.ndarray:
+
+        order = np.argsort(self.fitness(), kind="stable")
+        if reverse:
+            order = order[::-1]
+
+        # rows are moved by copying them, in order, into a new file
+        ordered = self._select(order)
+        self.genes = ordered.genes
+        self.counts = ordered.counts
+        self.scores = ordered.scores
+        return self.genes
+
+    def fittest(self, n: int) -> Self:
+        """
+        Return a copy of the `n` fittest chromosomes, in no particular order.
+
+        Uses a partial sort so the cost is linear in the population size.
+        """
+        if n > len(self):
+            raise ValueError("'n' cannot be greater than the population size.")
+
+        if n == len(self):
+            return self._select(slice(None))
+
+        top = np.argpartition(self.fitness(), len(self) - n)[len(self) - n :]
+        return self._select(top)
+
+    def random(self, k=1) -> list[PackedOneMaxChromosome]:
+        if k > len(self):
+            raise ValueError("'k' cannot be greater than the population size.")
+
+        rows = self.rng.choice(len(self), size=k, replace=False)
+        return [self._chromosome(row) for row in rows.tolist()]
+
+    def replace_least_fit(self, migrants: Self, scores: Sequence[float] | None = None):
+        """
+        Overwrite the least fit rows with the rows of `migrants`, in place.
+
+        See `Population.replace_least_fit`.
+        """
+        n = len(migrants)
+        if n > len(self):
+            raise ValueError("'migrants' cannot be larger than the population.")
+        if self.scores is not None and (scores is None or len(scores) != n):
+            raise ValueError("'scores' must hold a score for every migrant.")
+        if n == 0:
+            return
+
+        rows = np.argpartition(self.fitness(), n - 1)[:n]
+        self.genes[rows] = migrants.genes
+        self.counts[rows] = migrants.counts
+        if self.scores is not None:
+            self.scores[rows] = scores
+
+    def best(self) -> PackedOneMaxChromosome:
+        return self._chromosome(int(np.argmax(self.fitness())))
+
+    def breed(
+        self,
+        size: int,
+        crossover_rate: float,
+        mutation_rate: float,
+        metrics: GenerationMetrics | None = None,
+        crossover_method: Literal["uniform", "single", "two"] = "uniform",
+        out: Self | None = None,
+        parents: tuple[np.ndarray, np.ndarray] | None = None,
+        elites: Self | None = None,
+    ) -> Self:
+        """
+        Breed a new population of `size` children from this population's chromosomes.
+
+        See `ArrayPopulation.breed`. The children are bred a tile at a time: the tile
+        of every parent is read from the file, crossed over and mutated on its packed
+        bytes, then written to the children's file, so no whole chromosome is ever
+        held in memory.
+
+        Parameters
+        ----------
+        size : int
+            The number of children to breed.
+        crossover_rate : float
+            The probability of a child being produced by crossover.
+        mutation_rate : float
+            The probability of each gene mutating.
+        metrics : GenerationMetrics, optional
+            Where to record the time spent in each phase and the operation counts.
+        crossover_method : {'uniform', 'single', 'two'}, optional
+            The crossover method, see `OneMaxChromosome.crossover`. Default is
+            'uniform'.
+        out : MappedPopulation, optional
+            An existing population of `size` rows to write the children into, reusing
+            its file. It must not share genes with this population.
+        parents : tuple of numpy.ndarray, optional
+            The rows of each child's first and second parent, see
+            `ArrayPopulation.breed`.
+        elites : MappedPopulation, optional
+            Chromosomes copied unchanged into the last children, in place of the
+            children bred from the last parents.
+
+        Returns
+        -------
+        Self
+            The new population, `out` if given.
+        """
+        clock = time.perf_counter
+        tick = clock()
+
+        n_parents = len(self)
+        if n_parents < 2:
+            raise ValueError("At least 2 parents are required to breed.")
+        if crossover_method not in ["uniform", "single", "two"]:
+            raise ValueError(f"method '{crossover_method}' is not a valid option.")
+        if out is not None and out.genes.shape != (size, self.row_bytes):
+            raise ValueError(
+                f"'out' must have shape {(size, self.row_bytes)}, "
+                f"not {out.genes.shape}."
+            )
+
+        if parents is not None:
+            first, second = parents
+            if first.shape != (size,) or second.shape != (size,):
+                raise ValueError(f"'parents' must be two arrays of {size} rows.")
+        else:
+            # first parent of every child, and a distinct second parent for crossover
+            first = self.rng.integers(0, n_parents, size=size)
+            second = (first + self.rng.integers(1, n_parents, size=size)) % n_parents
+
+        # the children bred from parents, the rest are copies of the elites
+        n_bred = size - (0 if elites is None else len(elites))
+        crossover = self.rng.random(size) < crossover_rate
+        crossover[n_bred:] = False
+        if crossover_method != "uniform":
+            start, end = _cut_points(
+                self.rng, size, self.chromosome_length, crossover_method
+            )
+
+        # fitness is inherited by copies, and counted as crossover children are written
+        counts = np.where(crossover, 0, self.counts[first])
+        if elites is not None:
+            counts[n_bred:] = elites.counts
+
+        children = self._like(size) if out is None else out
+        phases = ["sample_parents", "crossover", "mutate", "rebuild"]
+        timings = dict.fromkeys(phases, 0.0)
+        timings["sample_parents"] = clock() - tick
+        n_flips = 0
+
+        for rows, columns in self._tiles(size):
+            tick = clock()
+            bred = slice(rows.start, min(rows.stop, n_bred))
+            n_tile_bred = max(0, bred.stop - bred.start)
+            block = np.empty(
+                (rows.stop - rows.start, columns.stop - columns.start), dtype=np.uint8
+            )
+            block[:n_tile_bred] = self.genes[first[bred], columns]
+            if n_tile_bred < len(block):
+                copied = slice(rows.start + n_tile_bred - n_bred, rows.stop - n_bred)
+                block[n_tile_bred:] = elites.genes[copied, columns]
+            now = clock()
+            timings["sample_parents"] += now - tick
+            tick = now
+
+            # crossover: take the bits set in the mask from the second parent
+            crossed = np.flatnonzero(crossover[rows])
+            if len(crossed):
+                shape = (len(crossed), columns.stop - columns.start)
+                if crossover_method == "uniform":
+                    mask = self.rng.integers(0, 256, size=shape, dtype=np.uint8)
+                else:
+                    mask = _segment_bytes(
+                        start[rows][crossed], end[rows][crossed], columns
+                    )
+                donors = self.genes[second[rows][crossed], columns]
+                block[crossed] = (block[crossed] & ~mask) | (donors & mask)
+            now = clock()
+            timings["crossover"] += now - tick
+            tick = now
+
+            if n_tile_bred and mutation_rate > 0:
+                delta, flipped = self._mutate_tile(
+                    block[:n_tile_bred], columns, mutation_rate
+                )
+                # crossover children are counted in full below
+                delta[crossover[bred]] = 0
+                counts[bred] += delta
+                n_flips += flipped
+            now = clock()
+            timings["mutate"] += now - tick
+            tick = now
+
+            if len(crossed):
+                counts[rows.start + crossed] += _popcount(block[crossed])
+            children.genes[rows, columns] = block
+            timings["rebuild"] += clock() - tick
+
+        children.counts = counts
+        children.rng = self.rng
+        children.scores = None
+
+        if metrics is not None:
+            for phase, seconds in timings.items():
+                metrics.add_time(phase, seconds)
+            metrics.count("children", n_bred)
+            metrics.count("crossovers", int(crossover.sum()))
+            metrics.count("genes_flipped", int(n_flips))
+        return children
+
+    def _mutate_tile(
+        self, block: np.ndarray, columns: slice, mutation_rate: float
+    ) -> tuple[np.ndarray, int]:
+        """
+        Flip each gene of a tile of bred children with probability `mutation_rate`.
+
+        Returns the change in fitness of each row, and the number of genes flipped.
+        """
+        rows = len(block)
+        # the genes in the tile, excluding the padding of the last byte
+        first_gene = columns.start * 8
+        n_genes = min(columns.stop * 8, self.chromosome_length) - first_gene
+
+        if mutation_rate < SPARSE_MUTATION_THRESHOLD:
+            # a binomial number of distinct positions has the same per-gene
+            # distribution as the full mask, but only the flips are drawn
+            n_flips = self.rng.binomial(rows * n_genes, mutation_rate)
+            positions = self.rng.choice(rows * n_genes, size=n_flips, replace=False)
+            row, gene = np.divmod(positions, n_genes)
+            byte, bit = np.divmod(gene, 8)
+            flips = np.left_shift(1, bit).astype(np.uint8)
+            np.bitwise_xor.at(block, (row, byte), flips)
+            # +1 for each gene now set, -1 for each now cleared
+            gained = (block[row, byte] >> bit) & 1
+            delta = np.bincount(row, weights=2 * gained - 1.0, minlength=rows)
+            return delta.astype(np.int64), int(n_flips)
+
+        flips = self.rng.random((rows, n_genes), dtype=np.float32) < mutation_rate
+        mask = np.packbits(flips, axis=1, bitorder="little")
+        block ^= mask
+        flipped = _popcount(mask)
+        return 2 * _popcount(block & mask) - flipped, int(flipped.sum())
+
+    def _tiles(self, size: int | None = None):
+        """
+        Yield the `(rows, columns)` slices of the genome matrix in `chunk_size` tiles.
+
+        `size` is the number of rows to cover, default the whole population.
+
+        Tiles span at least a page of each row, so reads and writes of the file
+        cover whole pages, and all the rows of a column range are visited before the
+        next one.
+        """
+        size = len(self) if size is None else size
+        row_bytes = self.row_bytes
+        width = min(row_bytes, max(mmap.PAGESIZE, self.chunk_size // max(size, 1)))
+        height = max(1, self.chunk_size // width)
+        for column in range(0, row_bytes, width):
+            columns = slice(column, min(column + width, row_bytes))
+            for row in range(0, size, height):
+                yield slice(row, min(row + height, size)), columns
+
+    def _tail_mask(self) -> int:
+        """The bits of a row's last byte that hold genes rather than padding."""
+        return (1 << (self.chromosome_length % 8 or 8)) - 1
+
+
+class MappedChromosomes(Sequence):
+    """
+    The chromosomes of a `MappedPopulation`, read from its file when accessed.
+
+    Each access builds a new `PackedOneMaxChromosome`, so only the chromosomes in use
+    are held in memory.
+    """
+
+    def __init__(self, population: MappedPopulation):
+        self.population = population
+
+    def __len__(self):
+        return len(self.population)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not (0 <= index < len(self)):
+            raise IndexError("chromosome index out of range")
+        return self.population._chromosome(index)
+
+
+def _map_file(shape: tuple[int, int], directory) -> np.ndarray:
+    """Map a zero-filled uint8 matrix of `shape` onto a new temporary file."""
+    if 0 in shape:
+        # empty files cannot be mapped
+        return np.zeros(shape, dtype=np.uint8)
+
+    # the file is unlinked straight away, its mapping keeps it alive until released
+    with tempfile.TemporaryFile(dir=directory) as file:
+        return np.memmap(file, dtype=np.uint8, mode="w+", shape=shape)
+
+
+def _popcount(block: np.ndarray) -> np.ndarray:
+    """Return the number of set bits in each row of a packed block."""
+    return _POPCOUNT[block].sum(axis=1, dtype=np.int64)
+
+
+def _cut_points(
+    rng: np.random.Generator, size: int, length: int, method: str
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Draw the genes `[start, end)` each child takes from its second parent.
+
+    Cut points lie in [1, length - 1], as in `ArrayPopulation._segment_mask`. 'single'
+    takes everything from its cut onwards, 'two' the genes between distinct cuts.
+    """
+    if length < 2:
+        empty = np.full(size, length)
+        return empty, empty
+
+    start = rng.integers(1, length, size=size)
+    if method == "single" or length < 3:
+        return start, np.full(size, length)
+
+    # a distinct second cut, drawn from the remaining points
+    end = rng.integers(1, length - 1, size=size)
+    end += end >= start
+    return np.minimum(start, end), np.maximum(start, end)
+
+
+def _segment_bytes(start: np.ndarray, end: np.ndarray, columns: slice) -> np.ndarray:
+    """Pack the mask of the genes `[start, end)` of each row, over bytes `columns`."""
+    genes = np.arange(columns.start * 8, columns.stop * 8)
+    mask = (genes >= start[:, None]) & (genes < end[:, None])
+    return np.packbits(mask, axis=1, bitorder="little")
@@ -1,55 +1,228 @@
+import heapq
 import random
+from random import Random
 from typing import Self
-from one_max_ga.chromosome import OneMaxChromosome
+from one_max_ga.chromosome import OneMaxChromosome, PackedOneMaxChromosome
 
 
 class Population:
 
-    def __init__(self, size: int, chromosome_length: int):
+    def __init__(
+        self,
+        size: int,
+        chromosome_length: int,
+        chromosome_cls: type[OneMaxChromosome | PackedOneMaxChromosome] = OneMaxChromosome,
+        rng: Random = None,
+    ):
 
         if not isinstance(size, int):
             raise ValueError("'size' must be an integer.")
 
         self.size = size
+        # random number generator for generating and sampling chromosomes
+        # defaults to the random module, see one_max_ga.rng
+        self.rng = random if rng is None else rng
         self.chromosomes = [
-            OneMaxChromosome(length=chromosome_length) for _ in range(size)
+            chromosome_cls(length=chromosome_length, rng=self.rng) for _ in range(size)
         ]
+        # fitness from a custom evaluator, see evaluate()
+        self.scores = None
 
     def __getitem__(self, indices) -> Self:
 
         # from_chromosomes() expects a list
         # single value indexing a list returns the member, NOT in a list
+        # slicing only copies the references, the chromosomes themselves are shared
         if isinstance(indices, int):
-            new_pop = Population.from_chromosomes([self.chromosomes[indices]])
+            new_pop = Population.from_chromosomes(
+                [self.chromosomes[indices]], rng=self.rng
+            )
+            if self.scores is not None:
+                new_pop.scores = [self.scores[indices]]
+        elif isinstance(indices, list):
+            # a list of positions selects those members, as with a numpy array
+            new_pop = Population.from_chromosomes(
+                [self.chromosomes[i] for i in indices], rng=self.rng
+            )
+            if self.scores is not None:
+                new_pop.scores = [self.scores[i] for i in indices]
         else:
-            new_pop = Population.from_chromosomes(self.chromosomes[indices])
+            new_pop = Population.from_chromosomes(self.chromosomes[indices], rng=self.rng)
+            if self.scores is not None:
+                new_pop.scores = self.scores[indices]
 
         return new_pop
 
     def __len__(self):
         return len(self.chromosomes)
 
+    @property
+    def chromosome_length(self) -> int:
+        return len(self.chromosomes[0]) if self.chromosomes else 0
+
+    def evaluate(self, evaluator) -> list[float]:
+        """
+        Score every chromosome with a custom fitness evaluator.
+
+        The scores replace the built-in One-Max fitness in `fitness()`, `fittest()`,
+        `best()` and `sort_by_fitness()`.
+
+        Parameters
+        ----------
+        evaluator : Evaluator
+            The evaluator to score the population with.
+
+        Returns
+        -------
+        list[float]
+            The scores, in population order.
+        """
+        return self._set_scores(evaluator.evaluate(self))
+
+    async def aevaluate(self, evaluator) -> list[float]:
+        """Score every chromosome with an `AsyncEvaluator`, see `evaluate()`."""
+        return self._set_scores(await evaluator.evaluate(self))
+
+    def _set_scores(self, scores) -> list[float]:
+        scores = list(scores)
+        if len(scores) != len(self):
+            raise ValueError(
+                f"Evaluator returned {len(scores)} scores for {len(self)} chromosomes."
+            )
+
+        self.scores = scores
+        return scores
+
+    def fitness(self) -> list[int]:
+        """Return the fitness of every chromosome, in population order."""
+        if self.scores is not None:
+            return self.scores
+        return [c.fitness() for c in self.chromosomes]
+
     def sort_by_fitness(self, reverse: bool = True) -> list[OneMaxChromosome]:
 
+        if self.scores is not None:
+            order = sorted(
+                range(len(self)), key=self.scores.__getitem__, reverse=reverse
+            )
+            self.chromosomes = [self.chromosomes[i] for i in order]
+            self.scores = [self.scores[i] for i in order]
+            return self.chromosomes
+
         self.chromosomes.sort(key=lambda c: c.fitness(), reverse=reverse)
         return self.chromosomes
 
     def random(self, k=1) -> list[OneMaxChromosome]:
         if k > len(self):
             raise ValueError("'k' cannot be greater than the population size.")
-        return random.sample(self.chromosomes, k=k)
+        return self.rng.sample(self.chromosomes, k=k)
+
+    def fittest(self, n: int) -> Self:
+        """
+        Return the `n` fittest chromosomes, fittest first.
+
+        One-Max fitness is a bounded integer, so chromosomes are grouped into buckets
+        by fitness in a single pass and the buckets are emptied from the top. Only the
+        distinct fitness values are sorted, rather than the whole population. Custom
+        scores are selected with a partial heap sort instead.
+        """
+        if n > len(self):
+            raise ValueError("'n' cannot be greater than the population size.")
+
+        if self.scores is not None:
+            top = heapq.nlargest(n, range(len(self)), key=self.scores.__getitem__)
+            pop = Population.from_chromosomes(
+                [self.chromosomes[i] for i in top], rng=self.rng
+            )
+            pop.scores = [self.scores[i] for i in top]
+            return pop
+
+        buckets = {}
+        for chromosome in self.chromosomes:
+            buckets.setdefault(chromosome.fitness(), []).append(chromosome)
+
+        selected = []
+        for fitness in sorted(buckets, reverse=True):
+            selected.extend(buckets[fitness])
+            if len(selected) >= n:
+                break
+
+        return Population.from_chromosomes(selected[:n], rng=self.rng)
+
+    def replace_least_fit(self, migrants: Self, scores: list[float] | None = None):
+        """
+        Replace the least fit chromosomes with `migrants`, in place.
+
+        The migrants' chromosomes are used as-is, not copied. `scores` are their custom
+        fitness, required once this population has been evaluated, so the migrants are
+        not evaluated again.
+        """
+        n = len(migrants)
+        if n > len(self):
+            raise ValueError("'migrants' cannot be larger than the population.")
+        if self.scores is not None and (scores is None or len(scores) != n):
+            raise ValueError("'scores' must hold a score for every migrant.")
+
+        fitness = self.fitness()
+        positions = heapq.nsmallest(n, range(len(self)), key=fitness.__getitem__)
+        for i, chromosome in zip(positions, migrants.chromosomes):
+            self.chromosomes[i] = chromosome
+        if self.scores is not None:
+            for i, score in zip(positions, scores):
+                self.scores[i] = score
 
     def best(self) -> OneMaxChromosome:
-        return sorted(self.chromosomes, key=lambda c: c.fitness(), reverse=True)[0]
+        if self.scores is not None:
+            return self.chromosomes[max(range(len(self)), key=self.scores.__getitem__)]
+        return max(self.chromosomes, key=lambda c: c.fitness())
 
     @classmethod
-    def from_chromosomes(cls, chromosomes: list[OneMaxChromosome]) -> Self:
-
-        pop = Population(size=len(chromosomes), chromosome_length=chromosomes[0].length)
+    def from_chromosomes(
+        cls, chromosomes: list[OneMaxChromosome], rng: Random = None
+    ) -> Self:
+        """
+        Create a population around existing chromosomes.
+
+        No chromosomes are generated and the given list is used as-is, not copied.
+        """
+        pop = cls.__new__(cls)
+        pop.size = len(chromosomes)
+        pop.rng = random if rng is None else rng
         pop.chromosomes = chromosomes
+        pop.scores = None
 
         return pop
 
+    def to_bytes(self) -> bytes:
+        """
+        Pack the population into bytes, one fixed-size packed row per chromosome.
+
+        See `OneMaxChromosome.to_bytes` for the layout of each row.
+        """
+        return b"".join(c.to_bytes() for c in self.chromosomes)
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        chromosome_length: int,
+        chromosome_cls: type[OneMaxChromosome | PackedOneMaxChromosome] = OneMaxChromosome,
+        rng: Random = None,
+    ) -> Self:
+        """Create a population from bytes produced by `to_bytes()`."""
+        row_bytes = (chromosome_length + 7) // 8
+        if len(data) % row_bytes:
+            raise ValueError("'data' is not a whole number of packed chromosomes.")
+
+        data = memoryview(data)
+        return cls.from_chromosomes(
+            [
+                chromosome_cls.from_bytes(data[i : i + row_bytes], chromosome_length)
+                for i in range(0, len(data), row_bytes)
+            ],
+            rng=rng,
+        )
+
 
 if __name__ == "__main__":
 
@@ -0,0 +1,42 @@
+"""
+Random number streams.
+
+Every random draw goes through an RNG object with the interface of `random.Random`
+(`random()`, `getrandbits()`, `sample()`, ...). Operations default to the `random`
+module itself, so `random.seed()` keeps controlling code that does not pass one.
+"""
+
+import random
+
+
+def make_rng(seed: "int | random.Random | None" = None) -> random.Random:
+    """
+    Return an independent RNG.
+
+    Parameters
+    ----------
+    seed : int or random.Random, optional
+        A seed for a new stream, or an existing RNG, which is returned as-is. Default
+        is a new stream seeded from the operating system.
+    """
+    if isinstance(seed, random.Random):
+        return seed
+    return random.Random(seed)
+
+
+def spawn(rng, n: int) -> list[random.Random]:
+    """
+    Derive `n` independent RNG streams from `rng`, e.g. one per parallel worker.
+
+    Each child is seeded with 128 bits drawn from `rng`, so the children are
+    reproducible from the parent's seed but never share a stream with it or each other.
+    """
+    return [random.Random(rng.getrandbits(128)) for _ in range(n)]
+
+
+def numpy_rng(rng):
+    """Create a numpy generator seeded from `rng`, for the array backend."""
+    # deferred so numpy is only required when the array backend is used
+    import numpy as np
+
+    return np.random.default_rng(rng.getrandbits(128))
@@ -0,0 +1,224 @@
+"""
+Parent selection.
+
+A selector picks every parent of a generation from the population's fitness in one
+batched draw. Consecutive parents pair up: a child bred by crossover has parents
+`2 * i` and `2 * i + 1`, and a direct copy takes parent `2 * i`.
+
+`select()` works on a list of fitness values and an RNG with the interface of
+`random.Random`. `select_array()` is its vectorised counterpart for the numpy backend.
+"""
+
+import heapq
+import itertools
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+
+class Selector(ABC):
+    """Chooses the parents of a generation by their fitness."""
+
+    @abstractmethod
+    def select(self, fitness: Sequence[float], n: int, rng) -> list[int]:
+        """
+        Draw `n` parents.
+
+        Parameters
+        ----------
+        fitness : sequence of float
+            The fitness of every member of the population.
+        n : int
+            The number of parents to draw.
+        rng : random.Random
+            The random number generator to draw from.
+
+        Returns
+        -------
+        list of int
+            The positions of the parents in the population, in pairing order.
+        """
+        pass
+
+    @abstractmethod
+    def select_array(self, fitness, n: int, rng):
+        """Draw `n` parents, see `select()`, from a numpy array of fitness values."""
+        pass
+
+
+class TruncationSelector(Selector):
+    """
+    Draws parents uniformly from the fittest `rate` of the population.
+
+    The two parents of each pair are always distinct members.
+    """
+
+    def __init__(self, rate: float = 0.2):
+        """
+        Parameters
+        ----------
+        rate : float, optional
+            The fraction of the population eligible to breed. At least 2 members are
+            always kept. Default is 0.2.
+        """
+        if not (0 <= rate <= 1):
+            raise ValueError("'rate' must be between 0 and 1")
+        self.rate = rate
+
+    def pool_size(self, size: int) -> int:
+        """Return the number of members of a population of `size` eligible to breed."""
+        # ensure the rounded int is in the range [2, size]
+        return max(2, min(size, round(size * self.rate)))
+
+    def select(self, fitness, n, rng):
+        k = self.pool_size(len(fitness))
+        pool = heapq.nlargest(k, range(len(fitness)), key=fitness.__getitem__)
+        return self.draw(pool, n, rng)
+
+    def draw(self, pool: Sequence[int], n: int, rng) -> list[int]:
+        """Draw `n` parents uniformly from the positions in `pool`, see `select()`."""
+        k = len(pool)
+        n_pairs = (n + 1) // 2
+        # the second parent is offset from the first, so it is never the same member
+        firsts = rng.choices(range(k), k=n_pairs)
+        offsets = rng.choices(range(1, k), k=n_pairs)
+
+        positions = []
+        for first, offset in zip(firsts, offsets):
+            positions += (pool[first], pool[(first + offset) % k])
+        return positions[:n]
+
+    def select_array(self, fitness, n, rng):
+        import numpy as np
+
+        size = len(fitness)
+        k = self.pool_size(size)
+        pool = np.argpartition(fitness, size - k)[size - k :]
+
+        n_pairs = (n + 1) // 2
+        first = rng.integers(0, k, size=n_pairs)
+        second = (first + rng.integers(1, k, size=n_pairs)) % k
+        return pool[np.stack([first, second], axis=1).reshape(-1)[:n]]
+
+
+class TournamentSelector(Selector):
+    """
+    Draws each parent as the fittest of `size` members picked uniformly at random.
+
+    Larger tournaments select more strongly for fitness. The cost is independent of
+    the population size, so it suits steady-state replacement.
+    """
+
+    def __init__(self, size: int = 2):
+        """
+        Parameters
+        ----------
+        size : int, optional
+            The number of members in each tournament. Default is 2.
+        """
+        if not isinstance(size, int) or size <= 0:
+            raise ValueError("'size' must be a positive integer.")
+        self.size = size
+
+    def select(self, fitness, n, rng):
+        entrants = rng.choices(range(len(fitness)), k=n * self.size)
+        key = fitness.__getitem__
+        return [
+            max(entrants[i : i + self.size], key=key)
+            for i in range(0, len(entrants), self.size)
+        ]
+
+    def select_array(self, fitness, n, rng):
+        import numpy as np
+
+        entrants = rng.integers(0, len(fitness), size=(n, self.size))
+        return entrants[np.arange(n), fitness[entrants].argmax(axis=1)]
+
+
+class RouletteSelector(Selector):
+    """
+    Draws parents with probability proportional to their fitness.
+
+    The cumulative fitness is built once per generation, and every parent is found
+    by binary search over it (`random.choices` with `cum_weights`, or
+    `numpy.searchsorted`). Fitness must not be negative. If every member has zero
+    fitness the draw is uniform.
+    """
+
+    def select(self, fitness, n, rng):
+        cumulative = _cumulative(fitness)
+        if cumulative[-1] == 0:
+            return rng.choices(range(len(fitness)), k=n)
+        return rng.choices(range(len(fitness)), cum_weights=cumulative, k=n)
+
+    def select_array(self, fitness, n, rng):
+        cumulative = _cumulative_array(fitness)
+        if cumulative[-1] == 0:
+            return rng.integers(0, len(fitness), size=n)
+        return _search(cumulative, rng.random(n) * cumulative[-1])
+
+
+class StochasticUniversalSelector(Selector):
+    """
+    Draws parents with probability proportional to their fitness, evenly spread.
+
+    Like `RouletteSelector`, but the `n` parents come from `n` evenly spaced pointers
+    with a single random offset, so each member is drawn within one of its expected
+    number of times. The parents are shuffled before they are paired.
+    """
+
+    def select(self, fitness, n, rng):
+        cumulative = _cumulative(fitness)
+        total = cumulative[-1]
+        if total == 0:
+            return rng.choices(range(len(fitness)), k=n)
+
+        step = total / n
+        pointer = rng.random() * step
+        # the pointers are sorted, so one pass over the cumulative fitness finds all
+        positions = []
+        i = 0
+        last = len(cumulative) - 1
+        for _ in range(n):
+            # bounded, as rounding can leave the last pointer at or above the total
+            while i < last and cumulative[i] <= pointer:
+                i += 1
+            positions.append(i)
+            pointer += step
+
+        rng.shuffle(positions)
+        return positions
+
+    def select_array(self, fitness, n, rng):
+        import numpy as np
+
+        cumulative = _cumulative_array(fitness)
+        total = cumulative[-1]
+        if total == 0:
+            return rng.integers(0, len(fitness), size=n)
+
+        step = total / n
+        positions = _search(cumulative, (rng.random() + np.arange(n)) * step)
+        rng.shuffle(positions)
+        return positions
+
+
+def _cumulative(fitness: Sequence[float]) -> list[float]:
+    if min(fitness) < 0:
+        raise ValueError("Proportional selection requires non-negative fitness.")
+    return list(itertools.accumulate(fitness))
+
+
+def _cumulative_array(fitness):
+    if fitness.min() < 0:
+        raise ValueError("Proportional selection requires non-negative fitness.")
+    return fitness.cumsum(dtype=float)
+
+
+def _search(cumulative, points):
+    """Return the member each point on the cumulative fitness falls within."""
+    import numpy as np
+
+    # clipped, as rounding can leave a point at or above the total
+    return np.minimum(
+        np.searchsorted(cumulative, points, side="right"), len(cumulative) - 1
+    )
@@ -0,0 +1,60 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, slots=True)
+class GenerationStats:
+    """Summary of a single generation's population."""
+
+    generation: int
+    best_fitness: float
+    mean_fitness: float
+    min_fitness: float
+    # fitness evaluations so far in the run, including this generation
+    evaluations: int
+    # seconds spent producing and evaluating this generation
+    elapsed: float
+
+    @classmethod
+    def from_fitness(
+        cls, fitness, generation: int, evaluations: int, elapsed: float
+    ) -> "GenerationStats":
+        """Summarise a population from its fitness values (a list or numpy array)."""
+        # numpy arrays are reduced with their own methods
+        if hasattr(fitness, "mean"):
+            best = fitness.max().item()
+            mean = fitness.mean().item()
+            worst = fitness.min().item()
+        else:
+            best = max(fitness)
+            mean = sum(fitness) / len(fitness)
+            worst = min(fitness)
+
+        return cls(
+            generation=generation,
+            best_fitness=best,
+            mean_fitness=mean,
+            min_fitness=worst,
+            evaluations=evaluations,
+            elapsed=elapsed,
+        )
+
+
+@dataclass(slots=True)
+class RunResult:
+    """The outcome of `GeneticAlgorithm.run()`."""
+
+    # fittest chromosome seen during the run, not just in the final generation
+    best: object
+    best_fitness: float
+    generations: int
+    evaluations: int
+    # evaluations used by the generation first reaching `GeneticAlgorithm.optimum`,
+    # None if it was never reached
+    evaluations_to_optimum: int | None
+    # total seconds for the run
+    elapsed: float
+    # why the run stopped
+    reason: str
+    history: list[GenerationStats] = field(default_factory=list, repr=False)
+    # pstats.Stats or tracemalloc.Snapshot of the run, see `GeneticAlgorithm(profile=...)`
+    profile: object = field(default=None, repr=False)
@@ -0,0 +1,294 @@
+import itertools
+import json
+import logging
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+
+from one_max_ga.algorithm import GeneticAlgorithm
+
+
+@dataclass(frozen=True, slots=True)
+class SweepResult:
+    """The outcome of one run of a parameter sweep."""
+
+    # the swept parameters of this run
+    params: dict
+    repeat: int
+    seed: int
+    best_fitness: float
+    # first generation reaching the target fitness, None if it was never reached
+    generations_to_optimum: int | None
+    generations: int
+    evaluations: int
+    # seconds for the run, measured in the worker
+    elapsed: float
+    reason: str
+    # fitness evaluations used up to `generations_to_optimum`, comparable across
+    # generational and steady-state replacement
+    # defaults so results saved before it was recorded still load
+    evaluations_to_optimum: int | None = None
+
+
+class ParameterSweep:
+    """
+    Run `GeneticAlgorithm` over every combination of a parameter grid in worker processes.
+
+    Each combination is run `repeats` times. Every run gets its own seed, derived from
+    `seed`, the parameters and the repeat number, so a run gives the same result
+    however the grid is ordered or extended, and whichever worker picks it up.
+    """
+
+    def __init__(
+        self,
+        grid: dict[str, list],
+        repeats: int = 1,
+        seed: int = 0,
+        workers: int | None = None,
+        results_path: str | os.PathLike | None = None,
+        target: float | None = None,
+        **ga_kwargs,
+    ):
+        """
+        Parameters
+        ----------
+        grid : dict of str to list
+            The values to try for each `GeneticAlgorithm` argument, e.g.
+            `{"mutation_rate": [0.001, 0.01], "pop_size": [50, 100]}`.
+        repeats : int, optional
+            The number of runs of each combination. Default is 1.
+        seed : int, optional
+            The base seed every run's seed is derived from. Default is 0.
+        workers : int, optional
+            The number of worker processes. Default is one per CPU.
+        results_path : str or PathLike, optional
+            A JSON Lines file each finished run is appended to. Runs already in the
+            file are not repeated, so an interrupted sweep resumes where it stopped.
+        target : float, optional
+            The fitness counted as the optimum. Default is the chromosome length, the
+            One-Max optimum.
+        **ga_kwargs
+            Arguments shared by every run, e.g. `chromosome_length`. Every argument,
+            swept or shared, must be picklable.
+        """
+        if not grid:
+            raise ValueError("'grid' must contain at least one parameter.")
+        if any(not values for values in grid.values()):
+            raise ValueError("Every parameter in 'grid' needs at least one value.")
+        if not isinstance(repeats, int) or repeats <= 0:
+            raise ValueError("'repeats' must be a positive integer.")
+        if overlap := set(grid) & set(ga_kwargs):
+            raise ValueError(f"Parameters {sorted(overlap)} are both swept and fixed.")
+
+        self.grid = grid
+        self.repeats = repeats
+        self.seed = seed
+        self.workers = workers
+        self.results_path = results_path
+        self.target = target
+        self.ga_kwargs = ga_kwargs
+
+        # validates every combination before any process is started
+        for params in self.combinations():
+            GeneticAlgorithm(**ga_kwargs, **params)
+
+        # attatch logger
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def combinations(self) -> list[dict]:
+        """Return every combination of the grid's values."""
+        names = list(self.grid)
+        return [
+            dict(zip(names, values))
+            for values in itertools.product(*(self.grid[name] for name in names))
+        ]
+
+    def run_seed(self, params: dict, repeat: int) -> int:
+        """Return the seed of one run, see the class docstring."""
+        key = json.dumps([self.seed, params, repeat], sort_keys=True)
+        return random.Random(key).getrandbits(64)
+
+    def run(self) -> list[SweepResult]:
+        """
+        Run every combination `repeats` times, skipping runs already in `results_path`.
+
+        Returns
+        -------
+        list of SweepResult
+            Every run of the sweep, including ones loaded from `results_path`, in grid
+            order.
+        """
+        done = {_run_key(r.params, r.repeat): r for r in self.load_results()}
+        if done:
+            self.logger.info(f"Resuming sweep with {len(done)} completed runs")
+
+        runs = [
+            (params, repeat)
+            for params in self.combinations()
+            for repeat in range(self.repeats)
+        ]
+        pending = [run for run in runs if _run_key(*run) not in done]
+        self._end_partial_line()
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [
+                executor.submit(
+                    _run_one,
+                    params,
+                    repeat,
+                    self.run_seed(params, repeat),
+                    self.ga_kwargs,
+                    self.target,
+                )
+                for params, repeat in pending
+            ]
+            # record runs as they finish, so an interruption loses as little as possible
+            for future in as_completed(futures):
+                result = future.result()
+                done[_run_key(result.params, result.repeat)] = result
+                self._save_result(result)
+                self.logger.info(
+                    f"Finished run {len(done)} of {len(runs)}: {result.params}"
+                )
+
+        return [done[_run_key(*run)] for run in runs]
+
+    def load_results(self) -> list[SweepResult]:
+        """Read the runs saved in `results_path`, if any."""
+        if self.results_path is None or not os.path.exists(self.results_path):
+            return []
+
+        results = []
+        with open(self.results_path) as f:
+            for line in f:
+                # a line cut short by an interruption is simply run again
+                try:
+                    results.append(SweepResult(**json.loads(line)))
+                except (json.JSONDecodeError, TypeError):
+                    continue
+        return results
+
+    def _end_partial_line(self):
+        """End a line cut short by an interruption, so new runs start on their own line."""
+        if self.results_path is None or not os.path.exists(self.results_path):
+            return
+        with open(self.results_path, "rb+") as f:
+            if f.seek(0, os.SEEK_END) == 0:
+                return
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+    def _save_result(self, result: SweepResult):
+        if self.results_path is None:
+            return
+        with open(self.results_path, "a") as f:
+            f.write(json.dumps(asdict(result)) + "\n")
+
+
+def summarise(results: list[SweepResult]) -> list[dict]:
+    """
+    Aggregate sweep results over the repeats of each combination.
+
+    Returns
+    -------
+    list of dict
+        One row per combination, holding its parameters and the number of runs, the
+        mean and best of the best fitness, the fraction of runs reaching the optimum,
+        the mean generations and evaluations to optimum of those runs, and the mean
+        wall time.
+    """
+    groups = {}
+    for result in results:
+        groups.setdefault(_run_key(result.params, None), []).append(result)
+
+    rows = []
+    for runs in groups.values():
+        reached = [r for r in runs if r.generations_to_optimum is not None]
+        evaluations = [
+            r.evaluations_to_optimum
+            for r in reached
+            if r.evaluations_to_optimum is not None
+        ]
+        rows.append(
+            {
+                **runs[0].params,
+                "runs": len(runs),
+                "mean_best_fitness": sum(r.best_fitness for r in runs) / len(runs),
+                "max_best_fitness": max(r.best_fitness for r in runs),
+                "success_rate": len(reached) / len(runs),
+                "mean_generations_to_optimum": (
+                    sum(r.generations_to_optimum for r in reached) / len(reached)
+                    if reached
+                    else None
+                ),
+                "mean_evaluations_to_optimum": (
+                    sum(evaluations) / len(evaluations) if evaluations else None
+                ),
+                "mean_elapsed": sum(r.elapsed for r in runs) / len(runs),
+            }
+        )
+    return rows
+
+
+def format_table(rows: list[dict]) -> str:
+    """Format rows (e.g. from `summarise()`) as a plain text table."""
+    if not rows:
+        return ""
+
+    columns = list(rows[0])
+
+    def cell(value) -> str:
+        if value is None:
+            return "-"
+        if isinstance(value, float):
+            return f"{value:.4g}"
+        return str(value)
+
+    cells = [[cell(row.get(column)) for column in columns] for row in rows]
+    widths = [
+        max(len(column), *(len(line[i]) for line in cells))
+        for i, column in enumerate(columns)
+    ]
+    lines = [
+        "  ".join(column.ljust(width) for column, width in zip(columns, widths)),
+        "  ".join("-" * width for width in widths),
+    ]
+    lines += ["  ".join(c.ljust(w) for c, w in zip(line, widths)) for line in cells]
+    return "\n".join(lines)
+
+
+def _run_key(params: dict, repeat: int | None) -> str:
+    """Identify a run (or, without a repeat, a combination) independent of key order."""
+    return json.dumps([params, repeat], sort_keys=True)
+
+
+def _run_one(
+    params: dict, repeat: int, seed: int, ga_kwargs: dict, target: float | None
+) -> SweepResult:
+    """Run one combination of the sweep in a worker process."""
+    ga = GeneticAlgorithm(**ga_kwargs, **params, rng=seed)
+    target = ga.chromosome_length if target is None else target
+
+    started = time.perf_counter()
+    generations_to_optimum = evaluations_to_optimum = None
+    for stats in ga.iter_generations():
+        if generations_to_optimum is None and stats.best_fitness >= target:
+            generations_to_optimum = stats.generation
+            evaluations_to_optimum = stats.evaluations
+    elapsed = time.perf_counter() - started
+
+    return SweepResult(
+        params=params,
+        repeat=repeat,
+        seed=seed,
+        best_fitness=ga.best_fitness,
+        generations_to_optimum=generations_to_optimum,
+        generations=ga.generation,
+        evaluations=ga.evaluations,
+        elapsed=elapsed,
+        reason=ga._termination_reason(),
+        evaluations_to_optimum=evaluations_to_optimum,
+    )
@@ -1,17 +1,73 @@
+import inspect
+import time
 from abc import ABC, abstractmethod
 
 from one_max_ga.population import Population
+from one_max_ga.stats import GenerationStats
 
 
 class Terminator(ABC):
 
+    # the latest generation's record, set before each call to a `terminate()` written
+    # against the original `terminate(population, generation)` signature
+    stats: GenerationStats | None = None
+    # whether `terminate()` accepts `stats`, decided on its first check
+    _accepts_stats: bool | None = None
+
     def __init__(self):
         self.reason = ""
 
     @abstractmethod
-    def terminate(self, population: Population, generation: int) -> bool:
+    def terminate(
+        self,
+        population: Population,
+        generation: int,
+        stats: GenerationStats | None = None,
+    ) -> bool:
         pass
 
+    def __or__(self, other: "Terminator") -> "AnyTerminator":
+        return AnyTerminator(self, other)
+
+    def __and__(self, other: "Terminator") -> "AllTerminator":
+        return AllTerminator(self, other)
+
+
+def check_terminator(
+    terminator: Terminator,
+    population: Population,
+    generation: int,
+    stats: GenerationStats | None = None,
+) -> bool:
+    """
+    Call `terminator.terminate()`, passing `stats` only if it accepts them.
+
+    Terminators written against the original `terminate(population, generation)`
+    signature are called with that signature, and can read the latest record from
+    `self.stats` instead. The signature is inspected once per terminator, and the
+    answer kept on it.
+    """
+    accepts = getattr(terminator, "_accepts_stats", None)
+    if not isinstance(accepts, bool):
+        accepts = terminator._accepts_stats = _accepts_stats(terminator.terminate)
+
+    if accepts:
+        return terminator.terminate(population, generation, stats)
+
+    terminator.stats = stats
+    return terminator.terminate(population, generation)
+
+
+def _accepts_stats(terminate) -> bool:
+    try:
+        parameters = inspect.signature(terminate).parameters
+    except (TypeError, ValueError):
+        # no signature to inspect, assume the current one
+        return True
+    return "stats" in parameters or any(
+        p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()
+    )
+
 
 class MaxGenerationsTerminator(Terminator):
 
@@ -20,9 +76,149 @@ class MaxGenerationsTerminator(Terminator):
         self.max_generations = max_generations
         self.reason = "Max generations reached."
 
-    def terminate(self, population, generation):
+    def terminate(self, population, generation, stats=None):
         """Return `True` if the given generation is equal to or greater than the `max_generations`, otherwise returns `False`."""
         if generation >= self.max_generations:
             return True
 
         return False
+
+
+class TargetFitnessTerminator(Terminator):
+
+    def __init__(self, target: float):
+        super().__init__()
+        self.target = target
+        self.reason = "Target fitness reached."
+
+    def terminate(self, population, generation, stats=None):
+        """Return `True` once the best fitness of the generation reaches `target`."""
+        if stats is None:
+            return False
+
+        return stats.best_fitness >= self.target
+
+
+class StagnationTerminator(Terminator):
+
+    def __init__(self, patience: int, min_delta: float = 0):
+        """
+        Parameters
+        ----------
+        patience : int
+            The number of generations without improvement to allow.
+        min_delta : float, optional
+            The increase in best fitness that counts as an improvement. Default is 0,
+            i.e. any increase.
+        """
+        super().__init__()
+        if not isinstance(patience, int) or patience <= 0:
+            raise ValueError("'patience' must be a positive integer.")
+
+        self.patience = patience
+        self.min_delta = min_delta
+        self.reason = f"No improvement in {patience} generations."
+
+        self.best_fitness = None
+        self.best_generation = None
+
+    def terminate(self, population, generation, stats=None):
+        """Return `True` when the best fitness has not improved for `patience` generations."""
+        if stats is None:
+            return False
+
+        improved = (
+            self.best_fitness is None
+            or stats.best_fitness > self.best_fitness + self.min_delta
+        )
+        if improved:
+            self.best_fitness = stats.best_fitness
+            self.best_generation = stats.generation
+            return False
+
+        return stats.generation - self.best_generation >= self.patience
+
+
+class WallClockTerminator(Terminator):
+
+    def __init__(self, seconds: float):
+        """
+        Parameters
+        ----------
+        seconds : float
+            The time budget, counted from the first call to `terminate()`. Wall-clock
+            time is used so the budget carries over a checkpoint and resume.
+        """
+        super().__init__()
+        if seconds <= 0:
+            raise ValueError("'seconds' must be positive.")
+
+        self.seconds = seconds
+        self.reason = f"Wall-clock budget of {seconds}s reached."
+        self.started = None
+
+    def terminate(self, population, generation, stats=None):
+        """Return `True` once `seconds` have passed since the first check."""
+        now = time.time()
+        if self.started is None:
+            self.started = now
+
+        return now - self.started >= self.seconds
+
+
+class EvaluationBudgetTerminator(Terminator):
+
+    def __init__(self, max_evaluations: int):
+        super().__init__()
+        if not isinstance(max_evaluations, int) or max_evaluations <= 0:
+            raise ValueError("'max_evaluations' must be a positive integer.")
+
+        self.max_evaluations = max_evaluations
+        self.reason = f"Evaluation budget of {max_evaluations} reached."
+
+    def terminate(self, population, generation, stats=None):
+        """Return `True` once the run has used `max_evaluations` fitness evaluations."""
+        if stats is None:
+            return False
+
+        return stats.evaluations >= self.max_evaluations
+
+
+class AnyTerminator(Terminator):
+    """Terminates when any of the given terminators does, e.g. `a | b`."""
+
+    def __init__(self, *terminators: Terminator):
+        super().__init__()
+        if not terminators:
+            raise ValueError("At least one terminator is required.")
+        self.terminators = terminators
+
+    def terminate(self, population, generation, stats=None):
+        # every terminator is checked, so stateful ones see every generation
+        results = [
+            check_terminator(t, population, generation, stats)
+            for t in self.terminators
+        ]
+        self.reason = " ".join(
+            t.reason for t, done in zip(self.terminators, results) if done
+        )
+        return any(results)
+
+
+class AllTerminator(Terminator):
+    """Terminates only when all of the given terminators do, e.g. `a & b`."""
+
+    def __init__(self, *terminators: Terminator):
+        super().__init__()
+        if not terminators:
+            raise ValueError("At least one terminator is required.")
+        self.terminators = terminators
+
+    def terminate(self, population, generation, stats=None):
+        # every terminator is checked, so stateful ones see every generation
+        results = [
+            check_terminator(t, population, generation, stats)
+            for t in self.terminators
+        ]
+        self.reason = " ".join(t.reason for t in self.terminators)
+        return all(results)
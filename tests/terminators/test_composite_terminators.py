@@ -0,0 +1,112 @@
+import inspect
+
+from one_max_ga.algorithm import GeneticAlgorithm
+from one_max_ga.terminators import (
+    AllTerminator,
+    AnyTerminator,
+    MaxGenerationsTerminator,
+    StagnationTerminator,
+    TargetFitnessTerminator,
+    Terminator,
+    check_terminator,
+)
+import pytest
+
+
+@pytest.mark.parametrize(
+    "first, second, expected_any, expected_all",
+    [(10, 10, False, False), (5, 10, True, False), (5, 5, True, True)],
+)
+def test_composition_is_correct(first, second, expected_any, expected_all):
+    a = MaxGenerationsTerminator(first)
+    b = MaxGenerationsTerminator(second)
+
+    assert (a | b).terminate(None, 5) == expected_any
+    assert (a & b).terminate(None, 5) == expected_all
+
+
+def test_operators_build_composites():
+    a = MaxGenerationsTerminator(1)
+    b = MaxGenerationsTerminator(2)
+
+    assert isinstance(a | b, AnyTerminator)
+    assert isinstance(a & b, AllTerminator)
+
+
+def test_any_checks_every_terminator(mocker):
+    a = mocker.MagicMock(reason="a")
+    a.terminate.return_value = True
+    b = mocker.MagicMock(reason="b")
+    b.terminate.return_value = False
+
+    terminator = AnyTerminator(a, b)
+
+    assert terminator.terminate(None, 0)
+    b.terminate.assert_called_once()
+    assert terminator.reason == "a"
+
+
+def test_empty_composite_raises_value_error():
+    with pytest.raises(ValueError):
+        AnyTerminator()
+
+
+def test_run_stops_when_optimum_is_reached():
+    ga = GeneticAlgorithm(
+        50,
+        8,
+        0.7,
+        0.05,
+        max_generations=1000,
+        terminator=TargetFitnessTerminator(8) | StagnationTerminator(200),
+    )
+    result = ga.run()
+
+    assert result.generations < 1000
+    assert result.best_fitness == 8
+    assert result.reason == "Target fitness reached."
+
+
+class BaselineTerminator(Terminator):
+    """A terminator written against the original two-argument signature."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def terminate(self, population, generation):
+        self.calls.append(generation)
+        return generation >= 3
+
+
+def test_terminator_without_stats_argument_still_works():
+    terminator = BaselineTerminator()
+    ga = GeneticAlgorithm(10, 8, 0.5, 0.01, max_generations=10, terminator=terminator)
+    ga.run()
+
+    assert ga.generation == 3
+    assert terminator.calls == [0, 1, 2, 3]
+    assert terminator.stats.generation == 3
+
+
+def test_composite_of_terminator_without_stats_argument():
+    terminator = BaselineTerminator() | TargetFitnessTerminator(100)
+    ga = GeneticAlgorithm(10, 8, 0.5, 0.01, max_generations=10, terminator=terminator)
+    ga.run()
+
+    assert ga.generation == 3
+
+
+def test_terminator_signature_is_inspected_once(mocker):
+    signature = mocker.patch(
+        "one_max_ga.terminators.inspect.signature", wraps=inspect.signature
+    )
+    terminators = [BaselineTerminator(), MaxGenerationsTerminator(10)]
+
+    for generation in range(5):
+        for terminator in terminators:
+            check_terminator(terminator, None, generation)
+
+    assert signature.call_count == 2
+    assert terminators[0].stats is None
+    assert Terminator.stats is None
@@ -0,0 +1,20 @@
+from one_max_ga.stats import GenerationStats
+from one_max_ga.terminators import EvaluationBudgetTerminator
+import pytest
+
+
+@pytest.mark.parametrize(
+    "max_evaluations, evaluations, expected",
+    [(100, 50, False), (100, 99, False), (100, 100, True), (50, 100, True)],
+)
+def test_termination_is_correct(max_evaluations, evaluations, expected):
+    terminator = EvaluationBudgetTerminator(max_evaluations)
+    stats = GenerationStats(0, 0, 0, 0, evaluations=evaluations, elapsed=0)
+
+    assert terminator.terminate(None, 0, stats=stats) == expected
+
+
+@pytest.mark.parametrize("max_evaluations", [0, -1, 1.5])
+def test_invalid_budget_raises_value_error(max_evaluations):
+    with pytest.raises(ValueError):
+        EvaluationBudgetTerminator(max_evaluations)
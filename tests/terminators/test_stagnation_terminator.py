@@ -0,0 +1,36 @@
+from one_max_ga.stats import GenerationStats
+from one_max_ga.terminators import StagnationTerminator
+import pytest
+
+
+def _run(terminator, best_fitnesses):
+    """Feed a sequence of best fitnesses, returning the generation it stopped at."""
+    for generation, best_fitness in enumerate(best_fitnesses):
+        stats = GenerationStats(generation, best_fitness, 0, 0, evaluations=0, elapsed=0)
+        if terminator.terminate(None, generation, stats=stats):
+            return generation
+    return None
+
+
+@pytest.mark.parametrize(
+    "patience, best_fitnesses, expected",
+    [
+        (2, [1, 1, 1, 1], 2),
+        (2, [1, 2, 2, 3, 3, 3], 5),
+        (3, [1, 2, 3, 4, 5], None),
+        (1, [5, 4], 1),
+    ],
+)
+def test_termination_is_correct(patience, best_fitnesses, expected):
+    assert _run(StagnationTerminator(patience), best_fitnesses) == expected
+
+
+def test_min_delta_ignores_small_improvements():
+    terminator = StagnationTerminator(2, min_delta=0.5)
+    assert _run(terminator, [1.0, 1.2, 1.4, 2.0]) == 2
+
+
+@pytest.mark.parametrize("patience", [0, -1, 1.5])
+def test_invalid_patience_raises_value_error(patience):
+    with pytest.raises(ValueError):
+        StagnationTerminator(patience)
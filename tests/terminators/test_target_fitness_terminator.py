@@ -0,0 +1,21 @@
+from one_max_ga.stats import GenerationStats
+from one_max_ga.terminators import TargetFitnessTerminator
+import pytest
+
+
+def _stats(best_fitness):
+    return GenerationStats(0, best_fitness, 0, 0, evaluations=0, elapsed=0)
+
+
+@pytest.mark.parametrize(
+    "target, best_fitness, expected",
+    [(10, 9, False), (10, 10, True), (10, 11, True), (0.5, 0.25, False)],
+)
+def test_termination_is_correct(target, best_fitness, expected):
+    terminator = TargetFitnessTerminator(target)
+
+    assert terminator.terminate(None, 0, stats=_stats(best_fitness)) == expected
+
+
+def test_no_stats_does_not_terminate():
+    assert not TargetFitnessTerminator(0).terminate(None, 0)
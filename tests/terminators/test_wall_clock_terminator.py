@@ -0,0 +1,17 @@
+from one_max_ga.terminators import WallClockTerminator
+import pytest
+
+
+def test_termination_is_correct(mocker):
+    mocker.patch("time.time", side_effect=[100.0, 104.0, 105.0])
+    terminator = WallClockTerminator(seconds=5)
+
+    assert not terminator.terminate(None, 0)
+    assert not terminator.terminate(None, 1)
+    assert terminator.terminate(None, 2)
+
+
+@pytest.mark.parametrize("seconds", [0, -1])
+def test_invalid_seconds_raises_value_error(seconds):
+    with pytest.raises(ValueError):
+        WallClockTerminator(seconds)
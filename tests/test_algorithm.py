@@ -136,3 +136,344 @@ def test_run_stops_at_max_generations_with_mocked_terminator(mocker, max_generat
 @pytest.mark.parametrize("rate", [0.0, 1.0])
 def test_selection_rates_on_boundries_does_not_produce_index_error(rate):
     GeneticAlgorithm(100, 10, 0.5, 0.01, selection_rate=rate)
+
+
+def test_invalid_backend_raises_value_error():
+    with pytest.raises(ValueError):
+        GeneticAlgorithm(100, 10, 0.5, 0.01, backend="abc")
+
+
+def test_run_with_packed_backend():
+    ga = GeneticAlgorithm(20, 10, 0.5, 0.01, max_generations=5, backend="packed")
+    ga.run()
+
+    assert ga.generation == 5
+
+
+def test_run_with_numpy_backend():
+    pytest.importorskip("numpy")
+
+    ga = GeneticAlgorithm(50, 10, 0.5, 0.01, max_generations=5, backend="numpy")
+    ga.run()
+
+    assert ga.generation == 5
+
+
+def test_run_keeps_final_population():
+    ga = GeneticAlgorithm(20, 10, 0.5, 0.01, max_generations=3)
+    ga.run()
+
+    assert len(ga.population) == 20
+
+
+def test_run_continues_from_given_population():
+    from one_max_ga.chromosome import OneMaxChromosome
+    from one_max_ga.population import Population
+
+    population = Population.from_chromosomes(
+        [OneMaxChromosome(genes=[1] * 10) for _ in range(20)]
+    )
+    ga = GeneticAlgorithm(20, 10, 0, 0, max_generations=2)
+    ga.run(population=population)
+
+    assert all(c.fitness() == 10 for c in ga.population.chromosomes)
+
+
+def test_run_returns_result_with_best_of_run():
+    ga = GeneticAlgorithm(20, 10, 0.5, 0.01, max_generations=5)
+    result = ga.run()
+
+    assert result.generations == 5
+    assert result.evaluations == 6 * 20
+    assert result.best_fitness == max(s.best_fitness for s in result.history)
+    assert result.best.fitness() == result.best_fitness
+    assert result.reason == "Max generations reached."
+    assert [s.generation for s in result.history] == [0, 1, 2, 3, 4, 5]
+
+
+def test_iter_generations_is_lazy():
+    ga = GeneticAlgorithm(20, 10, 0.5, 0.01, max_generations=50)
+    generations = ga.iter_generations()
+
+    assert ga.generation == 0
+    first = next(generations)
+    second = next(generations)
+
+    assert (first.generation, second.generation) == (0, 1)
+    assert ga.generation == 1
+
+
+def test_iter_generations_can_stop_early():
+    ga = GeneticAlgorithm(20, 10, 0.5, 0.01, max_generations=50)
+
+    for stats in ga.iter_generations():
+        if stats.generation == 3:
+            break
+
+    assert ga.generation == 3
+    assert len(ga.population) == 20
+
+
+def test_generation_stats_summarise_population():
+    ga = GeneticAlgorithm(20, 10, 0.5, 0.01, max_generations=1)
+    stats = next(ga.iter_generations())
+    fitness = ga.population.fitness()
+
+    assert stats.best_fitness == max(fitness)
+    assert stats.min_fitness == min(fitness)
+    assert stats.mean_fitness == pytest.approx(sum(fitness) / 20)
+    assert stats.evaluations == 20
+    assert stats.elapsed >= 0
+
+
+def test_step_creates_then_advances_population():
+    ga = GeneticAlgorithm(20, 10, 0.5, 0.01)
+
+    initial = ga.step()
+    next_generation = ga.step()
+
+    assert initial.generation == 0
+    assert next_generation.generation == 1
+    assert ga.evaluations == 40
+
+
+def test_run_result_with_numpy_backend():
+    pytest.importorskip("numpy")
+
+    result = GeneticAlgorithm(20, 10, 0.5, 0.01, max_generations=3, backend="numpy").run()
+
+    assert isinstance(result.best_fitness, int)
+    assert result.best.fitness() == result.best_fitness
+
+
+@pytest.mark.parametrize("backend", ["list", "packed", "numpy", "mmap"])
+def test_seeded_runs_are_reproducible(backend):
+    if backend in ["numpy", "mmap"]:
+        pytest.importorskip("numpy")
+
+    def run(seed):
+        ga = GeneticAlgorithm(
+            20, 30, 0.7, 0.02, max_generations=5, backend=backend, rng=seed
+        )
+        return [s.best_fitness for s in ga.run().history], ga.population.to_bytes()
+
+    assert run(7) == run(7)
+    assert run(7) != run(8)
+
+
+def test_seeded_run_does_not_use_global_random_state():
+    import random
+
+    random.seed(0)
+    before = random.getstate()
+    GeneticAlgorithm(20, 10, 0.5, 0.01, max_generations=3, rng=1).run()
+
+    assert random.getstate() == before
+
+
+def test_concurrent_seeded_runs_in_threads_match_sequential_runs():
+    from concurrent.futures import ThreadPoolExecutor
+
+    def run(seed):
+        ga = GeneticAlgorithm(20, 30, 0.7, 0.02, max_generations=10, rng=seed)
+        return ga.run().best_fitness, ga.population.to_bytes()
+
+    sequential = [run(seed) for seed in range(4)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        threaded = list(executor.map(run, range(4)))
+
+    assert threaded == sequential
+
+
+def test_invalid_crossover_method_raises_value_error():
+    with pytest.raises(ValueError):
+        GeneticAlgorithm(20, 10, 0.5, 0.01, crossover_method="abc")
+
+
+@pytest.mark.parametrize("backend", ["list", "packed", "numpy", "mmap"])
+@pytest.mark.parametrize("method", ["single", "two"])
+def test_run_with_point_crossover(backend, method):
+    if backend in ["numpy", "mmap"]:
+        pytest.importorskip("numpy")
+
+    ga = GeneticAlgorithm(
+        20,
+        30,
+        0.9,
+        0.01,
+        max_generations=5,
+        backend=backend,
+        crossover_method=method,
+    )
+    result = ga.run()
+
+    assert ga.generation == 5
+    assert result.best.fitness() == result.best_fitness
+
+
+@pytest.mark.parametrize("backend", ["list", "packed", "numpy", "mmap"])
+def test_double_buffer_matches_allocating_run(backend):
+    if backend in ["numpy", "mmap"]:
+        pytest.importorskip("numpy")
+
+    def run(double_buffer):
+        ga = GeneticAlgorithm(
+            20,
+            30,
+            0.7,
+            0.05,
+            max_generations=6,
+            backend=backend,
+            rng=3,
+            double_buffer=double_buffer,
+        )
+        history = [s.best_fitness for s in ga.run().history]
+        return history, ga.population.to_bytes()
+
+    assert run(True) == run(False)
+
+
+def test_double_buffer_alternates_between_two_populations():
+    ga = GeneticAlgorithm(20, 30, 0.7, 0.05, double_buffer=True)
+    populations = []
+    chromosomes = []
+    for _ in range(5):
+        ga.step()
+        populations.append(ga.population)
+        chromosomes.append(list(ga.population.chromosomes))
+
+    # the initial population and the first children are reused from then on
+    assert populations[3] is populations[1] and populations[4] is populations[2]
+    assert all(a is b for a, b in zip(chromosomes[1], chromosomes[3]))
+
+
+def test_invalid_log_interval_raises_value_error():
+    with pytest.raises(ValueError):
+        GeneticAlgorithm(20, 10, 0.5, 0.01, log_interval=0)
+
+
+def test_progress_is_logged_every_log_interval(caplog):
+    ga = GeneticAlgorithm(20, 10, 0.5, 0.01, max_generations=6, log_interval=3)
+    with caplog.at_level("INFO", logger="GeneticAlgorithm"):
+        ga.run()
+
+    running = [r.getMessage() for r in caplog.records if "Running" in r.msg]
+    best = [r for r in caplog.records if r.msg.startswith("Best member")]
+    assert running == ["Running generation 3", "Running generation 6"]
+    assert len(best) == 2
+
+
+def test_best_member_is_not_searched_when_logging_is_disabled(caplog, mocker):
+    ga = GeneticAlgorithm(20, 10, 0.5, 0.01, max_generations=3)
+    ga.step()
+    best = mocker.spy(ga.population, "best")
+
+    with caplog.at_level("WARNING", logger="GeneticAlgorithm"):
+        ga.step()
+
+    best.assert_not_called()
+
+
+@pytest.mark.parametrize("backend", ["list", "packed", "numpy", "mmap"])
+@pytest.mark.parametrize("double_buffer", [False, True])
+def test_elitism_never_loses_the_best(backend, double_buffer):
+    if backend in ["numpy", "mmap"]:
+        pytest.importorskip("numpy")
+
+    ga = GeneticAlgorithm(
+        20,
+        30,
+        0.7,
+        0.2,
+        max_generations=15,
+        backend=backend,
+        rng=2,
+        elitism=2,
+        double_buffer=double_buffer,
+    )
+    best = [s.best_fitness for s in ga.run().history]
+
+    assert best == sorted(best)
+    assert len(ga.population) == 20
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(elitism=20),
+        dict(elitism=-1),
+        dict(replacement="abc"),
+        dict(replacement="steady_state", offspring=0),
+        dict(replacement="steady_state", elitism=1),
+    ],
+)
+def test_invalid_replacement_options_raise_value_error(kwargs):
+    with pytest.raises(ValueError):
+        GeneticAlgorithm(20, 10, 0.5, 0.01, **kwargs)
+
+
+@pytest.mark.parametrize("backend", ["list", "packed"])
+def test_steady_state_replaces_worst_and_keeps_population_ranked(backend):
+    ga = GeneticAlgorithm(
+        20,
+        30,
+        0.7,
+        0.05,
+        max_generations=25,
+        backend=backend,
+        rng=4,
+        replacement="steady_state",
+        offspring=3,
+    )
+    history = ga.run().history
+    fitness = ga.population.fitness()
+
+    assert len(ga.population) == 20
+    assert fitness == sorted(fitness)
+    assert ga._ranked == fitness
+    # only the offspring are evaluated after the initial population
+    assert [s.evaluations for s in history] == [20 + 3 * i for i in range(26)]
+    assert [s.best_fitness for s in history] == sorted(s.best_fitness for s in history)
+
+
+def test_steady_state_with_custom_fitness_and_double_buffer():
+    ga = GeneticAlgorithm(
+        20,
+        12,
+        0.7,
+        0.05,
+        max_generations=10,
+        fitness=lambda c: len(c) - c.fitness(),
+        rng=1,
+        replacement="steady_state",
+        double_buffer=True,
+    )
+    ga.run()
+
+    scores = ga.population.scores
+    assert scores == sorted(scores)
+    assert scores == [len(c) - c.fitness() for c in ga.population.chromosomes]
+
+
+def test_steady_state_with_numpy_backend_raises_value_error():
+    with pytest.raises(ValueError):
+        GeneticAlgorithm(20, 10, 0.5, 0.01, backend="numpy", replacement="steady_state")
+
+
+@pytest.mark.parametrize("replacement", ["generational", "steady_state"])
+def test_run_result_reports_evaluations_to_optimum(replacement):
+    ga = GeneticAlgorithm(
+        20, 8, 0.7, 0.05, max_generations=500, rng=0, replacement=replacement
+    )
+    stats = next(s for s in ga.iter_generations() if s.best_fitness == 8)
+    result = GeneticAlgorithm(
+        20, 8, 0.7, 0.05, max_generations=500, rng=0, replacement=replacement
+    ).run()
+
+    assert result.evaluations_to_optimum == stats.evaluations
+
+
+def test_evaluations_to_optimum_is_none_for_unknown_optimum():
+    ga = GeneticAlgorithm(20, 8, 0.7, 0.05, max_generations=3, fitness=len)
+
+    assert ga.run().evaluations_to_optimum is None
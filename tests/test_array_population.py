@@ -0,0 +1,193 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from one_max_ga.array_population import ArrayPopulation
+from one_max_ga.chromosome import OneMaxChromosome
+
+
+@pytest.fixture
+def population():
+    return ArrayPopulation(10, 5, rng=np.random.default_rng(0))
+
+
+def test_population_init_with_valid_size():
+    population = ArrayPopulation(size=10, chromosome_length=5)
+    assert population.genes.shape == (10, 5)
+    assert population.genes.dtype == np.uint8
+    assert set(np.unique(population.genes)) <= {0, 1}
+
+
+def test_population_init_with_invalid_size():
+    with pytest.raises(ValueError):
+        ArrayPopulation(size="invalid", chromosome_length=5)
+
+
+def test_from_array_does_not_copy():
+    genes = np.zeros((4, 3), dtype=np.uint8)
+    population = ArrayPopulation.from_array(genes)
+    assert population.genes is genes
+    assert len(population) == 4
+
+
+def test_fitness_is_row_sum():
+    genes = np.array([[0, 0, 0], [1, 0, 1], [1, 1, 1]], dtype=np.uint8)
+    population = ArrayPopulation.from_array(genes)
+    assert population.fitness().tolist() == [0, 2, 3]
+
+
+def test_sort_by_fitness_returns_correct_order(population):
+    population.sort_by_fitness()
+    fitness = population.fitness()
+    assert all(fitness[:-1] >= fitness[1:])
+
+
+def test_fittest_returns_top_n():
+    genes = np.array(
+        [[0, 0, 0], [1, 1, 1], [1, 0, 0], [1, 1, 0]], dtype=np.uint8
+    )
+    top = ArrayPopulation.from_array(genes).fittest(2)
+    assert sorted(top.fitness().tolist()) == [2, 3]
+
+
+def test_replace_least_fit_overwrites_rows_and_scores():
+    genes = np.array([[1, 1, 1], [0, 0, 0], [1, 1, 0], [0, 0, 1]], dtype=np.uint8)
+    population = ArrayPopulation.from_array(genes)
+    population.scores = np.array([3.0, 0.0, 2.0, 1.0])
+    migrants = ArrayPopulation.from_array(np.ones((2, 3), dtype=np.uint8))
+
+    population.replace_least_fit(migrants, scores=[4.0, 5.0])
+
+    assert sorted(population.scores.tolist()) == [2.0, 3.0, 4.0, 5.0]
+    assert population.genes.sum(axis=1).tolist() == [3, 3, 2, 3]
+
+
+def test_single_index_returns_population(population):
+    single = population[1]
+    assert isinstance(single, ArrayPopulation)
+    assert len(single) == 1
+    assert single.genes[0].tolist() == population.genes[1].tolist()
+
+
+def test_slice(population):
+    assert len(population[:3]) == 3
+    assert len(population[1:]) == 9
+
+
+def test_best_method_returns_fittest_member():
+    genes = np.array([[0, 0, 0], [1, 1, 1], [0, 0, 1]], dtype=np.uint8)
+    best = ArrayPopulation.from_array(genes).best()
+
+    assert isinstance(best, OneMaxChromosome)
+    assert best.genes == [1, 1, 1]
+
+
+def test_random_returns_list_of_correct_size(population):
+    assert len(population.random(k=3)) == 3
+    with pytest.raises(ValueError):
+        population.random(k=11)
+
+
+def test_breed_produces_population_of_requested_size(population):
+    children = population.breed(25, crossover_rate=0.7, mutation_rate=0.01)
+    assert children.genes.shape == (25, 5)
+    assert set(np.unique(children.genes)) <= {0, 1}
+
+
+def test_breed_without_crossover_or_mutation_copies_parents():
+    genes = np.array([[0, 0, 0, 0], [1, 1, 1, 1]], dtype=np.uint8)
+    children = ArrayPopulation.from_array(genes).breed(
+        50, crossover_rate=0, mutation_rate=0
+    )
+    assert {tuple(row) for row in children.genes.tolist()} <= {
+        (0, 0, 0, 0),
+        (1, 1, 1, 1),
+    }
+
+
+def test_breed_crossover_takes_each_gene_from_a_parent():
+    genes = np.array([[0] * 64, [1] * 64], dtype=np.uint8)
+    children = ArrayPopulation.from_array(genes, rng=np.random.default_rng(1)).breed(
+        20, crossover_rate=1, mutation_rate=0
+    )
+    # with two distinct parents every child is a blend of both
+    fitness = children.fitness()
+    assert (fitness > 0).all() and (fitness < 64).all()
+
+
+@pytest.mark.parametrize("method, changes", [("single", 1), ("two", 2)])
+def test_breed_point_crossover_splices_segments(method, changes):
+    genes = np.array([[0] * 64, [1] * 64], dtype=np.uint8)
+    children = ArrayPopulation.from_array(genes, rng=np.random.default_rng(1)).breed(
+        20, crossover_rate=1, mutation_rate=0, crossover_method=method
+    )
+
+    for row in children.genes:
+        assert np.count_nonzero(np.diff(row)) == changes
+
+
+def test_breed_invalid_crossover_method_raises_value_error(population):
+    with pytest.raises(ValueError):
+        population.breed(5, 0.5, 0.01, crossover_method="abc")
+
+
+def test_breed_with_full_mutation_inverts_children():
+    genes = np.zeros((2, 8), dtype=np.uint8)
+    children = ArrayPopulation.from_array(genes).breed(
+        5, crossover_rate=0, mutation_rate=1
+    )
+    assert (children.genes == 1).all()
+
+
+def test_breed_requires_two_parents():
+    with pytest.raises(ValueError):
+        ArrayPopulation(1, 5).breed(5, 0.5, 0.01)
+
+
+def test_breed_sparse_mutation_flip_rate_matches_rate():
+    genes = np.zeros((2, 1000), dtype=np.uint8)
+    children = ArrayPopulation.from_array(genes).breed(
+        100, crossover_rate=0, mutation_rate=0.01
+    )
+    # expected 1_000 flips with a standard deviation of ~31
+    assert 850 < children.fitness().sum() < 1_150
+
+
+def test_slice_is_view(population):
+    pop_slice = population[:3]
+    assert np.shares_memory(pop_slice.genes, population.genes)
+
+
+def test_bytes_match_list_population_layout():
+    from one_max_ga.population import Population
+
+    population = Population(6, 13)
+    data = population.to_bytes()
+
+    array_population = ArrayPopulation.from_bytes(data, 13)
+
+    assert array_population.genes.tolist() == [c.genes for c in population.chromosomes]
+    assert array_population.to_bytes() == data
+
+
+def test_breed_into_out_reuses_gene_matrix(population):
+    out = ArrayPopulation(25, 5)
+    storage = out.genes
+    out.scores = [0] * 25
+
+    parents = ArrayPopulation.from_array(
+        population.genes.copy(), rng=np.random.default_rng(4)
+    )
+    children = parents.breed(25, 0.7, 0.1, out=out)
+    parents.rng = np.random.default_rng(4)
+    expected = parents.breed(25, 0.7, 0.1)
+
+    assert children is out
+    assert children.genes is storage
+    assert children.scores is None
+    assert (children.genes == expected.genes).all()
+
+
+def test_breed_into_out_with_wrong_shape_raises_value_error(population):
+    with pytest.raises(ValueError):
+        population.breed(25, 0.7, 0.1, out=ArrayPopulation(24, 5))
@@ -0,0 +1,130 @@
+import random
+
+import pytest
+from one_max_ga.algorithm import GeneticAlgorithm
+from one_max_ga.checkpoint import load_checkpoint, save_checkpoint
+from one_max_ga.population import Population
+from one_max_ga.terminators import MaxGenerationsTerminator
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "run.ckpt"
+
+
+def test_save_and_load_round_trip(path):
+    population = Population(10, 13)
+    terminator = MaxGenerationsTerminator(7)
+
+    save_checkpoint(path, population, generation=4, terminator=terminator)
+
+    with load_checkpoint(path) as checkpoint:
+        assert checkpoint.size == 10
+        assert checkpoint.chromosome_length == 13
+        assert checkpoint.generation == 4
+        assert checkpoint.terminator.max_generations == 7
+        assert checkpoint.random_state == random.getstate()
+        assert bytes(checkpoint.genomes) == population.to_bytes()
+
+
+def test_genomes_are_aligned(path):
+    save_checkpoint(path, Population(3, 100), generation=0)
+
+    with load_checkpoint(path) as checkpoint:
+        assert checkpoint.genomes.nbytes == 3 * 13
+    data = path.read_bytes()
+    assert (len(data) - 3 * 13) % 64 == 0
+
+
+def test_snapshot_is_packed(path):
+    save_checkpoint(path, Population(100, 8000), generation=0)
+    # one bit per gene plus a small header
+    assert path.stat().st_size < 100 * 1000 + 8192
+
+
+def test_load_non_checkpoint_raises_value_error(path):
+    path.write_bytes(b"not a checkpoint file")
+    with pytest.raises(ValueError):
+        load_checkpoint(path)
+
+
+def test_run_writes_checkpoints(path, mocker):
+    spy = mocker.patch("one_max_ga.algorithm.save_checkpoint")
+    ga = GeneticAlgorithm(
+        10, 8, 0.5, 0.01, max_generations=7, checkpoint_path=path, checkpoint_interval=3
+    )
+    ga.run()
+
+    # generations 3 and 6, then the final generation 7
+    assert [c.args[2] for c in spy.call_args_list] == [3, 6, 7]
+
+
+@pytest.mark.parametrize("interval", [0, -1, 1.5])
+def test_invalid_checkpoint_interval_raises_value_error(interval):
+    with pytest.raises(ValueError):
+        GeneticAlgorithm(10, 8, 0.5, 0.01, checkpoint_interval=interval)
+
+
+@pytest.mark.parametrize("backend", ["list", "packed", "numpy", "mmap"])
+def test_resumed_run_matches_uninterrupted_run(path, backend):
+    if backend in ["numpy", "mmap"]:
+        pytest.importorskip("numpy")
+    kwargs = dict(
+        pop_size=20,
+        chromosome_length=16,
+        crossover_rate=0.7,
+        mutation_rate=0.05,
+        backend=backend,
+    )
+
+    random.seed(0)
+    uninterrupted = GeneticAlgorithm(**kwargs, max_generations=6)
+    uninterrupted.run()
+
+    random.seed(0)
+    GeneticAlgorithm(**kwargs, max_generations=3, checkpoint_path=path).run()
+    random.seed(1)
+    resumed = GeneticAlgorithm(**kwargs, max_generations=6)
+    resumed.resume(path, restore_terminator=False)
+
+    assert resumed.generation == 6
+    assert resumed.population.to_bytes() == uninterrupted.population.to_bytes()
+
+
+@pytest.mark.parametrize("backend", ["list", "numpy", "mmap"])
+def test_resume_restores_seeded_rng(path, backend):
+    if backend in ["numpy", "mmap"]:
+        pytest.importorskip("numpy")
+    kwargs = dict(
+        pop_size=20,
+        chromosome_length=16,
+        crossover_rate=0.7,
+        mutation_rate=0.05,
+        backend=backend,
+    )
+
+    uninterrupted = GeneticAlgorithm(**kwargs, max_generations=6, rng=0)
+    uninterrupted.run()
+
+    GeneticAlgorithm(**kwargs, max_generations=3, checkpoint_path=path, rng=0).run()
+    resumed = GeneticAlgorithm(**kwargs, max_generations=6, rng=1)
+    resumed.resume(path, restore_terminator=False)
+
+    assert resumed.population.to_bytes() == uninterrupted.population.to_bytes()
+
+
+def test_resume_with_mismatched_population_raises_value_error(path):
+    save_checkpoint(path, Population(10, 8), generation=0)
+
+    with pytest.raises(ValueError):
+        GeneticAlgorithm(20, 8, 0.5, 0.01).resume(path)
+
+
+def test_resume_restores_terminator(path):
+    save_checkpoint(path, Population(10, 8), generation=2, terminator=MaxGenerationsTerminator(4))
+
+    ga = GeneticAlgorithm(10, 8, 0.5, 0.01, max_generations=100)
+    ga.resume(path)
+
+    assert ga.terminator.max_generations == 4
+    assert ga.generation == 4
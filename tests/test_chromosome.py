@@ -36,11 +36,12 @@ def test_invalid_gene_value_raises_value_error(genes):
 
 
 def test_init_random_genes(mocker):
-    mock_random = mocker.patch("random.randint", side_effect=[0, 1, 0, 1, 0])
+    # gene i is bit i of a single draw
+    mock_random = mocker.patch("random.getrandbits", return_value=0b01010)
     chromosome = OneMaxChromosome(length=5)
     assert chromosome.genes == [0, 1, 0, 1, 0]
     assert chromosome.length == 5
-    mock_random.assert_called_with(0, 1)
+    mock_random.assert_called_once_with(5)
 
 
 def test_init_with_genes():
@@ -77,10 +78,12 @@ def test_crossover_invalid_method_raises_value_error():
     "genes", [[0, 1, 0, 1, 0], [1, 1, 1], [0, 0, 0, 0], [1, 0, 1, 0, 1, 0, 1]]
 )
 def test_crossover_uniform(genes, mocker):
-    p1 = OneMaxChromosome(length=len(genes))
-    p2 = OneMaxChromosome(length=len(genes))
+    p1 = OneMaxChromosome(genes=[1] * len(genes))
+    p2 = OneMaxChromosome(genes=[0] * len(genes))
 
-    mocker.patch("random.choice", side_effect=genes)
+    # genes come from p1 where the mask bit is set, otherwise from p2
+    mask = sum(g << i for i, g in enumerate(genes))
+    mocker.patch("random.getrandbits", return_value=mask)
 
     child = p1.crossover(p2, method="uniform")
 
@@ -88,6 +91,42 @@ def test_crossover_uniform(genes, mocker):
     assert len(child) == len(genes)
 
 
+def test_crossover_single_point_splices_at_cut(mocker):
+    p1 = OneMaxChromosome(genes=[1] * 6)
+    p2 = OneMaxChromosome(genes=[0] * 6)
+
+    mocker.patch("random.randrange", return_value=2)
+    child = p1.crossover(p2, method="single")
+
+    assert child.genes == [1, 1, 0, 0, 0, 0]
+
+
+def test_crossover_two_point_swaps_middle_segment(mocker):
+    p1 = OneMaxChromosome(genes=[1] * 6)
+    p2 = OneMaxChromosome(genes=[0] * 6)
+
+    mocker.patch("random.sample", return_value=[4, 1])
+    child = p1.crossover(p2, method="two")
+
+    assert child.genes == [1, 0, 0, 0, 1, 1]
+
+
+@pytest.mark.parametrize("method", ["single", "two"])
+@pytest.mark.parametrize("length", [1, 2, 3, 50])
+def test_point_crossover_takes_segments_from_both_parents(method, length):
+    p1 = OneMaxChromosome(genes=[1] * length)
+    p2 = OneMaxChromosome(genes=[0] * length)
+
+    child = p1.crossover(p2, method=method, rng=random.Random(0))
+    genes = child.genes
+
+    assert len(genes) == length
+    assert genes[0] == 1
+    # the genes change parent once per cut, and every cut leaves both sides non-empty
+    changes = sum(a != b for a, b in zip(genes, genes[1:]))
+    assert changes == min(1 if method == "single" else 2, length - 1)
+
+
 def test_direct_reproduction_creates_correct_child():
     p1 = OneMaxChromosome(length=5)
 
@@ -129,7 +168,8 @@ def test_mutation_produces_different_genes(original, mutated):
 
 
 def test_mutate_always_changes_genes(mocker):
-    mocker.patch("random.random", side_effect=[0.1, 0.8, 0.2, 0.9, 0.05])
+    # genes flip where the mask bit is set
+    mocker.patch("one_max_ga.chromosome._bernoulli_mask", return_value=0b10101)
     original_genes = [0, 1, 0, 1, 1]
     p1 = OneMaxChromosome(genes=original_genes)
     p1.mutate(chance=0.5)
@@ -147,3 +187,232 @@ def test_chromosome_length_is_correct(l):
 def test_fitness_score_is_calculated_properly(genes, fitness):
     chromosome = OneMaxChromosome(genes=genes)
     assert chromosome.fitness() == fitness
+
+
+def test_fitness_is_cached(mocker):
+    chromosome = OneMaxChromosome(genes=[1, 0, 1])
+    assert chromosome.fitness() == 2
+
+    mock_sum = mocker.patch("builtins.sum")
+    assert chromosome.fitness() == 2
+    mock_sum.assert_not_called()
+
+
+def test_assigning_genes_invalidates_cached_fitness():
+    chromosome = OneMaxChromosome(genes=[1, 0, 1])
+    assert chromosome.fitness() == 2
+
+    chromosome.genes = [1, 1, 1, 1]
+    assert chromosome.fitness() == 4
+
+
+@pytest.mark.parametrize("chance", [0, 0.3, 1])
+def test_mutate_updates_cached_fitness(chance):
+    chromosome = OneMaxChromosome(length=200)
+    chromosome.fitness()
+
+    chromosome.mutate(chance=chance)
+
+    assert chromosome.fitness() == sum(chromosome.genes)
+
+
+def test_direct_child_inherits_cached_fitness(mocker):
+    parent = OneMaxChromosome(genes=[1, 1, 0])
+    parent.fitness()
+
+    mock_sum = mocker.patch("builtins.sum")
+    child = parent.direct()
+
+    assert child.fitness() == 2
+    mock_sum.assert_not_called()
+
+
+def test_invalid_mutation_method_raises_value_error():
+    with pytest.raises(ValueError):
+        OneMaxChromosome(length=5).mutate(chance=0.1, method="abc")
+
+
+@pytest.mark.parametrize("method", ["dense", "sparse"])
+def test_mutation_methods_with_chance_one_flip_every_gene(method):
+    chromosome = OneMaxChromosome(genes=[0, 1, 0, 1])
+    chromosome.mutate(chance=1, method=method)
+    assert chromosome.genes == [1, 0, 1, 0]
+
+
+def test_sparse_mutation_flips_in_place_and_updates_fitness():
+    genes = [0] * 1000
+    chromosome = OneMaxChromosome(genes=genes)
+    chromosome.fitness()
+
+    chromosome.mutate(chance=0.01, method="sparse")
+
+    assert chromosome.genes is genes
+    assert chromosome.fitness() == sum(genes)
+
+
+def test_sparse_mutation_only_draws_per_flip(mocker):
+    # with chance = 0.5 a draw of 0.1 never skips a gene
+    mock_random = mocker.patch("random.random", return_value=0.1)
+    chromosome = OneMaxChromosome(genes=[0] * 5)
+
+    chromosome.mutate(chance=0.5, method="sparse")
+
+    assert chromosome.genes == [1] * 5
+    assert mock_random.call_count == 6
+
+
+def test_sparse_mutation_flip_rate_matches_chance():
+    chromosome = OneMaxChromosome(genes=[0] * 100_000)
+    chromosome.mutate(chance=0.01, method="sparse")
+    # expected 1_000 flips with a standard deviation of ~31
+    assert 850 < chromosome.fitness() < 1_150
+
+
+def test_mutating_direct_child_does_not_change_parent():
+    parent = OneMaxChromosome(genes=[0] * 10)
+    child = parent.direct()
+
+    child.mutate(chance=1, method="sparse")
+
+    assert parent.genes == [0] * 10
+
+
+def test_children_skip_gene_validation(mocker):
+    p1 = OneMaxChromosome(length=5)
+    p2 = OneMaxChromosome(length=5)
+
+    mock_init = mocker.patch.object(OneMaxChromosome, "__init__")
+    child = p1.crossover(p2)
+    copy = p1.direct()
+
+    mock_init.assert_not_called()
+    assert len(child) == 5
+    assert copy.genes == p1.genes
+
+
+def test_to_bytes_packs_gene_i_as_bit_i():
+    chromosome = OneMaxChromosome(genes=[1, 0, 0, 0, 0, 0, 0, 0, 0, 1])
+    assert chromosome.to_bytes() == bytes([0b00000001, 0b00000010])
+
+
+def test_bytes_round_trip():
+    chromosome = OneMaxChromosome(length=21)
+    restored = OneMaxChromosome.from_bytes(chromosome.to_bytes(), 21)
+    assert restored.genes == chromosome.genes
+    assert restored.fitness() == chromosome.fitness()
+
+
+@pytest.mark.parametrize("method", ["dense", "sparse"])
+def test_mutate_returns_number_of_flipped_genes(method):
+    chromosome = OneMaxChromosome(length=500)
+    original = list(chromosome.genes)
+
+    flipped = chromosome.mutate(chance=0.02, method=method)
+
+    assert flipped == sum(a != b for a, b in zip(original, chromosome.genes))
+
+
+def test_operations_draw_from_given_rng():
+    def run(rng):
+        parent = OneMaxChromosome(length=64, rng=rng)
+        child = parent.crossover(OneMaxChromosome(length=64, rng=rng), rng=rng)
+        child.mutate(chance=0.1, method="dense", rng=rng)
+        child.mutate(chance=0.01, method="sparse", rng=rng)
+        return child.genes
+
+    assert run(random.Random(5)) == run(random.Random(5))
+    assert run(random.Random(5)) != run(random.Random(6))
+
+
+def test_dense_mutation_flip_rate_matches_chance():
+    chromosome = OneMaxChromosome(genes=[0] * 100_000)
+
+    flipped = chromosome.mutate(chance=0.2, method="dense", rng=random.Random(0))
+
+    assert flipped == sum(chromosome.genes)
+    assert flipped == pytest.approx(20_000, rel=0.05)
+
+
+@pytest.mark.parametrize("method", ["uniform", "single", "two"])
+def test_crossover_into_out_reuses_storage(method):
+    p1 = OneMaxChromosome(length=30)
+    p2 = OneMaxChromosome(length=30)
+    out = OneMaxChromosome(length=30)
+    storage = out.genes
+    out.fitness()
+
+    child = p1.crossover(p2, method=method, rng=random.Random(1), out=out)
+    expected = p1.crossover(p2, method=method, rng=random.Random(1))
+
+    assert child is out
+    assert child.genes is storage
+    assert child.genes == expected.genes
+    assert child.fitness() == sum(expected.genes)
+
+
+def test_uniform_crossover_into_out_takes_genes_by_mask_bit():
+    p1 = OneMaxChromosome(genes=[1] * 13)
+    p2 = OneMaxChromosome(genes=[0] * 13)
+    out = OneMaxChromosome(genes=[0, 1] * 6 + [0])
+
+    mask = random.Random(3).getrandbits(13)
+    child = p1.crossover(p2, method="uniform", rng=random.Random(3), out=out)
+
+    # gene i is taken from the first parent when bit i of the mask is set
+    assert child.genes == [(mask >> i) & 1 for i in range(13)]
+
+
+def test_direct_into_out_copies_genes_and_fitness():
+    parent = OneMaxChromosome(genes=[1, 0, 1])
+    parent.fitness()
+    out = OneMaxChromosome(genes=[0, 0, 0])
+    storage = out.genes
+
+    child = parent.direct(out=out)
+    child.mutate(chance=1)
+
+    assert child is out and child.genes is storage
+    assert child.genes == [0, 1, 0]
+    assert child.fitness() == 1
+    assert parent.genes == [1, 0, 1]
+
+
+def test_out_with_different_length_raises_value_error():
+    p1 = OneMaxChromosome(length=5)
+
+    with pytest.raises(ValueError):
+        p1.direct(out=OneMaxChromosome(length=6))
+    with pytest.raises(ValueError):
+        p1.crossover(OneMaxChromosome(length=5), out=OneMaxChromosome(length=6))
+
+
+def test_dense_mutation_keeps_gene_list():
+    chromosome = OneMaxChromosome(length=50)
+    genes = chromosome.genes
+
+    chromosome.mutate(chance=0.5, method="dense")
+
+    assert chromosome.genes is genes
+
+
+def test_chromosome_has_no_instance_dict():
+    chromosome = OneMaxChromosome(length=5)
+
+    assert not hasattr(chromosome, "__dict__")
+    with pytest.raises(AttributeError):
+        chromosome.other = 1
+
+
+def test_repr_shows_short_genomes_in_full():
+    chromosome = OneMaxChromosome(genes=[1, 0, 1])
+
+    assert repr(chromosome) == "OneMaxChromosome(length=3, genes=[1, 0, 1], fitness=2)"
+
+
+def test_repr_elides_long_genomes():
+    chromosome = OneMaxChromosome(genes=[1] * 8 + [0] * 10_000 + [1] * 8)
+
+    assert repr(chromosome) == (
+        "OneMaxChromosome(length=10016, genes=[1, 1, 1, 1, 1, 1, 1, 1, ..., "
+        "1, 1, 1, 1, 1, 1, 1, 1], fitness=16)"
+    )
@@ -0,0 +1,133 @@
+import json
+import subprocess
+import sys
+
+import pytest
+from one_max_ga.cli import main
+from one_max_ga.history import load_history
+
+
+def fitness(chromosome):
+    return sum(chromosome.genes)
+
+
+async def async_fitness(chromosome):
+    return sum(chromosome.genes)
+
+
+ARGS = ["--pop-size", "20", "--chromosome-length", "16", "--max-generations", "5"]
+
+
+@pytest.mark.parametrize("backend", ["list", "packed", "numpy", "mmap"])
+def test_main_writes_json_metrics(tmp_path, capsys, backend):
+    if backend in ["numpy", "mmap"]:
+        pytest.importorskip("numpy")
+
+    path = tmp_path / "metrics.json"
+    args = ARGS + ["--backend", backend, "--seed", "1", "--phase-timings"]
+    assert main(args + ["--json", str(path)]) == 0
+
+    metrics = json.loads(path.read_text())
+    assert metrics["generations"] == 5
+    assert metrics["params"]["backend"] == backend
+    assert len(metrics["history"]) == 6
+    assert metrics["phase_timings"]["evaluate"] >= 0
+    assert "best fitness" in capsys.readouterr().out
+
+
+def test_main_seed_is_reproducible(capsys):
+    runs = []
+    for _ in range(2):
+        main(ARGS + ["--seed", "3", "--json", "-"])
+        metrics = json.loads(capsys.readouterr().out)
+        runs.append([stats["mean_fitness"] for stats in metrics["history"]])
+
+    assert runs[0] == runs[1]
+
+
+def test_main_combines_terminators(capsys):
+    main(ARGS + ["--max-generations", "1000", "--target-fitness", "1", "--json", "-"])
+
+    metrics = json.loads(capsys.readouterr().out)
+    assert metrics["generations"] < 1000
+    assert metrics["best_fitness"] >= 1
+
+
+@pytest.mark.parametrize(
+    "extra",
+    [
+        ["--fitness", "tests.test_cli:fitness"],
+        ["--fitness", "tests.test_cli:async_fitness"],
+        ["--workers", "2", "--executor", "thread"],
+        ["--fitness", "tests.test_cli:fitness", "--fitness-cache", "100"],
+        ["--selection", "tournament", "--tournament-size", "3"],
+        ["--replacement", "steady_state", "--offspring", "4"],
+        ["--elitism", "2", "--double-buffer", "--crossover-method", "two"],
+    ],
+)
+def test_main_runs_with_options(capsys, extra):
+    assert main(ARGS + extra) == 0
+    assert "best fitness" in capsys.readouterr().out
+
+
+def test_main_with_workers_counts_evaluations_to_optimum(capsys):
+    args = ["--workers", "2", "--executor", "thread", "--seed", "1", "--json", "-"]
+    main(ARGS + ["--max-generations", "1000", "--target-fitness", "16"] + args)
+
+    metrics = json.loads(capsys.readouterr().out)
+    assert metrics["best_fitness"] == 16
+    assert metrics["evaluations_to_optimum"] is not None
+
+
+def test_main_checkpoints_history_and_resumes(tmp_path, capsys):
+    checkpoint = tmp_path / "run.ckpt"
+    history = tmp_path / "history.bin"
+    args = ARGS + ["--checkpoint", str(checkpoint), "--checkpoint-interval", "2"]
+    main(args + ["--history", str(history)])
+
+    with load_history(history) as h:
+        assert h.generations == list(range(6))
+
+    main(args + ["--max-generations", "8", "--resume", str(checkpoint)])
+    assert "best fitness" in capsys.readouterr().out
+
+
+def test_main_profile_prints_to_stderr(capsys):
+    main(ARGS + ["--profile"])
+
+    assert "function calls" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--backend", "other"],
+        ["--mutation-rate", "2"],
+        ["--fitness", "tests.test_cli"],
+        ["--fitness", "tests.test_cli:missing"],
+    ],
+)
+def test_main_invalid_arguments_exit(capsys, args):
+    with pytest.raises(SystemExit) as error:
+        main(args)
+
+    assert error.value.code == 2
+    assert "error" in capsys.readouterr().err
+
+
+def test_main_invalid_arguments_do_not_open_history(tmp_path, capsys):
+    history = tmp_path / "history.bin"
+
+    with pytest.raises(SystemExit):
+        main(["--mutation-rate", "2", "--history", str(history)])
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cli_does_not_import_numpy_for_list_backend():
+    code = (
+        "import sys; from one_max_ga.cli import main; "
+        "main(['--pop-size', '10', '--max-generations', '2']); "
+        "assert 'numpy' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
@@ -0,0 +1,317 @@
+import asyncio
+from operator import methodcaller
+
+import pytest
+from one_max_ga.algorithm import GeneticAlgorithm
+from one_max_ga.chromosome import OneMaxChromosome
+from one_max_ga.evaluation import (
+    AsyncBatchEvaluator,
+    AsyncFunctionEvaluator,
+    BatchEvaluator,
+    CachedEvaluator,
+    FunctionEvaluator,
+    PoolEvaluator,
+)
+from one_max_ga.population import Population
+
+
+def count_zeros(chromosome) -> int:
+    return len(chromosome) - chromosome.fitness()
+
+
+async def async_count_zeros(chromosome) -> int:
+    await asyncio.sleep(0)
+    return count_zeros(chromosome)
+
+
+@pytest.fixture
+def population():
+    return Population(23, 12)
+
+
+def test_function_evaluator_scores_each_chromosome(population):
+    scores = FunctionEvaluator(count_zeros).evaluate(population)
+    assert scores == [12 - c.fitness() for c in population.chromosomes]
+
+
+def test_batch_evaluator_passes_whole_population(mocker, population):
+    fn = mocker.MagicMock(return_value=list(range(23)))
+
+    scores = BatchEvaluator(fn).evaluate(population)
+
+    fn.assert_called_once_with(population)
+    assert scores == list(range(23))
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_pool_evaluator_matches_serial_scores(population, executor):
+    with PoolEvaluator(methodcaller("fitness"), workers=2, executor=executor) as evaluator:
+        scores = evaluator.evaluate(population)
+
+    assert scores == population.fitness()
+
+
+def test_pool_evaluator_reuses_pool_across_calls(population):
+    with PoolEvaluator(methodcaller("fitness"), workers=2) as evaluator:
+        evaluator.evaluate(population)
+        pool = evaluator._pool
+        evaluator.evaluate(population)
+
+        assert evaluator._pool is pool
+    assert evaluator._pool is None
+
+
+def test_pool_evaluator_invalid_executor_raises_value_error():
+    with pytest.raises(ValueError):
+        PoolEvaluator(count_zeros, executor="abc")
+
+
+def test_population_evaluate_replaces_fitness(population):
+    population.evaluate(FunctionEvaluator(count_zeros))
+
+    best = population.best()
+    fittest = population.fittest(5)
+
+    assert best.fitness() == min(c.fitness() for c in population.chromosomes)
+    assert fittest.scores == sorted(population.scores, reverse=True)[:5]
+    assert [count_zeros(c) for c in fittest.chromosomes] == fittest.scores
+
+
+def test_population_sort_uses_scores(population):
+    population.evaluate(FunctionEvaluator(count_zeros))
+    population.sort_by_fitness()
+
+    assert population.scores == sorted(population.scores, reverse=True)
+    assert population.scores == [count_zeros(c) for c in population.chromosomes]
+
+
+def test_population_evaluate_wrong_number_of_scores_raises_value_error(population):
+    with pytest.raises(ValueError):
+        population.evaluate(BatchEvaluator(lambda p: [0]))
+
+
+def test_ga_accepts_fitness_callable():
+    ga = GeneticAlgorithm(20, 10, 0.5, 0.01, max_generations=3, fitness=count_zeros)
+
+    assert isinstance(ga.evaluator, FunctionEvaluator)
+    ga.run()
+    assert ga.generation == 3
+
+
+def test_ga_minimises_ones_with_custom_fitness():
+    ga = GeneticAlgorithm(
+        50, 20, 0.7, 0.01, max_generations=30, fitness=BatchEvaluator(
+            lambda p: [count_zeros(c) for c in p.chromosomes]
+        )
+    )
+    ga.run()
+
+    assert ga.population.best().fitness() < 10
+
+
+def test_pool_evaluator_with_array_population():
+    pytest.importorskip("numpy")
+    from one_max_ga.array_population import ArrayPopulation
+
+    population = ArrayPopulation(17, 12)
+    with PoolEvaluator(methodcaller("fitness"), workers=2) as evaluator:
+        scores = population.evaluate(evaluator)
+
+    assert scores.tolist() == population.genes.sum(axis=1).tolist()
+
+
+def test_async_function_evaluator_limits_concurrency(population):
+    in_flight = peak = 0
+
+    async def fn(chromosome):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return count_zeros(chromosome)
+
+    scores = asyncio.run(AsyncFunctionEvaluator(fn, concurrency=4).evaluate(population))
+
+    assert scores == [count_zeros(c) for c in population.chromosomes]
+    assert peak == 4
+
+
+def test_async_function_evaluator_invalid_concurrency_raises_value_error():
+    with pytest.raises(ValueError):
+        AsyncFunctionEvaluator(async_count_zeros, concurrency=0)
+
+
+def test_async_batch_evaluator_sets_population_scores(population):
+    async def fn(population):
+        return [count_zeros(c) for c in population.chromosomes]
+
+    asyncio.run(population.aevaluate(AsyncBatchEvaluator(fn)))
+
+    assert population.scores == [count_zeros(c) for c in population.chromosomes]
+
+
+def test_ga_wraps_async_fitness_function():
+    ga = GeneticAlgorithm(
+        20, 10, 0.5, 0.01, max_generations=3, fitness=async_count_zeros
+    )
+
+    assert isinstance(ga.evaluator, AsyncFunctionEvaluator)
+    with pytest.raises(TypeError):
+        ga.run()
+
+
+def test_ga_arun_matches_run_with_same_seed():
+    kwargs = dict(max_generations=5, rng=3)
+    result = GeneticAlgorithm(20, 10, 0.7, 0.05, fitness=count_zeros, **kwargs).run()
+    async_result = asyncio.run(
+        GeneticAlgorithm(20, 10, 0.7, 0.05, fitness=async_count_zeros, **kwargs).arun()
+    )
+
+    assert async_result.best_fitness == result.best_fitness
+    assert async_result.best.genes == result.best.genes
+    assert [s.mean_fitness for s in async_result.history] == [
+        s.mean_fitness for s in result.history
+    ]
+
+
+def test_ga_aiter_generations_interleaves_with_other_tasks():
+    ga = GeneticAlgorithm(10, 8, 0.7, 0.05, max_generations=4)
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(ga.generation)
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.ensure_future(ticker())
+        generations = [stats.generation async for stats in ga.aiter_generations()]
+        task.cancel()
+        return generations
+
+    assert asyncio.run(main()) == [0, 1, 2, 3, 4]
+    # the other task ran between generations, not only before and after the run
+    assert set(ticks) >= {1, 2, 3}
+
+
+def test_ga_cancelled_mid_evaluation_keeps_last_complete_generation():
+    ga = GeneticAlgorithm(10, 8, 0.7, 0.05, max_generations=100)
+    started = None
+
+    async def fn(chromosome):
+        if ga.generation == 2:
+            started.set()
+            await asyncio.Event().wait()
+        return count_zeros(chromosome)
+
+    async def main():
+        nonlocal started
+        started = asyncio.Event()
+        ga.evaluator = AsyncFunctionEvaluator(fn, concurrency=2)
+        task = asyncio.ensure_future(ga.arun())
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+
+    assert ga.generation == 2
+    assert ga.population.scores == [count_zeros(c) for c in ga.population.chromosomes]
+
+
+def test_cached_evaluator_scores_duplicates_once(mocker):
+    a, b = OneMaxChromosome(length=12), OneMaxChromosome(length=12)
+    population = Population.from_chromosomes([a, b.direct(), a.direct(), b])
+    fn = mocker.MagicMock(side_effect=count_zeros)
+    evaluator = CachedEvaluator(FunctionEvaluator(fn))
+
+    first = evaluator.evaluate(population)
+    second = evaluator.evaluate(population)
+
+    assert first == second == [count_zeros(c) for c in population.chromosomes]
+    assert fn.call_count == (1 if a.genes == b.genes else 2)
+    assert evaluator.misses == fn.call_count
+    assert evaluator.hits == 8 - fn.call_count
+
+
+def test_cached_evaluator_passes_misses_as_one_batch(mocker, population):
+    fn = mocker.MagicMock(
+        side_effect=lambda p: [count_zeros(c) for c in p.chromosomes]
+    )
+    evaluator = CachedEvaluator(BatchEvaluator(fn))
+
+    evaluator.evaluate(population[:10])
+    scores = evaluator.evaluate(population)
+
+    assert scores == [count_zeros(c) for c in population.chromosomes]
+    assert fn.call_count == 2
+    # the second batch only holds genomes missing from the first
+    assert len(fn.call_args.args[0]) == len(population) - evaluator.hits
+
+
+def test_cached_evaluator_evicts_least_recently_used():
+    chromosomes = [
+        OneMaxChromosome._from_trusted_genes([int(b) for b in f"{i:04b}"])
+        for i in range(4)
+    ]
+    evaluator = CachedEvaluator(FunctionEvaluator(count_zeros), maxsize=2)
+
+    evaluator.evaluate(Population.from_chromosomes(chromosomes[:2]))
+    evaluator.evaluate(Population.from_chromosomes(chromosomes[:1]))
+    evaluator.evaluate(Population.from_chromosomes(chromosomes[2:3]))
+
+    assert len(evaluator) == 2
+    evaluator.cache_clear()
+    evaluator.evaluate(Population.from_chromosomes(chromosomes[:3]))
+    assert evaluator.hits == 0
+
+
+def test_cached_evaluator_keys_long_genomes_by_fixed_size_digest():
+    population = Population(4, 10_000)
+    evaluator = CachedEvaluator(FunctionEvaluator(count_zeros))
+
+    scores = evaluator.evaluate(population)
+
+    assert scores == [count_zeros(c) for c in population.chromosomes]
+    assert all(len(key) == 16 for key in evaluator._cache)
+    assert evaluator.evaluate(population) == scores
+    assert evaluator.hits == 4
+
+
+def test_cached_evaluator_invalid_maxsize_raises_value_error():
+    with pytest.raises(ValueError):
+        CachedEvaluator(FunctionEvaluator(count_zeros), maxsize=0)
+
+
+def test_ga_fitness_cache_matches_uncached_run():
+    kwargs = dict(max_generations=10, rng=5)
+    result = GeneticAlgorithm(20, 10, 0.7, 0.01, fitness=count_zeros, **kwargs).run()
+    ga = GeneticAlgorithm(
+        20, 10, 0.7, 0.01, fitness=count_zeros, fitness_cache=100, **kwargs
+    )
+    cached = ga.run()
+
+    assert isinstance(ga.evaluator, CachedEvaluator)
+    assert ga.evaluator.hits > 0
+    assert cached.best.genes == result.best.genes
+    assert [s.mean_fitness for s in cached.history] == [
+        s.mean_fitness for s in result.history
+    ]
+
+
+def test_ga_fitness_cache_without_custom_fitness_raises_value_error():
+    with pytest.raises(ValueError):
+        GeneticAlgorithm(20, 10, 0.7, 0.01, fitness_cache=100)
+
+
+def test_cached_evaluator_with_array_population():
+    pytest.importorskip("numpy")
+    from one_max_ga.array_population import ArrayPopulation
+
+    population = ArrayPopulation(17, 12)
+    evaluator = CachedEvaluator(FunctionEvaluator(count_zeros))
+    scores = population.evaluate(evaluator)
+
+    assert scores.tolist() == [count_zeros(c) for c in population.chromosomes]
@@ -0,0 +1,111 @@
+import pytest
+from one_max_ga.algorithm import GeneticAlgorithm
+from one_max_ga.history import HistoryRecorder, load_history
+from one_max_ga.population import Population
+
+
+@pytest.mark.parametrize("backend", ["list", "packed", "numpy", "mmap"])
+def test_recorder_streams_every_generation(tmp_path, backend):
+    if backend in ["numpy", "mmap"]:
+        pytest.importorskip("numpy")
+
+    path = tmp_path / "history.bin"
+    snapshots = {}
+    with HistoryRecorder(path, initial_size=64) as recorder:
+        ga = GeneticAlgorithm(
+            20, 13, 0.7, 0.05, max_generations=6, backend=backend, recorder=recorder
+        )
+        for stats in ga.iter_generations():
+            snapshots[stats.generation] = (
+                ga.population.to_bytes(),
+                [float(f) for f in ga.population.fitness()],
+            )
+
+    with load_history(path) as history:
+        assert len(history) == 7
+        assert history.generations == list(range(7))
+        assert history.chromosome_length == 13
+        # read back out of order
+        for generation in [4, 0, 6, 2]:
+            record = history.read(generation)
+            assert record.generation == generation
+            assert (bytes(record.genomes), record.fitness.tolist()) == snapshots[
+                generation
+            ]
+            del record
+
+
+def test_recorder_grows_file_and_trims_on_close(tmp_path):
+    path = tmp_path / "history.bin"
+    population = Population(10, 100)
+    with HistoryRecorder(path, initial_size=1) as recorder:
+        for generation in range(3):
+            recorder.record(generation, population, population.fitness())
+
+    # three aligned records of 10 float64s and 10 rows of 13 bytes
+    assert path.stat().st_size == 2 * 256 + 10 * 8 + 10 * 13
+    with load_history(path) as history:
+        assert bytes(history[-1].genomes) == population.to_bytes()
+
+
+def test_recorder_snapshots_genes_before_they_change(tmp_path):
+    path = tmp_path / "history.bin"
+    population = Population(5, 20)
+    data = population.to_bytes()
+    with HistoryRecorder(path) as recorder:
+        recorder.record(0, population, population.fitness())
+        # e.g. double buffering overwrites the chromosomes in place
+        for chromosome in population.chromosomes:
+            chromosome.mutate(chance=1)
+
+    with load_history(path) as history:
+        record = history.read(0)
+        assert bytes(record.genomes) == data
+        del record
+
+
+def test_recorder_rejects_a_different_chromosome_length(tmp_path):
+    with HistoryRecorder(tmp_path / "history.bin") as recorder:
+        recorder.record(0, Population(5, 10), [0] * 5)
+        with pytest.raises(ValueError):
+            recorder.record(1, Population(5, 11), [0] * 5)
+
+
+def test_recorder_raises_background_write_errors(tmp_path, mocker):
+    recorder = HistoryRecorder(tmp_path / "history.bin")
+    mocker.patch.object(recorder, "_write", side_effect=OSError("disk full"))
+    population = Population(5, 10)
+
+    recorder.record(0, population, [0] * 5)
+    with pytest.raises(OSError):
+        recorder.close()
+
+
+def test_recorder_invalid_queue_size_raises_value_error(tmp_path):
+    with pytest.raises(ValueError):
+        HistoryRecorder(tmp_path / "history.bin", queue_size=0)
+
+
+def test_history_ignores_a_truncated_index_entry(tmp_path):
+    path = tmp_path / "history.bin"
+    population = Population(5, 10)
+    with HistoryRecorder(path) as recorder:
+        recorder.record(0, population, population.fitness())
+        recorder.record(1, population, population.fitness())
+
+    index = tmp_path / "history.bin.idx"
+    index.write_bytes(index.read_bytes()[:-5])
+
+    with load_history(path) as history:
+        assert history.generations == [0]
+        with pytest.raises(KeyError):
+            history.read(1)
+
+
+def test_load_history_of_other_file_raises_value_error(tmp_path):
+    path = tmp_path / "history.bin"
+    path.write_bytes(b"")
+    (tmp_path / "history.bin.idx").write_bytes(b"not a history")
+
+    with pytest.raises(ValueError):
+        load_history(path)
@@ -0,0 +1,146 @@
+import random
+import tracemalloc
+
+import pytest
+from one_max_ga.algorithm import GeneticAlgorithm
+from one_max_ga.instrumentation import GenerationMetrics, MetricsRecorder, Profiler
+
+
+def test_metrics_accumulate_timings_and_counters():
+    metrics = GenerationMetrics(1)
+    metrics.add_time("mutate", 0.5)
+    metrics.add_time("mutate", 0.25)
+    metrics.count("children")
+    metrics.count("children", 4)
+
+    assert metrics.timings == {"mutate": 0.75}
+    assert metrics.counters == {"children": 5}
+
+
+def test_recorder_totals_over_generations():
+    recorder = MetricsRecorder()
+    for generation in [0, 1]:
+        recorder(
+            GenerationMetrics(
+                generation,
+                timings={"evaluate": 1.5},
+                counters={"evaluations": 10},
+            )
+        )
+
+    assert recorder.total_timings() == {"evaluate": 3.0}
+    assert recorder.total_counters() == {"evaluations": 20}
+
+
+def test_invalid_profile_mode_raises_value_error():
+    with pytest.raises(ValueError):
+        Profiler("abc")
+    with pytest.raises(ValueError):
+        GeneticAlgorithm(20, 10, 0.5, 0.01, profile="abc")
+
+
+@pytest.mark.parametrize("backend", ["list", "packed", "numpy", "mmap"])
+def test_hooks_receive_metrics_for_every_generation(backend):
+    if backend in ["numpy", "mmap"]:
+        pytest.importorskip("numpy")
+
+    recorder = MetricsRecorder()
+    ga = GeneticAlgorithm(
+        20, 50, 0.5, 0.05, max_generations=4, backend=backend, hooks=[recorder]
+    )
+    ga.run()
+
+    assert [m.generation for m in recorder.history] == [0, 1, 2, 3, 4]
+    # the initial population is only evaluated
+    assert set(recorder.history[0].timings) == {"evaluate"}
+    for metrics in recorder.history[1:]:
+        assert {"select", "sample_parents", "crossover", "mutate", "rebuild"} <= set(
+            metrics.timings
+        )
+        assert metrics.counters["children"] == 20
+        assert metrics.counters["evaluations"] == 20
+        assert 0 <= metrics.counters["crossovers"] <= 20
+    assert recorder.total_counters()["evaluations"] == ga.evaluations
+
+
+def test_genes_flipped_counts_every_mutation():
+    recorder = MetricsRecorder()
+    GeneticAlgorithm(10, 20, 0, 1, max_generations=2, hooks=[recorder]).run()
+
+    assert recorder.history[1].counters["genes_flipped"] == 10 * 20
+
+
+@pytest.mark.parametrize("backend", ["list", "packed", "numpy", "mmap"])
+def test_elites_are_not_counted_as_bred_children(backend):
+    if backend in ["numpy", "mmap"]:
+        pytest.importorskip("numpy")
+
+    recorder = MetricsRecorder()
+    ga = GeneticAlgorithm(
+        10,
+        20,
+        1,
+        1,
+        max_generations=2,
+        backend=backend,
+        elitism=3,
+        hooks=[recorder],
+    )
+    ga.run()
+
+    for metrics in recorder.history[1:]:
+        assert metrics.counters["children"] == 7
+        assert metrics.counters["crossovers"] == 7
+        assert metrics.counters["genes_flipped"] == 7 * 20
+
+
+def test_hooks_do_not_change_a_seeded_run():
+    random.seed(3)
+    plain = GeneticAlgorithm(20, 30, 0.7, 0.02, max_generations=5).run()
+    random.seed(3)
+    hooked = GeneticAlgorithm(
+        20, 30, 0.7, 0.02, max_generations=5, hooks=[MetricsRecorder()]
+    ).run()
+
+    assert [s.best_fitness for s in plain.history] == [
+        s.best_fitness for s in hooked.history
+    ]
+
+
+def test_step_calls_hooks():
+    calls = []
+    ga = GeneticAlgorithm(20, 10, 0.5, 0.01, hooks=[calls.append])
+    ga.step()
+    ga.step()
+
+    assert [m.generation for m in calls] == [0, 1]
+
+
+def test_cprofile_mode_returns_stats():
+    ga = GeneticAlgorithm(20, 10, 0.5, 0.01, max_generations=3, profile="cprofile")
+    result = ga.run()
+
+    assert result.profile.total_calls > 0
+    functions = {name for _, _, name in result.profile.stats}
+    assert "step" in functions
+
+
+def test_tracemalloc_mode_returns_snapshot_and_peak_memory():
+    recorder = MetricsRecorder()
+    result = GeneticAlgorithm(
+        20, 10, 0.5, 0.01, max_generations=3, hooks=[recorder], profile="tracemalloc"
+    ).run()
+
+    assert isinstance(result.profile, tracemalloc.Snapshot)
+    assert all(m.peak_memory > 0 for m in recorder.history)
+    assert not tracemalloc.is_tracing()
+
+
+def test_profiling_stops_when_iteration_stops_early():
+    ga = GeneticAlgorithm(20, 10, 0.5, 0.01, max_generations=50, profile="tracemalloc")
+    generations = ga.iter_generations()
+    next(generations)
+    generations.close()
+
+    assert isinstance(ga.profile_result, tracemalloc.Snapshot)
+    assert not tracemalloc.is_tracing()
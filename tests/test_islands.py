@@ -0,0 +1,183 @@
+import pytest
+from one_max_ga.chromosome import OneMaxChromosome
+from one_max_ga.islands import IslandModel, _Island, _Report
+from one_max_ga.terminators import StagnationTerminator, TargetFitnessTerminator
+
+
+def half_mean_fitness(chromosome):
+    return sum(chromosome.genes) / (2 * len(chromosome))
+
+
+def failing_fitness(chromosome):
+    raise ValueError("fitness failed")
+
+
+GA_KWARGS = dict(
+    pop_size=20, chromosome_length=16, crossover_rate=0.7, mutation_rate=0.01
+)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(n_islands=1, migration_interval=5),
+        dict(n_islands=2, migration_interval=0),
+        dict(n_islands=2, migration_interval=5, topology="star"),
+        dict(n_islands=2, migration_interval=5, migrants=20),
+    ],
+)
+def test_invalid_arguments_raise_value_error(kwargs):
+    with pytest.raises(ValueError):
+        IslandModel(**kwargs, **GA_KWARGS)
+
+
+def test_invalid_ga_arguments_raise_value_error():
+    with pytest.raises(ValueError):
+        IslandModel(2, 5, **{**GA_KWARGS, "crossover_rate": 2})
+
+
+def _island(fitness: list[int], length: int = 8) -> bytes:
+    """Pack chromosomes with the given fitness, in order."""
+    return b"".join(((1 << f) - 1).to_bytes((length + 7) // 8, "little") for f in fitness)
+
+
+def _report(fitness: list[int]) -> _Report:
+    """An island's report whose migrants have the given fitness, fittest first."""
+    best = _island(fitness[:1])
+    return _Report(_island(fitness), fitness, best, fitness[0], 5, 100, "")
+
+
+def test_ring_migration_sends_migrants_to_the_next_island():
+    model = IslandModel(
+        3, 5, migrants=1, topology="ring", **{**GA_KWARGS, "chromosome_length": 8}
+    )
+    reports = [_report([8]), _report([5]), _report([7])]
+
+    incoming = model._migrate(reports)
+
+    assert incoming == [(_island([7]), [7]), (_island([8]), [8]), (_island([5]), [5])]
+
+
+def test_full_migration_keeps_fittest_incoming():
+    model = IslandModel(
+        3, 5, migrants=2, topology="full", **{**GA_KWARGS, "chromosome_length": 8}
+    )
+    reports = [_report([8, 2]), _report([5, 4]), _report([7, 6])]
+
+    incoming = model._migrate(reports)
+
+    assert incoming[0] == (_island([7, 6]), [7, 6])
+    assert incoming[1] == (_island([8, 7]), [8, 7])
+
+
+def test_no_migrants_leaves_islands_alone():
+    model = IslandModel(2, 5, migrants=0, **GA_KWARGS)
+
+    assert model._migrate([_report([3]), _report([4])]) == [None, None]
+
+
+@pytest.mark.parametrize("topology", ["ring", "full"])
+def test_run_returns_best_of_run(topology):
+    model = IslandModel(
+        2,
+        migration_interval=3,
+        migrants=2,
+        topology=topology,
+        workers=2,
+        seed=1,
+        max_generations=7,
+        **GA_KWARGS,
+    )
+
+    best = model.run()
+
+    assert model.generation == 7
+    assert isinstance(best, OneMaxChromosome)
+    assert best.fitness() == model.best_fitness
+
+
+def test_run_is_reproducible_with_seed():
+    kwargs = dict(workers=2, seed=3, max_generations=4, **GA_KWARGS)
+
+    first = IslandModel(2, 2, **kwargs).run()
+    second = IslandModel(2, 2, **kwargs).run()
+
+    assert first.genes == second.genes
+
+
+@pytest.mark.parametrize("backend", ["list", "numpy"])
+def test_island_evaluates_only_its_own_generations(mocker, backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    fitness = mocker.Mock(side_effect=lambda chromosome: chromosome.fitness())
+    kwargs = {**GA_KWARGS, "pop_size": 10, "fitness": fitness, "backend": backend}
+    islands = [_Island(kwargs, seed=i, migrants=2) for i in range(2)]
+
+    reports = [island.evolve(2) for island in islands]
+    for _ in range(2):
+        incoming = [(r.migrants, r.scores) for r in reports[::-1]]
+        reports = [island.evolve(2, m) for island, m in zip(islands, incoming)]
+
+    # 2 islands of the initial population and 6 bred generations, the migrants
+    # arrive with their scores
+    assert fitness.call_count == 140
+    assert [island.ga.generation for island in islands] == [6, 6]
+    assert [r.evaluations for r in reports] == [70, 70]
+    assert reports[0].scores == sorted(reports[0].scores, reverse=True)
+    assert len(reports[0].migrants) == 2 * 2
+
+
+def test_island_keeps_terminator_state_between_epochs():
+    terminator = StagnationTerminator(3)
+    kwargs = {**GA_KWARGS, "max_generations": 100, "terminator": terminator}
+    kwargs["mutation_rate"] = 0
+    kwargs["crossover_rate"] = 0
+    island = _Island(kwargs, seed=0, migrants=1)
+
+    # direct copies never improve, so the 3 generations span two epochs
+    first = island.evolve(2)
+    second = island.evolve(2)
+
+    assert first.reason == ""
+    assert second.reason == terminator.reason
+    assert island.ga.generation == 3
+
+
+def test_island_replaces_least_fit_with_migrants():
+    island = _Island({**GA_KWARGS, "chromosome_length": 8}, seed=0, migrants=1)
+    island.evolve(0)
+
+    island.evolve(0, (_island([8, 8]), [8, 8]))
+
+    assert sorted(island.ga.population.fitness())[-2:] == [8, 8]
+
+
+def test_run_stops_when_a_terminator_is_met():
+    kwargs = {**GA_KWARGS, "max_generations": 1000}
+    kwargs["terminator"] = TargetFitnessTerminator(kwargs["chromosome_length"])
+    model = IslandModel(2, 5, workers=2, seed=4, **kwargs)
+
+    best = model.run()
+
+    assert model.generation < 1000
+    assert model.reason == "Target fitness reached."
+    assert model.best_fitness == best.fitness() == 16
+    assert model.evaluations > 0
+
+
+def test_run_keeps_fractional_fitness():
+    kwargs = {**GA_KWARGS, "fitness": half_mean_fitness, "max_generations": 4}
+    model = IslandModel(2, 2, migrants=1, topology="full", workers=2, seed=2, **kwargs)
+
+    best = model.run()
+
+    # truncating the scores to integers would leave every island at 0
+    assert 0 < model.best_fitness <= 0.5
+    assert model.best_fitness == half_mean_fitness(best)
+
+
+def test_run_raises_errors_from_the_workers():
+    model = IslandModel(2, 2, workers=2, fitness=failing_fitness, **GA_KWARGS)
+
+    with pytest.raises(ValueError, match="fitness failed"):
+        model.run()
@@ -0,0 +1,197 @@
+import io
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from one_max_ga.array_population import ArrayPopulation
+from one_max_ga.chromosome import PackedOneMaxChromosome
+from one_max_ga.mapped_population import MappedPopulation
+
+
+def mapped(genes, rng=None, chunk_size=64) -> MappedPopulation:
+    """Build a mapped population from a (size, chromosome_length) 0/1 matrix."""
+    genes = np.array(genes, dtype=np.uint8)
+    data = np.packbits(genes, axis=1, bitorder="little").tobytes()
+    return MappedPopulation.from_bytes(
+        data, genes.shape[1], rng=rng, chunk_size=chunk_size
+    )
+
+
+def unpacked(population: MappedPopulation) -> np.ndarray:
+    return ArrayPopulation.from_bytes(
+        population.to_bytes(), population.chromosome_length
+    ).genes
+
+
+@pytest.fixture
+def population():
+    return MappedPopulation(10, 100, rng=np.random.default_rng(0), chunk_size=64)
+
+
+def test_population_init_is_packed_in_a_memory_map(population):
+    assert isinstance(population.genes, np.memmap)
+    assert population.genes.shape == (10, 13)
+    assert population.fitness().tolist() == unpacked(population).sum(axis=1).tolist()
+
+
+def test_population_init_leaves_padding_bits_clear():
+    population = MappedPopulation(50, 3)
+
+    assert (population.genes < 8).all()
+
+
+@pytest.mark.parametrize(
+    "kwargs", [dict(size="a"), dict(chromosome_length=0), dict(chunk_size=0)]
+)
+def test_population_init_with_invalid_arguments_raises_value_error(kwargs):
+    with pytest.raises(ValueError):
+        MappedPopulation(**{"size": 4, "chromosome_length": 5, **kwargs})
+
+
+def test_population_init_in_directory(tmp_path):
+    population = MappedPopulation(4, 20, directory=tmp_path)
+
+    # the file is unlinked once mapped
+    assert list(tmp_path.iterdir()) == []
+    assert len(population) == 4
+
+
+def test_bytes_round_trip_matches_list_population_layout():
+    from one_max_ga.population import Population
+
+    data = Population(6, 13).to_bytes()
+    population = MappedPopulation.from_bytes(memoryview(data), 13, chunk_size=1)
+
+    assert population.to_bytes() == data
+    file = io.BytesIO()
+    population.write_bytes(file)
+    assert file.getvalue() == data
+
+
+def test_fittest_and_best():
+    population = mapped([[0, 0, 0], [1, 1, 1], [1, 0, 0], [1, 1, 0]])
+
+    assert sorted(population.fittest(2).fitness().tolist()) == [2, 3]
+    best = population.best()
+    assert isinstance(best, PackedOneMaxChromosome)
+    assert best.genes.tolist() == [1, 1, 1]
+
+
+def test_replace_least_fit_overwrites_rows_and_counts():
+    population = mapped([[0, 0, 0], [1, 1, 1], [1, 0, 0], [1, 1, 0]])
+
+    population.replace_least_fit(mapped([[1, 1, 1], [1, 0, 1]]))
+
+    assert unpacked(population).sum(axis=1).tolist() == [3, 3, 2, 2]
+    assert population.fitness().tolist() == [3, 3, 2, 2]
+
+
+def test_sort_by_fitness_returns_correct_order(population):
+    population.sort_by_fitness()
+
+    fitness = population.fitness()
+    assert all(fitness[:-1] >= fitness[1:])
+    assert fitness.tolist() == unpacked(population).sum(axis=1).tolist()
+
+
+def test_indexing_copies_rows_with_their_fitness(population):
+    single = population[1]
+
+    assert len(single) == 1
+    assert single.to_bytes() == population.genes[1].tobytes()
+    assert single.fitness()[0] == population.fitness()[1]
+    assert len(population[2:5]) == 3
+
+
+def test_chromosomes_are_read_when_accessed(population):
+    chromosomes = population.chromosomes
+
+    assert len(chromosomes) == 10
+    assert chromosomes[-1].to_bytes() == population.genes[9].tobytes()
+    assert [c.fitness() for c in chromosomes[:3]] == population.fitness()[:3].tolist()
+    assert len(population.random(k=3)) == 3
+
+
+@pytest.mark.parametrize("method", ["uniform", "single", "two"])
+@pytest.mark.parametrize("mutation_rate", [0, 0.01, 0.2])
+def test_breed_maintains_fitness_of_children(population, method, mutation_rate):
+    children = population.breed(
+        25, 0.5, mutation_rate, crossover_method=method, elites=population.fittest(2)
+    )
+
+    genes = unpacked(children)
+    assert genes.shape == (25, 100)
+    assert children.fitness().tolist() == genes.sum(axis=1).tolist()
+    assert (children.genes[:, -1] < 16).all()
+
+
+def test_breed_copies_elites_unchanged(population):
+    elites = population.fittest(3)
+    children = population.breed(20, 0.7, 0.5, elites=elites)
+
+    assert children[17:].to_bytes() == elites.to_bytes()
+
+
+@pytest.mark.parametrize("method, changes", [("single", 1), ("two", 2)])
+def test_breed_point_crossover_splices_segments(method, changes):
+    parents = mapped([[0] * 64, [1] * 64], rng=np.random.default_rng(1))
+    children = parents.breed(
+        20, crossover_rate=1, mutation_rate=0, crossover_method=method
+    )
+
+    for row in unpacked(children):
+        assert np.count_nonzero(np.diff(row)) == changes
+
+
+def test_breed_with_full_mutation_inverts_children():
+    children = mapped([[0] * 13] * 2).breed(5, crossover_rate=0, mutation_rate=1)
+
+    assert (unpacked(children) == 1).all()
+    assert children.fitness().tolist() == [13] * 5
+
+
+def test_breed_sparse_mutation_flip_rate_matches_rate():
+    children = mapped([[0] * 1000] * 2).breed(100, crossover_rate=0, mutation_rate=0.01)
+
+    # expected 1_000 flips with a standard deviation of ~31
+    assert 850 < children.fitness().sum() < 1_150
+
+
+def test_breed_into_out_reuses_file(population):
+    out = MappedPopulation(25, 100)
+    storage = out.genes
+    out.scores = np.zeros(25)
+
+    population.rng = np.random.default_rng(4)
+    children = population.breed(25, 0.7, 0.1, out=out)
+    population.rng = np.random.default_rng(4)
+    expected = population.breed(25, 0.7, 0.1)
+
+    assert children is out
+    assert children.genes is storage
+    assert children.scores is None
+    assert children.to_bytes() == expected.to_bytes()
+
+
+def test_breed_into_out_with_wrong_shape_raises_value_error(population):
+    with pytest.raises(ValueError):
+        population.breed(25, 0.7, 0.1, out=MappedPopulation(24, 100))
+
+
+def test_breed_requires_two_parents():
+    with pytest.raises(ValueError):
+        MappedPopulation(1, 5).breed(5, 0.5, 0.01)
+
+
+def test_chunk_size_does_not_change_a_seeded_breed():
+    genes = np.random.default_rng(2).integers(0, 2, size=(8, 5000))
+    # a byte of every row per tile, or the whole matrix in one tile
+    small = mapped(genes, rng=np.random.default_rng(3), chunk_size=1)
+    large = mapped(genes, rng=np.random.default_rng(3), chunk_size=2**20)
+
+    for population in [small, large]:
+        population.rng = np.random.default_rng(5)
+    children = [p.breed(8, 0.7, 0, crossover_method="two") for p in [small, large]]
+
+    assert children[0].to_bytes() == children[1].to_bytes()
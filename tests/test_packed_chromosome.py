@@ -0,0 +1,215 @@
+import random
+from one_max_ga.chromosome import OneMaxChromosome, PackedOneMaxChromosome
+import pytest
+
+
+@pytest.mark.parametrize(
+    "length, genes, should_raise_error",
+    [
+        (None, None, True),
+        (5, [0, 1, 0], True),
+        (5, None, False),
+        (None, [1, 0, 1], False),
+    ],
+)
+def test_init_with_different_args(length, genes, should_raise_error):
+
+    if should_raise_error:
+        with pytest.raises(ValueError):
+            PackedOneMaxChromosome(length=length, genes=genes)
+    else:
+        PackedOneMaxChromosome(length=length, genes=genes)
+
+
+@pytest.mark.parametrize("genes", [[1, 0, 2], [1, 0, "1"], (0, 1)])
+def test_invalid_genes_raise_value_error(genes):
+    with pytest.raises(ValueError):
+        PackedOneMaxChromosome(genes=genes)
+
+
+@pytest.mark.parametrize("l", [-1, 0.1, "a", 0])
+def test_invalid_length_argument(l):
+    with pytest.raises(ValueError):
+        PackedOneMaxChromosome(length=l)
+
+
+def test_genes_are_packed_with_gene_i_as_bit_i():
+    chromosome = PackedOneMaxChromosome(genes=[1, 0, 1, 1, 0])
+    assert chromosome.bits == 0b01101
+    assert chromosome.length == 5
+
+
+@pytest.mark.parametrize("genes", [[0, 1, 0, 1, 0], [1, 1, 1], [0, 0, 0, 0], [1]])
+def test_gene_view_matches_list_api(genes):
+    chromosome = PackedOneMaxChromosome(genes=genes)
+
+    assert chromosome.genes == genes
+    assert list(chromosome.genes) == genes
+    assert chromosome.genes.tolist() == genes
+    assert len(chromosome.genes) == len(genes)
+    assert chromosome.genes[-1] == genes[-1]
+    assert chromosome.genes[1:] == genes[1:]
+
+
+def test_gene_view_index_out_of_range_raises_index_error():
+    chromosome = PackedOneMaxChromosome(genes=[0, 1])
+    with pytest.raises(IndexError):
+        chromosome.genes[2]
+
+
+def test_init_random_genes(mocker):
+    mock_random = mocker.patch("random.getrandbits", return_value=0b01010)
+    chromosome = PackedOneMaxChromosome(length=5)
+    assert chromosome.genes == [0, 1, 0, 1, 0]
+    mock_random.assert_called_once_with(5)
+
+
+def test_from_bits_rejects_too_many_bits():
+    with pytest.raises(ValueError):
+        PackedOneMaxChromosome.from_bits(0b1000, 3)
+
+
+@pytest.mark.parametrize(
+    "genes, fitness", [([0, 0, 0], 0), ([1], 1), ([1, 0, 1], 2), ([1, 1, 1, 1], 4)]
+)
+def test_fitness_matches_list_chromosome(genes, fitness):
+    assert PackedOneMaxChromosome(genes=genes).fitness() == fitness
+    assert OneMaxChromosome(genes=genes).fitness() == fitness
+
+
+def test_crossover_uniform_blends_with_mask(mocker):
+    p1 = PackedOneMaxChromosome(genes=[1, 1, 1, 1])
+    p2 = PackedOneMaxChromosome(genes=[0, 0, 0, 0])
+
+    mocker.patch("random.getrandbits", return_value=0b0101)
+    child = p1.crossover(p2)
+
+    assert child.genes == [1, 0, 1, 0]
+    assert child is not p1 and child is not p2
+
+
+@pytest.mark.parametrize("method", ["uniform", "single", "two"])
+def test_crossover_matches_list_chromosome(method):
+    genes_1 = OneMaxChromosome(length=40).genes
+    genes_2 = OneMaxChromosome(length=40).genes
+
+    packed = PackedOneMaxChromosome(genes=genes_1).crossover(
+        PackedOneMaxChromosome(genes=genes_2), method=method, rng=random.Random(3)
+    )
+    unpacked = OneMaxChromosome(genes=genes_1).crossover(
+        OneMaxChromosome(genes=genes_2), method=method, rng=random.Random(3)
+    )
+
+    assert packed.genes == unpacked.genes
+
+
+def test_crossover_different_length_chromosomes_raises_value_error():
+    with pytest.raises(ValueError):
+        PackedOneMaxChromosome(length=5).crossover(PackedOneMaxChromosome(length=10))
+
+
+def test_crossover_invalid_method_raises_value_error():
+    with pytest.raises(ValueError):
+        PackedOneMaxChromosome(length=5).crossover(
+            PackedOneMaxChromosome(length=5), method="abc"
+        )
+
+
+def test_direct_reproduction_creates_correct_child():
+    p1 = PackedOneMaxChromosome(length=50)
+
+    child = p1.direct()
+
+    assert child.genes == p1.genes
+    assert child is not p1
+
+
+@pytest.mark.parametrize(
+    "original, mutated",
+    [([0, 1, 0], [1, 0, 1]), ([1, 0, 1, 0, 1], [0, 1, 0, 1, 0])],
+)
+def test_mutation_with_chance_one_flips_every_gene(original, mutated):
+    chromosome = PackedOneMaxChromosome(genes=original)
+    chromosome.mutate(chance=1)
+    assert chromosome.genes == mutated
+
+
+def test_mutation_with_chance_zero_changes_nothing():
+    chromosome = PackedOneMaxChromosome(length=100)
+    genes = chromosome.genes.tolist()
+    chromosome.mutate(chance=0)
+    assert chromosome.genes == genes
+
+
+@pytest.mark.parametrize("mutation_chance", [-0.1, 1.0001])
+def test_invalid_mutation_value_raises_value_error(mutation_chance):
+    with pytest.raises(ValueError):
+        PackedOneMaxChromosome(length=5).mutate(chance=mutation_chance)
+
+
+def test_mutation_flip_rate_matches_chance():
+    chromosome = PackedOneMaxChromosome(genes=[0] * 100_000)
+    chromosome.mutate(chance=0.1)
+    # expected 10_000 flips with a standard deviation of ~95
+    assert 9_500 < chromosome.fitness() < 10_500
+
+
+@pytest.mark.parametrize("method", ["dense", "sparse"])
+def test_mutation_methods_with_chance_one_flip_every_gene(method):
+    chromosome = PackedOneMaxChromosome(genes=[0, 1, 0, 1, 1, 0, 0, 0, 1])
+    chromosome.mutate(chance=1, method=method)
+    assert chromosome.genes == [1, 0, 1, 0, 0, 1, 1, 1, 0]
+
+
+def test_sparse_mutation_flip_rate_matches_chance():
+    chromosome = PackedOneMaxChromosome(genes=[0] * 100_000)
+    chromosome.mutate(chance=0.01, method="sparse")
+    assert 850 < chromosome.fitness() < 1_150
+
+
+@pytest.mark.parametrize("n_flips", [2, 20])
+def test_sparse_mutation_flips_exactly_the_sampled_positions(mocker, n_flips):
+    positions = list(range(5, 100_000, 100_000 // n_flips))[:n_flips]
+    mocker.patch(
+        "one_max_ga.chromosome._flip_positions", return_value=iter(positions)
+    )
+    chromosome = PackedOneMaxChromosome(genes=[0] * 100_000)
+
+    assert chromosome.mutate(chance=0.01, method="sparse") == n_flips
+    assert chromosome.bits == sum(1 << i for i in positions)
+
+
+@pytest.mark.parametrize("method", ["dense", "sparse"])
+def test_mutate_returns_number_of_flipped_genes(method):
+    chromosome = PackedOneMaxChromosome(length=500)
+    original = chromosome.bits
+
+    flipped = chromosome.mutate(chance=0.02, method=method)
+
+    assert flipped == (original ^ chromosome.bits).bit_count()
+
+
+def test_crossover_and_direct_into_out_reuse_the_chromosome():
+    p1 = PackedOneMaxChromosome(genes=[1, 1, 1, 1])
+    p2 = PackedOneMaxChromosome(genes=[0, 0, 0, 0])
+    out = PackedOneMaxChromosome(length=4)
+
+    assert p1.crossover(p2, method="single", rng=random.Random(0), out=out) is out
+    assert out.genes[0] == 1 and out.genes[3] == 0
+    assert p2.direct(out=out) is out
+    assert out.genes == [0, 0, 0, 0]
+
+    with pytest.raises(ValueError):
+        p1.direct(out=PackedOneMaxChromosome(length=5))
+
+
+def test_chromosome_has_no_instance_dict():
+    assert not hasattr(PackedOneMaxChromosome(length=5), "__dict__")
+
+
+@pytest.mark.parametrize("genes", [[1, 0, 1], [0, 1] * 20])
+def test_repr_matches_list_chromosome(genes):
+    packed = repr(PackedOneMaxChromosome(genes=genes))
+    unpacked = repr(OneMaxChromosome(genes=genes))
+
+    assert packed == "Packed" + unpacked
@@ -1,5 +1,6 @@
+import random
 import pytest
-from one_max_ga.chromosome import OneMaxChromosome
+from one_max_ga.chromosome import OneMaxChromosome, PackedOneMaxChromosome
 from one_max_ga.population import Population
 
 
@@ -65,6 +66,13 @@ def test_slice_first_three(population):
     assert pop_first_three.chromosomes[0].genes == population.chromosomes[0].genes
 
 
+def test_list_index(population):
+    population.scores = list(range(10))
+    pop_selected = population[[4, 1, 4]]
+    assert pop_selected.chromosomes == [population.chromosomes[i] for i in [4, 1, 4]]
+    assert pop_selected.scores == [4, 1, 4]
+
+
 @pytest.mark.parametrize("k", [0, 3, 5, 7, 9])
 def test_random_returns_list_of_correct_size(k):
     # create with k+1 to ensure there are always enough chromosomes
@@ -94,3 +102,111 @@ def test_best_method_returns_fittest_member():
     assert population.best() == best
     assert population.best().genes == [1, 1, 1]
     assert population.best().fitness() == 3
+
+
+def test_population_init_with_packed_chromosomes():
+    population = Population(10, 5, chromosome_cls=PackedOneMaxChromosome)
+    for chromosome in population.chromosomes:
+        assert isinstance(chromosome, PackedOneMaxChromosome)
+        assert len(chromosome) == 5
+
+
+def test_from_chromosomes_does_not_generate_chromosomes(mocker):
+    chromosomes = [OneMaxChromosome(5) for _ in range(10)]
+
+    mock_init = mocker.patch.object(OneMaxChromosome, "__init__")
+    pop = Population.from_chromosomes(chromosomes)
+
+    mock_init.assert_not_called()
+    assert pop.chromosomes is chromosomes
+
+
+def test_slice_shares_chromosomes(population):
+    pop_slice = population[:3]
+    for original, sliced in zip(population.chromosomes, pop_slice.chromosomes):
+        assert original is sliced
+
+
+@pytest.mark.parametrize("n", [1, 3, 7, 10])
+def test_fittest_returns_top_n_in_order(population, n):
+    fittest = population.fittest(n)
+    expected = sorted((c.fitness() for c in population.chromosomes), reverse=True)
+
+    assert len(fittest) == n
+    assert [c.fitness() for c in fittest.chromosomes] == expected[:n]
+
+
+def test_fittest_more_than_pop_size_raises_error(population):
+    with pytest.raises(ValueError):
+        population.fittest(len(population) + 1)
+
+
+def test_replace_least_fit_swaps_in_migrants():
+    population = Population.from_chromosomes(
+        [OneMaxChromosome(genes=[int(b) for b in f"{i:03b}"]) for i in [7, 0, 3, 1]]
+    )
+    migrants = Population.from_chromosomes([OneMaxChromosome(genes=[1, 1, 0])] * 2)
+
+    population.replace_least_fit(migrants)
+
+    assert [c.fitness() for c in population.chromosomes] == [3, 2, 2, 2]
+
+
+def test_replace_least_fit_keeps_scores_in_step():
+    population = Population(4, 5)
+    population.scores = [0.5, 0.1, 0.9, 0.2]
+    migrants = Population(2, 5)
+
+    with pytest.raises(ValueError):
+        population.replace_least_fit(migrants)
+    population.replace_least_fit(migrants, scores=[0.7, 0.8])
+
+    assert population.scores == [0.5, 0.7, 0.9, 0.8]
+    assert population.chromosomes[1] is migrants.chromosomes[0]
+
+
+def test_best_does_not_sort(mocker):
+    population = Population(10, 5)
+    mock_sorted = mocker.patch("builtins.sorted")
+
+    best = population.best()
+
+    mock_sorted.assert_not_called()
+    assert best.fitness() == max(c.fitness() for c in population.chromosomes)
+
+
+@pytest.mark.parametrize("chromosome_cls", [OneMaxChromosome, PackedOneMaxChromosome])
+def test_bytes_round_trip(chromosome_cls):
+    population = Population(10, 13, chromosome_cls=chromosome_cls)
+
+    data = population.to_bytes()
+    restored = Population.from_bytes(data, 13, chromosome_cls=chromosome_cls)
+
+    # 13 genes pack into 2 bytes per chromosome
+    assert len(data) == 10 * 2
+    assert [list(c.genes) for c in restored.chromosomes] == [
+        list(c.genes) for c in population.chromosomes
+    ]
+    assert restored.fitness() == population.fitness()
+
+
+def test_from_bytes_with_partial_row_raises_error():
+    with pytest.raises(ValueError):
+        Population.from_bytes(b"\x00\x00\x00", 13)
+
+
+def test_population_draws_from_given_rng():
+    def sample(seed):
+        population = Population(10, 20, rng=random.Random(seed))
+        return [c.genes for c in population.random(k=3)]
+
+    assert sample(1) == sample(1)
+    assert sample(1) != sample(2)
+
+
+def test_derived_populations_share_rng():
+    rng = random.Random(0)
+    population = Population(10, 5, rng=rng)
+
+    assert population[:3].rng is rng
+    assert population.fittest(3).rng is rng
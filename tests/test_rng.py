@@ -0,0 +1,31 @@
+import random
+
+import pytest
+from one_max_ga.rng import make_rng, numpy_rng, spawn
+
+
+def test_make_rng_seeds_a_new_stream():
+    assert make_rng(1).random() == random.Random(1).random()
+    assert make_rng(1) is not make_rng(1)
+
+
+def test_make_rng_returns_given_rng():
+    rng = random.Random(0)
+    assert make_rng(rng) is rng
+
+
+def test_spawned_streams_are_reproducible_and_distinct():
+    first = [s.getrandbits(64) for s in spawn(random.Random(0), 4)]
+    second = [s.getrandbits(64) for s in spawn(random.Random(0), 4)]
+
+    assert first == second
+    assert len(set(first)) == 4
+
+
+def test_numpy_rng_is_seeded_from_rng():
+    pytest.importorskip("numpy")
+
+    a = numpy_rng(random.Random(0)).integers(0, 2**32, size=4)
+    b = numpy_rng(random.Random(0)).integers(0, 2**32, size=4)
+
+    assert (a == b).all()
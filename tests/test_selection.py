@@ -0,0 +1,137 @@
+import random
+from collections import Counter
+
+import pytest
+from one_max_ga.algorithm import GeneticAlgorithm
+from one_max_ga.selection import (
+    RouletteSelector,
+    StochasticUniversalSelector,
+    TournamentSelector,
+    TruncationSelector,
+)
+
+FITNESS = [0, 3, 1, 0, 4, 2, 0, 5, 1, 4]
+
+SELECTORS = [
+    TruncationSelector(0.3),
+    TournamentSelector(3),
+    RouletteSelector(),
+    StochasticUniversalSelector(),
+]
+
+
+@pytest.mark.parametrize("selector", SELECTORS)
+def test_select_returns_n_positions(selector):
+    positions = selector.select(FITNESS, 11, random.Random(0))
+
+    assert len(positions) == 11
+    assert all(0 <= i < len(FITNESS) for i in positions)
+
+
+@pytest.mark.parametrize("selector", SELECTORS)
+def test_select_array_returns_n_positions(selector):
+    np = pytest.importorskip("numpy")
+
+    positions = selector.select_array(np.array(FITNESS), 11, np.random.default_rng(0))
+
+    assert positions.shape == (11,)
+    assert ((0 <= positions) & (positions < len(FITNESS))).all()
+
+
+def test_truncation_draws_distinct_pairs_from_the_fittest():
+    positions = TruncationSelector(0.3).select(FITNESS, 200, random.Random(1))
+
+    # the three fittest members
+    assert set(positions) == {4, 7, 9}
+    assert all(a != b for a, b in zip(positions[0::2], positions[1::2]))
+
+
+def test_truncation_keeps_at_least_two_members():
+    assert TruncationSelector(0).pool_size(10) == 2
+    assert TruncationSelector(1).pool_size(10) == 10
+
+
+def test_tournament_picks_fittest_entrant(mocker):
+    rng = random.Random(0)
+    mocker.patch.object(rng, "choices", return_value=[0, 1, 2, 3, 4, 5])
+
+    assert TournamentSelector(3).select(FITNESS, 2, rng) == [1, 4]
+
+
+@pytest.mark.parametrize(
+    "selector", [RouletteSelector(), StochasticUniversalSelector()]
+)
+def test_proportional_selection_never_draws_zero_fitness(selector):
+    positions = selector.select(FITNESS, 500, random.Random(2))
+
+    assert not {0, 3, 6} & set(positions)
+
+
+def test_stochastic_universal_draws_within_one_of_expected_count():
+    n = 100
+    counts = Counter(StochasticUniversalSelector().select(FITNESS, n, random.Random(3)))
+    total = sum(FITNESS)
+
+    for i, fitness in enumerate(FITNESS):
+        assert abs(counts[i] - n * fitness / total) < 1
+
+
+@pytest.mark.parametrize(
+    "selector", [RouletteSelector(), StochasticUniversalSelector()]
+)
+def test_proportional_selection_of_all_zero_fitness_is_uniform(selector):
+    positions = selector.select([0] * 5, 50, random.Random(4))
+
+    assert len(positions) == 50
+
+
+@pytest.mark.parametrize(
+    "selector", [RouletteSelector(), StochasticUniversalSelector()]
+)
+def test_proportional_selection_of_negative_fitness_raises_value_error(selector):
+    with pytest.raises(ValueError):
+        selector.select([1, -1, 2], 4, random.Random(0))
+
+
+def test_invalid_tournament_size_raises_value_error():
+    with pytest.raises(ValueError):
+        TournamentSelector(0)
+
+
+@pytest.mark.parametrize("backend", ["list", "packed", "numpy", "mmap"])
+@pytest.mark.parametrize("selector", SELECTORS)
+def test_ga_runs_with_selector(backend, selector):
+    if backend in ["numpy", "mmap"]:
+        pytest.importorskip("numpy")
+
+    ga = GeneticAlgorithm(
+        30,
+        20,
+        0.7,
+        0.01,
+        max_generations=30,
+        backend=backend,
+        rng=5,
+        selection=selector,
+    )
+    result = ga.run()
+
+    assert len(ga.population) == 30
+    assert result.history[-1].mean_fitness > result.history[0].mean_fitness
+
+
+@pytest.mark.parametrize("selector", SELECTORS)
+def test_steady_state_runs_with_selector(selector):
+    ga = GeneticAlgorithm(
+        30,
+        20,
+        0.7,
+        0.01,
+        max_generations=30,
+        rng=6,
+        replacement="steady_state",
+        selection=selector,
+    )
+    ga.run()
+
+    assert ga.population.fitness() == sorted(ga.population.fitness())
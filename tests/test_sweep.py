@@ -0,0 +1,149 @@
+import json
+
+import pytest
+from one_max_ga.sweep import ParameterSweep, SweepResult, format_table, summarise
+
+
+GA_KWARGS = dict(pop_size=20, chromosome_length=12, max_generations=15)
+GRID = {"crossover_rate": [0.5, 0.9], "mutation_rate": [0.01, 0.05]}
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(grid={}),
+        dict(grid={"mutation_rate": []}),
+        dict(grid=GRID, repeats=0),
+        dict(grid=GRID, crossover_rate=0.5),
+        dict(grid={**GRID, "selection_rate": [2]}),
+    ],
+)
+def test_invalid_arguments_raise_value_error(kwargs):
+    with pytest.raises(ValueError):
+        ParameterSweep(**{**dict(grid=GRID), **kwargs}, **GA_KWARGS)
+
+
+def test_combinations_cover_the_grid():
+    sweep = ParameterSweep(GRID, **GA_KWARGS)
+
+    assert sweep.combinations() == [
+        {"crossover_rate": 0.5, "mutation_rate": 0.01},
+        {"crossover_rate": 0.5, "mutation_rate": 0.05},
+        {"crossover_rate": 0.9, "mutation_rate": 0.01},
+        {"crossover_rate": 0.9, "mutation_rate": 0.05},
+    ]
+
+
+def test_run_seeds_are_distinct_and_independent_of_grid_order():
+    sweep = ParameterSweep(GRID, repeats=2, **GA_KWARGS)
+    seeds = {
+        sweep.run_seed(params, repeat)
+        for params in sweep.combinations()
+        for repeat in range(2)
+    }
+    reordered = ParameterSweep(
+        {"mutation_rate": [0.05, 0.01], "crossover_rate": [0.9]}, **GA_KWARGS
+    )
+
+    assert len(seeds) == 8
+    assert reordered.run_seed(
+        {"mutation_rate": 0.01, "crossover_rate": 0.9}, 1
+    ) == sweep.run_seed({"crossover_rate": 0.9, "mutation_rate": 0.01}, 1)
+
+
+def test_run_returns_every_run_in_grid_order():
+    results = ParameterSweep(GRID, repeats=2, workers=2, **GA_KWARGS).run()
+
+    assert len(results) == 8
+    assert [(r.params, r.repeat) for r in results[:2]] == [
+        ({"crossover_rate": 0.5, "mutation_rate": 0.01}, 0),
+        ({"crossover_rate": 0.5, "mutation_rate": 0.01}, 1),
+    ]
+    for result in results:
+        assert result.best_fitness <= 12
+        assert result.evaluations == (result.generations + 1) * 20
+        if result.generations_to_optimum is not None:
+            assert result.best_fitness == 12
+
+
+def test_runs_are_reproducible():
+    first = ParameterSweep(GRID, workers=2, **GA_KWARGS).run()
+    second = ParameterSweep(GRID, workers=1, **GA_KWARGS).run()
+
+    assert [r.best_fitness for r in first] == [r.best_fitness for r in second]
+    assert [r.generations_to_optimum for r in first] == [
+        r.generations_to_optimum for r in second
+    ]
+
+
+def test_sweep_resumes_from_results_file(tmp_path, mocker):
+    path = tmp_path / "sweep.jsonl"
+    sweep = ParameterSweep(GRID, workers=2, results_path=path, **GA_KWARGS)
+    results = sweep.run()
+
+    # keep two runs and a line cut short by an interruption
+    lines = path.read_text().splitlines()
+    path.write_text("\n".join(lines[:2]) + "\n" + lines[2][:10])
+
+    resumed = ParameterSweep(GRID, workers=2, results_path=path, **GA_KWARGS)
+    run_seed = mocker.spy(resumed, "run_seed")
+    again = resumed.run()
+
+    assert run_seed.call_count == 2
+    assert [r.best_fitness for r in again] == [r.best_fitness for r in results]
+    assert len(resumed.load_results()) == 4
+
+
+def test_summarise_aggregates_repeats():
+    def result(best, optimum, elapsed):
+        return SweepResult(
+            params={"mutation_rate": 0.01},
+            repeat=0,
+            seed=0,
+            best_fitness=best,
+            generations_to_optimum=optimum,
+            generations=10,
+            evaluations=100,
+            elapsed=elapsed,
+            reason="",
+            evaluations_to_optimum=None if optimum is None else optimum * 10,
+        )
+
+    rows = summarise([result(10, 4, 1.0), result(8, None, 3.0)])
+
+    assert rows == [
+        {
+            "mutation_rate": 0.01,
+            "runs": 2,
+            "mean_best_fitness": 9,
+            "max_best_fitness": 10,
+            "success_rate": 0.5,
+            "mean_generations_to_optimum": 4,
+            "mean_evaluations_to_optimum": 40,
+            "mean_elapsed": 2.0,
+        }
+    ]
+
+
+def test_format_table_aligns_columns():
+    table = format_table(
+        [{"name": "a", "value": 0.123456}, {"name": "long", "value": None}]
+    )
+
+    assert table.splitlines() == [
+        "name  value ",
+        "----  ------",
+        "a     0.1235",
+        "long  -     ",
+    ]
+    assert format_table([]) == ""
+
+
+def test_results_file_holds_one_json_run_per_line(tmp_path):
+    path = tmp_path / "sweep.jsonl"
+    ParameterSweep(
+        {"mutation_rate": [0.01]}, results_path=path, crossover_rate=0.5, **GA_KWARGS
+    ).run()
+
+    (line,) = path.read_text().splitlines()
+    assert json.loads(line)["params"] == {"mutation_rate": 0.01}